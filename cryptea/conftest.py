@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures
+"""
+import pytest
+
+
+@pytest.fixture
+def make_binary(tmp_path):
+    """Return a factory writing ``content`` (a stub ELF header by default) to a sample file."""
+
+    def make(content=b"\x7fELF" + b"\0" * 60):
+        path = tmp_path / "sample.bin"
+        path.write_bytes(content)
+        return path
+
+    return make
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import bisect
+import codecs
 import inspect
 import json
+import os
+import queue
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypedDict, TypeVar, Union
 import threading
 
 import gi  # type: ignore[import]
@@ -16,6 +23,12 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Adw, Gio, GLib, Gtk, Gdk, Pango, GObject  # type: ignore[import]
 
+try:  # Optional: GtkSourceView keeps an incremental match index for searches
+    gi.require_version("GtkSource", "5")
+    from gi.repository import GtkSource  # type: ignore[import]
+except (ImportError, ValueError):  # pragma: no cover - exercised when GtkSourceView missing
+    GtkSource = None  # type: ignore[assignment]
+
 from . import config
 from .data_paths import log_dir
 from .dev_seed import seed_if_requested
@@ -27,12 +40,25 @@ from .manager.export_import import ExportImportManager
 from .manager.templates import ChallengeTemplate
 from .manager.attachments import AttachmentManager
 from .modules import ModuleRegistry
+from .modules.base import CancelToken, OfflineTool
+from .modules.forensics.memory_analyzer import MemoryAnalyzerArgs
+from .modules.media import ExifMetadataTool, ImageStegoTool, VideoFrameExporterTool
+from .modules.media.exif_metadata import shutdown_exiftool_sessions
+from .modules.media.video_frame_exporter import EXPORT_TIMEOUT, FrameExportPlan
+from .modules.network.nmap import PROFILE_CHOICES, is_nmap_available, network_consent_enabled, set_network_consent
+from .modules.reverse.disassembler import DisassemblerLauncher, LaunchPlan
+from .modules.reverse.exe_decompiler import FUNCTION_RE, ExeDecompiler
 from .modules.reverse.quick_disassembler import QuickDisassembler
+from .modules.web.discovery import available_wordlists, ensure_wordlist
+from .modules.web.file_upload import DEFAULT_PAYLOAD, VARIANTS_ITEMS
+from .modules.web.sqli_tester import PAYLOAD_PRESETS
+from .modules.web.xss_tester import PAYLOAD_SETS
 from .notes import MarkdownRenderer, NoteManager
 from .offline_guard import OfflineGuard, OfflineViolation
 from .ui.cheatsheet_panel import CheatSheetPanel
 from .resources import Resources
 from .ui.filter_bar import FilterBar
+from .ui.text_search import match_offsets
 from .widgets.attachment_viewer import AttachmentViewer
 from .process_manager import get_process_manager
 from .module_loader import get_module_loader
@@ -40,6 +66,102 @@ from .performance_monitor import get_performance_monitor
 
 _LOG = configure_logging()
 
+_ToolT = TypeVar("_ToolT")
+
+# Result views stop layout work past this many characters; Copy still returns the full body.
+RESULT_DISPLAY_LIMIT = 256 * 1024
+# Line-oriented views (strings, disassembler, streamed tool output) keep only the newest lines instead.
+RESULT_MAX_LINES = 50_000
+UI_DRAIN_BATCH = 64
+# Streamed tool output is collected off the main loop and flushed about once a frame.
+STREAM_FLUSH_MS = 16
+# Past this many unflushed characters a streaming worker stops reading the
+# tool's pipe, so a tool outrunning the view blocks on write instead.
+STREAM_HIGH_WATER = 4 * 1024 * 1024
+# Bodies at least this long are loaded with the view detached from its buffer.
+BULK_TEXT_THRESHOLD = 64 * 1024
+
+DISASSEMBLER_TOOL_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto (first available)"),
+    ("ghidra", "Ghidra"),
+    ("ghidra-headless", "Ghidra (headless)"),
+    ("ida", "IDA Pro"),
+    ("binaryninja", "Binary Ninja"),
+    ("hopper", "Hopper"),
+    ("cutter", "Cutter"),
+    ("rizin", "rizin"),
+    ("radare2", "radare2"),
+)
+DISASSEMBLER_MODE_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("gui", "GUI"),
+    ("cli", "CLI"),
+    ("headless", "Headless"),
+)
+PREVIEW_BACKEND_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("objdump", "objdump"),
+    ("radare2", "radare2"),
+    ("rizin", "rizin"),
+)
+PREVIEW_SYNTAX_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("intel", "Intel"),
+    ("att", "AT&T"),
+)
+RIZIN_TOOL_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("rizin", "rizin"),
+    ("radare2", "radare2"),
+)
+
+ROP_TOOL_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("ropgadget", "ROPgadget"),
+    ("ropper", "ropper"),
+    ("rizin", "rizin"),
+)
+
+ROP_ARCH_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("x86", "x86 (32-bit)"),
+    ("x86_64", "x86_64"),
+    ("arm", "ARM 32"),
+    ("arm64", "ARM64 / AArch64"),
+    ("mips", "MIPS"),
+    ("riscv64", "RISC-V 64"),
+)
+
+BINDIFF_TOOL_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("auto", "Auto"),
+    ("radiff2", "radiff2"),
+    ("cmp", "cmp"),
+    ("hash", "Hash summary"),
+)
+
+EXE_ENGINE_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("ghidra", "Ghidra (Best Quality)"),
+    ("rizin", "Rizin/r2dec (Fast)"),
+    ("objdump", "objdump (Basic Disassembly)"),
+)
+
+# PE/ELF inspector sections: (run() keyword, label, on by default), in two rows.
+BINARY_INSPECT_CHECKS: Tuple[Tuple[Tuple[str, str, bool], ...], ...] = (
+    (
+        ("include_file", "File metadata", True),
+        ("include_headers", "Headers", True),
+        ("include_sections", "Sections", True),
+        ("include_segments", "Segments", False),
+    ),
+    (
+        ("include_symbols", "Symbols", True),
+        ("include_dynamic", "Dynamic entries", False),
+        ("include_checksec", "Security flags", True),
+        ("include_libraries", "Libraries", False),
+        ("include_strings", "Strings", False),
+    ),
+)
+
 
 CATEGORY_COLORS: Dict[str, str] = {
     "crypto": "purple",
@@ -139,6 +261,56 @@ def _truncate(text: str, limit: int) -> str:
     return text[: limit - 1].rstrip() + "…"
 
 
+def _tail_lines(text: str, count: int) -> str:
+    """Return the last ``count`` lines of ``text``."""
+    cut = len(text)
+    for _ in range(count):
+        cut = text.rfind("\n", 0, cut)
+        if cut < 0:
+            return text
+    return text[cut + 1 :]
+
+
+def _run_tool_worker(
+    tool: Any,
+    kwargs: Dict[str, Any],
+    on_chunk: Callable[[str], None],
+    on_done: Callable[[Optional[str]], None],
+) -> None:
+    """Feed ``tool.run_stream(**kwargs)`` to ``on_chunk``, then call ``on_done`` with an error message or None.
+
+    Meant for a worker thread: it reads no window state and touches no
+    widgets, leaving it to the callbacks to hand results to the main loop.
+    """
+    error: Optional[str] = None
+    try:
+        for chunk in tool.run_stream(**kwargs):
+            on_chunk(chunk)
+    except Exception as exc:
+        error = f"Error: {exc}"
+    finally:
+        on_done(error)
+
+
+def _error_message(exc: GLib.Error) -> str:
+    """``exc``'s message, or an empty string when it only reports a cancellation."""
+    if exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+        return ""
+    return exc.message
+
+
+def _option_dropdown(options: Tuple[Tuple[str, str], ...]) -> Gtk.DropDown:
+    """Build a DropDown over the labels of ``(id, label)`` pairs; the first is selected."""
+    return Gtk.DropDown(model=Gtk.StringList.new([label for _, label in options]))
+
+
+def _selected_option(dropdown: Gtk.DropDown, options: Tuple[Tuple[str, str], ...]) -> str:
+    index = dropdown.get_selected()
+    if 0 <= index < len(options):
+        return options[index][0]
+    return options[0][0]
+
+
 def _pill_label(text: str, color: str) -> Gtk.Label:
     label = Gtk.Label(label=text.title(), xalign=0)
     label.add_css_class("pill")
@@ -187,6 +359,117 @@ def _clear_grid(grid: Gtk.Grid) -> None:
         child = next_child
 
 
+@dataclass(frozen=True)
+class SpinOption:
+    """Integer spin button bound to ``MainWindow.<name>``."""
+
+    name: str
+    lower: int
+    upper: int
+    step: int
+    value: int
+    label: str
+    page: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class TextOption:
+    """Labelled entry bound to ``MainWindow.<name>``, optionally with a browse button."""
+
+    name: str
+    label: str
+    placeholder: str
+    secret: bool = False
+    browse: Optional[Callable[[Gtk.Button], None]] = None
+    label_width: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CheckOption:
+    """Check button bound to ``MainWindow.<name>``."""
+
+    name: str
+    label: str
+    active: bool = False
+
+
+@dataclass(frozen=True)
+class ComboOption:
+    """Labelled ComboBoxText bound to ``MainWindow.<name>``."""
+
+    name: str
+    label: str
+    items: Tuple[Tuple[str, str], ...]
+    active_id: str
+
+
+OptionSpec = Union[SpinOption, TextOption, CheckOption, ComboOption]
+
+
+@dataclass(frozen=True)
+class OptionGrid:
+    """Spin buttons laid out side by side in a Gtk.Grid, label then spin button per pair."""
+
+    options: Tuple[SpinOption, ...]
+
+
+@dataclass(slots=True)
+class DisassemblyPreview:
+    """Widgets of the quick-disassembly window, built once on first use.
+
+    With GtkSourceView the search runs through ``search_settings`` and
+    ``search_ctx``; otherwise matches are marked with ``highlight_tag``. The
+    remaining fields let a query that extends the previous one only re-check
+    the previous matches, and resume from ``last_match`` rather than the top.
+    """
+
+    window: Adw.ApplicationWindow
+    view: Gtk.TextView
+    search: Gtk.SearchEntry
+    status_label: Gtk.Label
+    copy_btn: Gtk.Button
+    highlight_tag: Optional[Gtk.TextTag] = None
+    search_settings: Any = None
+    search_ctx: Any = None
+    haystack: Optional[str] = None
+    fold_case: bool = True
+    last_query: str = ""
+    match_offsets: List[int] = field(default_factory=list)
+    last_match: Optional[Gtk.TextMark] = None
+
+    def reset_search(self) -> None:
+        self.haystack = None
+        self.last_query = ""
+        self.match_offsets = []
+        if self.last_match is not None:
+            buffer = self.view.get_buffer()
+            buffer.move_mark(self.last_match, buffer.get_start_iter())
+
+
+@dataclass(frozen=True)
+class ToolDetailSpec:
+    """Declarative description of a file-driven tool detail page.
+
+    ``options`` entries are either a single option (placed on its own row), a
+    tuple of options that share one horizontal row, or an :class:`OptionGrid`
+    whose columns line up. Widgets are published on the
+    window as ``<prefix>_run_btn``, ``<prefix>_copy_btn`` and
+    ``<prefix>_result_view`` so the ``_on_*`` handlers can keep using them.
+    """
+
+    prefix: str
+    title: str
+    file_label: str
+    file_attr: str
+    file_placeholder: str
+    browse: Tuple[Tuple[str, Callable[[Gtk.Button], None]], ...]
+    options: Tuple[Union[OptionSpec, OptionGrid, Tuple[OptionSpec, ...]], ...]
+    run_label: str
+    on_run: Callable[[Gtk.Button], None]
+    on_copy: Callable[[Gtk.Button], None]
+    options_label: str = "Analysis Options"
+
+
 class ChallengeCard(Gtk.Button):
     """Compact card used on the challenges grid."""
 
@@ -292,6 +575,8 @@ class MainWindow:
         self.window.set_title("Cryptea")
         self.window.set_default_size(1280, 820)
         self.window.connect("close-request", self._on_close_request)
+        self._clipboard: Optional[Gdk.Clipboard] = None
+        self.window.connect("realize", self._cache_clipboard)
         
         # Set window icon
         self._set_window_icon()
@@ -312,6 +597,31 @@ class MainWindow:
         self.notes_preview = None
         self.tool_output_view = None
         self.status_label = None
+        self._full_results: Dict[Gtk.TextView, str] = {}
+        self._result_providers: Dict[Gtk.TextView, Gdk.ContentProvider] = {}
+        # Streamed results are kept as chunk lists and joined on first read.
+        self._result_chunks: Dict[Gtk.TextView, List[str]] = {}
+        # Only one tool detail page is visible at a time, so the input-path
+        # entry of the open page borrows this buffer; see _bind_path_buffer.
+        self._path_buffer = Gtk.EntryBuffer()
+        self._path_entry: Optional[Gtk.Entry] = None
+        self._zsteg_proc: Optional[Gio.Subprocess] = None
+        self._zsteg_timeout_id = 0
+        self._tool_executor = app.tool_executor
+        self._tool_cancellable: Optional[Gio.Cancellable] = None
+        # Cancel button -> token of the streamed run it can stop.
+        self._stream_cancels: Dict[Gtk.Button, CancelToken] = {}
+        # Tools with a worker still running; a second click is ignored until it finishes.
+        self._runs_inflight: Set[str] = set()
+        self._lazy_panes: Dict[str, Tuple[Gtk.Box, Callable[[Gtk.Box], None]]] = {}
+        self._tool_shell_ui: Optional[str] = None
+        self._file_dialogs: Dict[Gtk.FileChooserAction, Gtk.FileChooserNative] = {}
+        self._active_tool: Optional[OfflineTool] = None
+        # Worker threads hand UI work to the main loop through this queue; at
+        # most one idle callback is pending to drain it, however busy they are.
+        self._ui_queue: "deque[Tuple[Callable[..., Any], Tuple[Any, ...]]]" = deque()
+        self._ui_lock = threading.Lock()
+        self._ui_drain_scheduled = False
 
         root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.toast_overlay.set_child(root)
@@ -323,12 +633,8 @@ class MainWindow:
         self._setup_window_actions()  # Setup window-specific actions
 
         self.quick_disassembler = QuickDisassembler()
-        self.disassembly_preview_window: Optional[Adw.ApplicationWindow] = None
-        self.disassembly_preview_view: Optional[Gtk.TextView] = None
-        self.disassembly_preview_search: Optional[Gtk.SearchEntry] = None
-        self.disassembly_preview_status_label: Optional[Gtk.Label] = None
-        self.disassembly_preview_copy_btn: Optional[Gtk.Button] = None
-        self._disassembly_preview_highlight_tag = None
+        self._disassembly_preview: Optional[DisassemblyPreview] = None
+        self._preview_search_source_id = 0
 
         self.refresh_sidebar()
         self.refresh_main_content()
@@ -389,6 +695,10 @@ class MainWindow:
         export_item.set_attribute_value("icon", GLib.Variant.new_string("document-save-symbolic"))
         menu.append_item(export_item)
 
+        cache_item = Gio.MenuItem.new("Clear Inspector Cache", "app.clear_inspector_cache")
+        cache_item.set_attribute_value("icon", GLib.Variant.new_string("edit-clear-all-symbolic"))
+        menu.append_item(cache_item)
+
         prefs_item = Gio.MenuItem.new("Preferences", "app.settings")
         prefs_item.set_attribute_value("icon", GLib.Variant.new_string("emblem-system-symbolic"))
         menu.append_item(prefs_item)
@@ -641,30 +951,12 @@ class MainWindow:
         self._build_timeline_builder_detail(timeline_box)
         self.tool_detail_stack.add_named(timeline_box, "timeline_builder")
 
-        # Image Stego Toolkit page
-        image_stego_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_image_stego_detail(image_stego_box)
-        self.tool_detail_stack.add_named(image_stego_box, "image_stego")
-
-        # EXIF Metadata Viewer page
-        exif_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_exif_metadata_detail(exif_box)
-        self.tool_detail_stack.add_named(exif_box, "exif_metadata")
-
-        # Audio Analyzer page
-        audio_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_audio_analyzer_detail(audio_box)
-        self.tool_detail_stack.add_named(audio_box, "audio_analyzer")
-
-        # Video Frame Exporter page
-        video_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_video_exporter_detail(video_box)
-        self.tool_detail_stack.add_named(video_box, "video_frame_exporter")
-
-        # QR/Barcode Scanner page
-        qr_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_qr_scanner_detail(qr_box)
-        self.tool_detail_stack.add_named(qr_box, "qr_scanner")
+        # Stego & media pages are built on first open, or while idle
+        self._register_lazy_pane("image_stego", self._build_image_stego_detail)
+        self._register_lazy_pane("exif_metadata", self._build_exif_metadata_detail)
+        self._register_lazy_pane("audio_analyzer", self._build_audio_analyzer_detail)
+        self._register_lazy_pane("video_frame_exporter", self._build_video_exporter_detail)
+        self._register_lazy_pane("qr_scanner", self._build_qr_scanner_detail)
 
         # Strings Extractor page
         strings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
@@ -676,38 +968,19 @@ class MainWindow:
         self._build_disassembler_detail(disassembler_box)
         self.tool_detail_stack.add_named(disassembler_box, "disassembler")
 
-        # Rizin Console page
-        rizin_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_rizin_console_detail(rizin_box)
-        self.tool_detail_stack.add_named(rizin_box, "rizin_console")
-
-        # GDB Runner page
-        gdb_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_gdb_runner_detail(gdb_box)
-        self.tool_detail_stack.add_named(gdb_box, "gdb_runner")
-
-        # ROP Gadget Finder page
-        rop_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_rop_gadget_detail(rop_box)
-        self.tool_detail_stack.add_named(rop_box, "rop_gadget")
-
-        # Binary Diff page
-        bindiff_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_binary_diff_detail(bindiff_box)
-        self.tool_detail_stack.add_named(bindiff_box, "binary_diff")
-
-        # Binary Inspector page
-        inspector_reverse_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_binary_inspector_detail(inspector_reverse_box)
+        # Reverse-engineering pages are built on first open, or while idle
+        self._register_lazy_pane("rizin_console", self._build_rizin_console_detail)
+        self._register_lazy_pane("gdb_runner", self._build_gdb_runner_detail)
+        self._register_lazy_pane("rop_gadget", self._build_rop_gadget_detail)
+        self._register_lazy_pane("binary_diff", self._build_binary_diff_detail)
+        self._register_lazy_pane("binary_inspector", self._build_binary_inspector_detail)
 
-        # EXE Decompiler page
-        exe_decompiler_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_exe_decompiler_detail(exe_decompiler_box)
+        self._register_lazy_pane("exe_decompiler", self._build_exe_decompiler_detail)
 
         # Wordlist Generator page
         wordlist_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
         self._build_wordlist_generator_detail(wordlist_box)
-
+        self.tool_detail_stack.add_named(wordlist_box, "wordlist")
 
         # Nmap page
         nmap_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
@@ -734,15 +1007,32 @@ class MainWindow:
         self._build_xss_tester_detail(xss_box)
         self.tool_detail_stack.add_named(xss_box, "xss_tester")
 
-        # JWT Tool page
-        jwt_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_jwt_tool_detail(jwt_box)
-        self.tool_detail_stack.add_named(jwt_box, "jwt_tool")
-
-        # File Upload Tester page
-        upload_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
-        self._build_file_upload_detail(upload_box)
-        self.tool_detail_stack.add_named(upload_box, "file_upload")
+        # JWT and upload pages are built on first open, or while idle
+        self._register_lazy_pane("jwt_tool", self._build_jwt_tool_detail)
+        self._register_lazy_pane("file_upload", self._build_file_upload_detail)
+
+        # Build the deferred pages between events once the window is up.
+        GLib.idle_add(self._build_next_pane, priority=GLib.PRIORITY_LOW)
+
+    def _register_lazy_pane(self, name: str, factory: Callable[[Gtk.Box], None]) -> None:
+        """Add an empty page for ``name`` whose widgets ``factory`` builds on first open."""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=16, margin_bottom=16, margin_start=16, margin_end=16)
+        self.tool_detail_stack.add_named(box, name)
+        self._lazy_panes[name] = (box, factory)
+
+    def _ensure_pane(self, name: str) -> None:
+        pending = self._lazy_panes.pop(name, None)
+        if pending is not None:
+            box, factory = pending
+            factory(box)
+
+    def _build_next_pane(self) -> bool:
+        """Build one still-unopened page per idle callback so first opens are instant."""
+        name = next(iter(self._lazy_panes), None)
+        if name is None:
+            return GLib.SOURCE_REMOVE
+        self._ensure_pane(name)
+        return GLib.SOURCE_CONTINUE if self._lazy_panes else GLib.SOURCE_REMOVE
 
     def _setup_responsive_sidebar(self) -> None:
         self._sidebar_collapse_width = 960
@@ -1016,7 +1306,7 @@ class MainWindow:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
             return
 
-        body = getattr(result, "body", str(result))
+        body = result.body
         self._set_tool_output(body)
         self.output_frame.set_visible(True)
 
@@ -1025,17 +1315,527 @@ class MainWindow:
         start, end = buffer.get_bounds()
         return buffer.get_text(start, end, True)
 
-    def _set_text_view_text(self, view: Gtk.TextView, text: str) -> None:
-        view.get_buffer().set_text(text)
+    def _entry_text(self, entry: Gtk.Entry) -> str:
+        """The stripped text of ``entry``, read once from its buffer."""
+        return entry.get_buffer().get_text().strip()
 
-    def _copy_text_view_to_clipboard(self, view: Gtk.TextView) -> None:
-        display = self.window.get_display()
-        if display is None:
+    def _set_text_view_text(self, view: Gtk.TextView, text: str | bytes) -> None:
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="replace")
+        # Tool output is almost always ASCII: str.isascii() is O(1) in CPython and
+        # the character count equals the UTF-8 byte count, so GTK can skip strlen().
+        length = len(text) if text.isascii() else -1
+        buffer = view.get_buffer()
+        if len(text) < BULK_TEXT_THRESHOLD:
+            buffer.set_text(text, length)
+            return
+        # Detach large loads so the view does not validate lines mid-insert.
+        view.set_buffer(None)
+        buffer.set_text(text, length)
+        view.set_buffer(buffer)
+
+    def _set_result_text(self, view: Gtk.TextView, body: str, max_lines: int = 0) -> bool:
+        """Show ``body`` in ``view``, truncated to RESULT_DISPLAY_LIMIT, keeping the full text for copy.
+
+        With ``max_lines`` only the last ``max_lines`` lines are shown instead.
+        """
+        self._full_results[view] = body
+        self._result_chunks.pop(view, None)
+        self._result_providers.pop(view, None)
+        if max_lines > 0:
+            body = _tail_lines(body, max_lines)
+        elif len(body) > RESULT_DISPLAY_LIMIT:
+            body = body[:RESULT_DISPLAY_LIMIT] + "\n… truncated; use Copy for the full result"
+        self._set_text_view_text(view, body)
+        return False
+
+    def _reset_result_text(self, view: Gtk.TextView, placeholder: str) -> None:
+        """Show ``placeholder`` in a fresh buffer instead of clearing the old one.
+
+        Clearing a buffer holding a large result walks every line on the GTK
+        thread; dropping it lets it be freed in one go.
+        """
+        self._forget_result(view)
+        buffer = Gtk.TextBuffer()
+        buffer.set_text(placeholder, -1)
+        # Streams delete just this span when they start, see _begin_result_stream.
+        buffer.create_mark("placeholder-end", buffer.get_end_iter(), True)
+        view.set_buffer(buffer)
+
+    def _clear_result_text(self, view: Gtk.TextView) -> None:
+        """Empty ``view`` and drop its stashed result, leaving an empty buffer untouched."""
+        buffer = view.get_buffer()
+        count = buffer.get_char_count()
+        if count >= BULK_TEXT_THRESHOLD:
+            self._reset_result_text(view, "")
+            return
+        self._forget_result(view)
+        if count:
+            buffer.delete(buffer.get_start_iter(), buffer.get_end_iter())
+
+    def _append_result_text(
+        self,
+        view: Gtk.TextView,
+        chunk: str,
+        copy_btn: Optional[Gtk.Button] = None,
+        max_lines: int = 0,
+    ) -> bool:
+        """Append ``chunk`` to the result shown in ``view`` as it streams in.
+
+        The stashed copy keeps everything; the buffer stops growing at
+        RESULT_DISPLAY_LIMIT like :meth:`_set_result_text`, or with
+        ``max_lines`` drops its oldest lines past that count.
+        """
+        chunks = self._result_chunks.get(view)
+        if chunks is None:
+            chunks = self._result_chunks[view] = [self._full_results.pop(view, "")]
+        chunks.append(chunk)
+        self._result_providers.pop(view, None)
+        buffer = view.get_buffer()
+        if max_lines > 0:
+            buffer.insert(buffer.get_end_iter(), chunk, len(chunk) if chunk.isascii() else -1)
+            overflow = buffer.get_line_count() - max_lines
+            if overflow > 0:
+                buffer.delete(buffer.get_start_iter(), buffer.get_iter_at_line(overflow)[1])
+        elif (remaining := RESULT_DISPLAY_LIMIT - buffer.get_char_count()) > 0:
+            visible = chunk
+            if len(chunk) > remaining:
+                visible = chunk[:remaining] + "\n… truncated; use Copy for the full result"
+            buffer.insert(buffer.get_end_iter(), visible, len(visible) if visible.isascii() else -1)
+        if copy_btn is not None and not chunk.isspace():
+            copy_btn.set_sensitive(True)
+        return False
+
+    def _begin_result_stream(self, view: Gtk.TextView, copy_btn: Gtk.Button) -> bool:
+        """Clear ``view`` for a streamed result; inserts until the end are not undoable."""
+        buffer = view.get_buffer()
+        placeholder = buffer.get_mark("placeholder-end")
+        if placeholder is not None:
+            self._forget_result(view)
+            buffer.delete(buffer.get_start_iter(), buffer.get_iter_at_mark(placeholder))
+            buffer.delete_mark(placeholder)
+        else:
+            self._clear_result_text(view)
+        copy_btn.set_sensitive(False)
+        buffer.begin_irreversible_action()
+        return False
+
+    def _end_result_stream(self, view: Gtk.TextView, copy_btn: Gtk.Button) -> bool:
+        view.get_buffer().end_irreversible_action()
+        body = self._stashed_result(view) or ""
+        copy_btn.set_sensitive(bool(body) and not body.isspace())
+        return False
+
+    def _stashed_result(self, view: Gtk.TextView) -> Optional[str]:
+        chunks = self._result_chunks.pop(view, None)
+        if chunks is not None:
+            self._full_results[view] = "".join(chunks)
+        return self._full_results.get(view)
+
+    def _result_text(self, view: Gtk.TextView) -> str:
+        body = self._stashed_result(view)
+        return body if body is not None else self._get_text_view_text(view)
+
+    def _run_tool_task(self, work: Callable[[], Dict[str, Any]], fallback: Optional[Dict[str, Any]] = None) -> None:
+        """Run ``work`` on GLib's thread pool and apply its updates on completion.
+
+        The completion callback is dispatched by the main context, so the
+        widgets are touched from the GTK thread without any ``idle_add``.
+        Should ``work`` raise, ``fallback`` is applied instead together with
+        the error, so the caller's run button is still re-enabled.
+        """
+        outcome: Dict[str, Any] = {}
+
+        def thread_func(task: Gio.Task, _source: Any, _data: Any, _cancellable: Any) -> None:
+            try:
+                outcome.update(work())
+            except Exception as exc:
+                _LOG.exception("Tool worker failed")
+                outcome.update(fallback or {})
+                outcome["error"] = f"Error: {exc}"
+            finally:
+                task.return_boolean(True)
+
+        def on_done(_source: Any, _result: Gio.AsyncResult, _data: Any = None) -> None:
+            self._ui_apply(outcome)
+
+        task = Gio.Task.new(self.window, None, on_done, None)
+        task.run_in_thread(thread_func)
+
+    def _run_tool_stream(
+        self,
+        tool: Any,
+        kwargs: Dict[str, Any],
+        view: Gtk.TextView,
+        copy_btn: Gtk.Button,
+        run_btn: Gtk.Button,
+        max_lines: int = 0,
+        cancel_btn: Optional[Gtk.Button] = None,
+        inflight: Optional[str] = None,
+    ) -> None:
+        """Append the chunks of ``tool.run_stream(**kwargs)`` to ``view`` as a worker produces them.
+
+        The worker only puts chunks on a SimpleQueue, with no GLib call per
+        chunk; a STREAM_FLUSH_MS timer on the main loop takes whatever has
+        arrived and inserts it in one go, so a tool printing thousands of lines
+        a second costs one buffer insert per frame. A None on the queue marks
+        the end: Copy and ``run_btn`` are enabled only after the last flush,
+        so a quick re-run cannot receive the old stream's tail. The worker
+        waits while more than STREAM_HIGH_WATER characters are queued.
+
+        With ``cancel_btn`` the tool also gets a CancelToken as ``cancel``,
+        which the button fires until the stream ends. ``inflight`` names the
+        caller's entry in ``_runs_inflight``, dropped once the stream ends.
+        """
+        token: Optional[CancelToken] = None
+        if cancel_btn is not None:
+            token = CancelToken()
+            kwargs = {**kwargs, "cancel": token}
+            self._stream_cancels[cancel_btn] = token
+            cancel_btn.set_sensitive(True)
+        chunks: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        drained = threading.Condition()
+        backlog = 0
+        finished: Dict[str, Any] = {"run_btn": run_btn, "inflight": inflight}
+
+        def flush() -> bool:
+            nonlocal backlog
+            batch: List[str] = []
+            done = False
+            while True:
+                try:
+                    chunk = chunks.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk is None:
+                    done = True
+                    break
+                batch.append(chunk)
+            if batch:
+                text = "".join(batch)
+                with drained:
+                    backlog -= len(text)
+                    drained.notify()
+                self._append_result_text(view, text, None, max_lines)
+            if not done:
+                return GLib.SOURCE_CONTINUE
+            if token is not None:
+                if token.cancelled:
+                    self._append_result_text(view, "\n(cancelled)", None, max_lines)
+                if self._stream_cancels.get(cancel_btn) is token:
+                    del self._stream_cancels[cancel_btn]
+                    cancel_btn.set_sensitive(False)
+            self._end_result_stream(view, copy_btn)
+            self._ui_apply(finished)
+            return GLib.SOURCE_REMOVE
+
+        def begin() -> None:
+            self._begin_result_stream(view, copy_btn)
+            GLib.timeout_add(STREAM_FLUSH_MS, flush)
+
+        def collect(chunk: str) -> None:
+            nonlocal backlog
+            chunks.put_nowait(chunk)
+            with drained:
+                backlog += len(chunk)
+                drained.wait_for(lambda: backlog <= STREAM_HIGH_WATER)
+
+        def worker() -> Dict[str, Any]:
+            def done(error: Optional[str]) -> None:
+                if error:
+                    finished["error"] = error
+                # The flush that takes this sentinel releases run_btn and inflight.
+                chunks.put_nowait(None)
+
+            self._post_ui(begin)
+            _run_tool_worker(tool, kwargs, collect, done)
+            return {}
+
+        self._run_tool_task(worker)
+
+    def _run_tool_async(
+        self,
+        argv: List[str],
+        on_done: Callable[[Optional[int], str, str], None],
+        cwd: Optional[str] = None,
+        timeout: int = 0,
+        on_timeout: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Run ``argv`` as a Gio.Subprocess and call ``on_done`` on the main loop.
+
+        ``on_done`` receives the exit code, stdout and stderr. The exit code is
+        None when the command could not start or hit ``timeout`` seconds;
+        stderr then explains why. A command killed for its timeout is reported
+        to ``on_timeout`` instead, with the same message, when that is given.
+        Leaving the tool page cancels the run through
+        ``self._tool_cancellable``; that reports None with an empty stderr,
+        which callers treat as nothing to show.
+        """
+        self._cancel_tool_subprocess()
+        launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE)
+        if cwd:
+            launcher.set_cwd(cwd)
+        try:
+            proc = launcher.spawnv(argv)
+        except GLib.Error as exc:
+            on_done(None, "", exc.message)
+            return
+
+        cancellable = Gio.Cancellable()
+        cancellable.connect("cancelled", lambda *_: proc.force_exit())
+        self._tool_cancellable = cancellable
+        state = {"timeout_id": 0, "timed_out": False}
+
+        def on_timeout() -> bool:
+            state["timeout_id"] = 0
+            state["timed_out"] = True
+            cancellable.cancel()
+            return False
+
+        if timeout:
+            state["timeout_id"] = GLib.timeout_add_seconds(timeout, on_timeout)
+
+        def on_communicated(source: Gio.Subprocess, result: Gio.AsyncResult) -> None:
+            if state["timeout_id"]:
+                GLib.source_remove(state["timeout_id"])
+            if self._tool_cancellable is cancellable:
+                self._tool_cancellable = None
+            try:
+                _ok, stdout, stderr = source.communicate_utf8_finish(result)
+            except GLib.Error as exc:
+                if state["timed_out"]:
+                    message = f"{Path(argv[0]).name} timed out after {timeout} seconds."
+                    if on_timeout is not None:
+                        on_timeout(message)
+                    else:
+                        on_done(None, "", message)
+                else:
+                    on_done(None, "", _error_message(exc))
+                return
+            code = source.get_exit_status() if source.get_if_exited() else -1
+            on_done(code, stdout or "", stderr or "")
+
+        proc.communicate_utf8_async(None, cancellable, on_communicated)
+
+    def _stream_tool_async(
+        self,
+        argv: List[str],
+        on_chunk: Callable[[str], None],
+        on_done: Callable[[Optional[int], str], None],
+        cwd: Optional[str] = None,
+    ) -> None:
+        """Run ``argv`` with stderr merged into stdout, handing output to ``on_chunk`` as it arrives.
+
+        Both callbacks run on the main loop. ``on_done`` receives the exit code,
+        or None plus an error message when the command could not start, and
+        None with an empty message when it was cancelled, like
+        :meth:`_run_tool_async`.
+        """
+        self._cancel_tool_subprocess()
+        launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_MERGE)
+        if cwd:
+            launcher.set_cwd(cwd)
+        try:
+            proc = launcher.spawnv(argv)
+        except GLib.Error as exc:
+            on_done(None, exc.message)
             return
+
+        cancellable = Gio.Cancellable()
+        cancellable.connect("cancelled", lambda *_: proc.force_exit())
+        self._tool_cancellable = cancellable
+        stream = proc.get_stdout_pipe()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        def finish(code: Optional[int], message: str) -> None:
+            if self._tool_cancellable is cancellable:
+                self._tool_cancellable = None
+            on_done(code, message)
+
+        def on_exited(source: Gio.Subprocess, result: Gio.AsyncResult) -> None:
+            try:
+                source.wait_finish(result)
+            except GLib.Error as exc:
+                finish(None, _error_message(exc))
+                return
+            finish(source.get_exit_status() if source.get_if_exited() else -1, "")
+
+        def on_read(source: Gio.InputStream, result: Gio.AsyncResult) -> None:
+            try:
+                data = source.read_bytes_finish(result)
+            except GLib.Error as exc:
+                finish(None, _error_message(exc))
+                return
+            if data.get_size() == 0:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    on_chunk(tail)
+                proc.wait_async(cancellable, on_exited)
+                return
+            text = decoder.decode(data.get_data())
+            if text:
+                on_chunk(text)
+            source.read_bytes_async(65536, GLib.PRIORITY_DEFAULT, cancellable, on_read)
+
+        stream.read_bytes_async(65536, GLib.PRIORITY_DEFAULT, cancellable, on_read)
+
+    def _on_stream_cancel(self, btn: Gtk.Button) -> None:
+        token = self._stream_cancels.get(btn)
+        if token is not None:
+            token.cancel()
+        btn.set_sensitive(False)
+
+    def _cancel_tool_subprocess(self) -> None:
+        cancellable = self._tool_cancellable
+        self._tool_cancellable = None
+        if cancellable is not None:
+            cancellable.cancel()
+
+    def _post_ui(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run ``fn(*args)`` on the main loop; safe to call from any thread."""
+        self._ui_queue.append((fn, args))
+        with self._ui_lock:
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        GLib.idle_add(self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> bool:
+        # Handle a bounded batch per callback so a chatty worker cannot starve
+        # input handling; the source stays installed while work remains.
+        pending = self._ui_queue
+        for _ in range(UI_DRAIN_BATCH):
+            try:
+                fn, args = pending.popleft()
+            except IndexError:
+                break
+            if fn == self._append_result_text:
+                args = self._coalesce_appends(args)
+            try:
+                fn(*args)
+            except Exception:
+                _LOG.exception("UI update %r failed", fn)
+        with self._ui_lock:
+            if not pending:
+                self._ui_drain_scheduled = False
+                return False
+        return True
+
+    def _coalesce_appends(self, args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Fold queued appends to the same view into ``args`` so they cost one insert."""
+        pending = self._ui_queue
+        view, chunk, *rest = args
+        parts = [chunk]
+        # Only this (main) thread pops, so a non-empty queue stays non-empty.
+        while pending:
+            next_fn, next_args = pending[0]
+            if next_fn != self._append_result_text or next_args[0] is not view or list(next_args[2:]) != rest:
+                break
+            pending.popleft()
+            parts.append(next_args[1])
+        if len(parts) == 1:
+            return args
+        return (view, "".join(parts), *rest)
+
+    def _ui_apply(self, updates: Dict[str, Any]) -> bool:
+        """Apply a worker's finished state in one main-loop callback.
+
+        Recognised keys: ``view``/``text`` (result body), ``max_lines`` (see
+        :meth:`_set_result_text`), ``copy_btn`` (enabled when the text is
+        non-blank), ``run_btn`` (re-enabled), ``inflight`` (dropped from
+        ``_runs_inflight``) and ``error`` (shown as a toast).
+        """
+        view = updates.get("view")
+        if view is not None:
+            text = updates.get("text", "")
+            self._set_result_text(view, text, updates.get("max_lines", 0))
+            copy_btn = updates.get("copy_btn")
+            if copy_btn is not None:
+                copy_btn.set_sensitive(bool(text) and not text.isspace())
+        error = updates.get("error")
+        if error:
+            self._show_error_toast(error)
+        inflight = updates.get("inflight")
+        if inflight is not None:
+            self._runs_inflight.discard(inflight)
+        run_btn = updates.get("run_btn")
+        if run_btn is not None:
+            run_btn.set_sensitive(True)
+        return False
+
+    def _forget_result(self, view: Gtk.TextView) -> None:
+        self._full_results.pop(view, None)
+        self._result_chunks.pop(view, None)
+        self._result_providers.pop(view, None)
+
+    def _cache_clipboard(self, _window: Gtk.Widget) -> None:
+        self._clipboard = self.window.get_clipboard()
+
+    def _copy_result_to_clipboard(self, view: Gtk.TextView) -> None:
+        """Copy the full result for ``view``, reusing one content provider per result."""
+        clipboard = self._clipboard or self.window.get_clipboard()
+        provider = self._result_providers.get(view)
+        if provider is None:
+            body = self._stashed_result(view)
+            if body is None:
+                self._copy_buffer_to_clipboard(view)
+                return
+            data = GLib.Bytes.new(body.encode("utf-8"))
+            provider = Gdk.ContentProvider.new_union(
+                [
+                    Gdk.ContentProvider.new_for_bytes("text/plain;charset=utf-8", data),
+                    Gdk.ContentProvider.new_for_bytes("text/plain", data),
+                ]
+            )
+            self._result_providers[view] = provider
+        clipboard.set_content(provider)
+
+    def _copy_buffer_to_clipboard(self, view: Gtk.TextView) -> None:
+        """Copy all of ``view``'s buffer through GtkTextBuffer, without a Python-side string.
+
+        The buffer's own selection is restored afterwards.
+        """
         buffer = view.get_buffer()
+        insert = buffer.get_iter_at_mark(buffer.get_insert())
+        bound = buffer.get_iter_at_mark(buffer.get_selection_bound())
         start, end = buffer.get_bounds()
-        text = buffer.get_text(start, end, True)
-        display.get_clipboard().set_text(text)
+        buffer.select_range(start, end)
+        buffer.copy_clipboard(self._clipboard or view.get_clipboard())
+        buffer.select_range(insert, bound)
+
+    def _spin_int(self, spin: Gtk.SpinButton) -> int:
+        return int(spin.get_adjustment().get_value())
+
+    def _active_tool_as(self, kind: Type[_ToolT]) -> _ToolT:
+        """Return ``_active_tool`` typed as ``kind``, the tool the current pane was opened for."""
+        tool = self._active_tool
+        if not isinstance(tool, kind):
+            raise TypeError(f"Expected {kind.__name__}, got {type(tool).__name__}")
+        return tool
+
+    def _read_widgets(self, *names: str) -> Dict[str, Any]:
+        """Snapshot several form widgets in one pass, keyed by attribute name.
+
+        Entries yield their text, spin buttons an ``int``, check buttons and
+        switches a ``bool`` and combo boxes their active id.
+        """
+        values: Dict[str, Any] = {}
+        for name in names:
+            widget = getattr(self, name)
+            if isinstance(widget, Gtk.SpinButton):
+                values[name] = self._spin_int(widget)
+            elif isinstance(widget, Gtk.Entry):
+                values[name] = widget.get_text()
+            elif isinstance(widget, (Gtk.CheckButton, Gtk.Switch)):
+                values[name] = widget.get_active()
+            elif isinstance(widget, Gtk.ComboBox):
+                values[name] = widget.get_active_id()
+            else:
+                raise TypeError(f"Unsupported widget for {name}: {type(widget).__name__}")
+        return values
+
+    def _copy_text_view_to_clipboard(self, view: Gtk.TextView) -> None:
+        self._copy_buffer_to_clipboard(view)
 
     # ------------------------------------------------------------------
     # Misc helpers
@@ -1048,6 +1848,48 @@ class MainWindow:
         toast = Adw.Toast.new(f"{feature} is not available yet")
         self.toast_overlay.add_toast(toast)
 
+    def _show_error_toast(self, message: str) -> bool:
+        """Add an error toast; safe to schedule from worker threads via GLib.idle_add."""
+        self.toast_overlay.add_toast(Adw.Toast.new(message))
+        return False
+
+    def _browse_into(
+        self, entry: Gtk.Entry, title: str, action: Gtk.FileChooserAction = Gtk.FileChooserAction.OPEN
+    ) -> None:
+        """Let the user pick a file (or folder, per ``action``) and put its path in ``entry``.
+
+        One native dialog per action is kept and reused, so the portal is only
+        set up once; it opens next to the path already in ``entry``.
+        """
+        dialog = self._file_dialogs.get(action)
+        if dialog is None:
+            dialog = Gtk.FileChooserNative.new(title, self.window, action, None, None)
+            dialog.set_modal(True)
+            self._file_dialogs[action] = dialog
+        else:
+            dialog.set_title(title)
+        current = entry.get_text().strip()
+        if current:
+            folder = Path(current).expanduser()
+            if not folder.is_dir():
+                folder = folder.parent
+            if folder.is_dir():
+                try:
+                    dialog.set_current_folder(Gio.File.new_for_path(str(folder)))
+                except GLib.Error:
+                    pass
+
+        def on_response(native: Gtk.NativeDialog, response: int) -> None:
+            native.disconnect(handler_id)
+            native.hide()
+            if response == Gtk.ResponseType.ACCEPT:
+                file = native.get_file()
+                if file:
+                    entry.set_text(file.get_path() or "")
+
+        handler_id = dialog.connect("response", on_response)
+        dialog.show()
+
     def _run_native_dialog(self, dialog: Gtk.NativeDialog) -> int:
         response_holder = {"value": Gtk.ResponseType.CANCEL}
         loop = GLib.MainLoop()
@@ -2272,7 +3114,7 @@ class MainWindow:
         dialog.destroy()
 
     def _on_hash_compute(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         buffer = self.hash_text_view.get_buffer()
         start, end = buffer.get_bounds()
@@ -2284,7 +3126,7 @@ class MainWindow:
             return
         try:
             result = self._active_tool.run(text=text, file=file_path, algorithm=algo)
-            self.hash_result_entry.set_text(getattr(result, "body", str(result)))
+            self.hash_result_entry.set_text(result.body)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
 
@@ -2914,7 +3756,7 @@ class MainWindow:
     
     def _on_hash_suite_identify_run(self, _btn) -> None:
         """Run hash identification."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         buffer = self.hash_suite_identify_input.get_buffer()
@@ -2928,14 +3770,14 @@ class MainWindow:
         
         try:
             result = self._active_tool.run(tab="identify", hash_input=hash_input, file_path=file_path)
-            result_text = getattr(result, "body", str(result))
-            self.hash_suite_identify_result.get_buffer().set_text(result_text)
+            result_text = result.body
+            self._set_text_view_text(self.hash_suite_identify_result, result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
     
     def _on_hash_suite_verify_run(self, _btn) -> None:
         """Run hash verification."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         hash_value = self.hash_suite_verify_hash.get_text().strip()
@@ -2953,7 +3795,7 @@ class MainWindow:
                 plaintext=plaintext,
                 algorithm=algorithm if algorithm != "auto" else None
             )
-            result_text = getattr(result, "body", str(result))
+            result_text = result.body
             self.hash_suite_verify_result.set_text(result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
@@ -2981,7 +3823,7 @@ class MainWindow:
     
     def _on_hash_suite_crack_run(self, _btn) -> None:
         """Run hash cracking."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         # Show legal warning on first use
@@ -3034,14 +3876,14 @@ class MainWindow:
         
         try:
             result = self._active_tool.run(**kwargs)
-            result_text = getattr(result, "body", str(result))
-            self.hash_suite_crack_result.get_buffer().set_text(result_text)
+            result_text = result.body
+            self._set_text_view_text(self.hash_suite_crack_result, result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
     
     def _on_hash_suite_format_run(self, _btn) -> None:
         """Run format conversion."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         input_hash = self.hash_suite_format_input.get_text().strip()
@@ -3059,7 +3901,7 @@ class MainWindow:
                 from_format=from_fmt,
                 to_format=to_fmt
             )
-            result_text = getattr(result, "body", str(result))
+            result_text = result.body
             self.hash_suite_format_output.set_text(result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
@@ -3085,7 +3927,7 @@ class MainWindow:
     
     def _on_hash_suite_generate_run(self, _btn) -> None:
         """Run hash generation."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         buffer = self.hash_suite_gen_input.get_buffer()
@@ -3112,7 +3954,7 @@ class MainWindow:
         
         try:
             result = self._active_tool.run(**kwargs)
-            result_text = getattr(result, "body", str(result))
+            result_text = result.body
             self.hash_suite_gen_output.set_text(result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
@@ -3126,7 +3968,7 @@ class MainWindow:
     
     def _on_hash_suite_benchmark_run(self, _btn) -> None:
         """Run benchmark."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         algorithm = self.hash_suite_bench_algo.get_active_id()
@@ -3138,20 +3980,20 @@ class MainWindow:
                 benchmark_algorithm=algorithm,
                 benchmark_duration=str(duration)
             )
-            result_text = getattr(result, "body", str(result))
-            self.hash_suite_bench_result.get_buffer().set_text(result_text)
+            result_text = result.body
+            self._set_text_view_text(self.hash_suite_bench_result, result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
     
     def _on_hash_suite_queue_refresh(self, _btn) -> None:
         """Refresh queue view."""
-        if not self._active_tool:
+        if self._active_tool is None:
             return
         
         try:
             result = self._active_tool.run(tab="queue")
-            result_text = getattr(result, "body", str(result))
-            self.hash_suite_queue_view.get_buffer().set_text(result_text)
+            result_text = result.body
+            self._set_text_view_text(self.hash_suite_queue_view, result_text)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
     
@@ -3418,7 +4260,7 @@ class MainWindow:
 
     def _set_morse_output(self, text: str) -> None:
         self._set_text_view_text(self.morse_output_view, text)
-        self.morse_copy_btn.set_sensitive(bool(text.strip()))
+        self.morse_copy_btn.set_sensitive(bool(text) and not text.isspace())
 
     def _open_morse_decoder(self, tool) -> None:
         self._active_tool = tool
@@ -3437,7 +4279,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_morse_decode(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         morse_text = self._get_text_view_text(self.morse_input_view)
         audio_mode = self.morse_audio_toggle.get_active()
@@ -3465,7 +4307,7 @@ class MainWindow:
                 show_breakdown="true" if self.morse_breakdown_toggle.get_active() else "false",
                 audio_file=audio_path,
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_morse_output(body)
             self._set_tool_output(body)
             self.output_frame.set_visible(True)
@@ -3528,7 +4370,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_decoder_execute(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         data = self._get_text_view_text(self.decoder_input_view)
         operations = self.decoder_operations_entry.get_text().strip()
@@ -3538,7 +4380,7 @@ class MainWindow:
             return
         try:
             result = self._active_tool.run(data=data, operations=operations, input_format=input_format)
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_decoder_output(body)
             self.decoder_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -3635,7 +4477,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_hash_workspace_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         
         hashes_text = self._get_text_view_text(self.hash_workspace_hashes).strip()
@@ -3655,7 +4497,7 @@ class MainWindow:
                 mode=mode,
                 known_plaintext=known_plaintext
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_text_view_text(self.hash_workspace_output, body)
             self.hash_workspace_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -3799,7 +4641,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_hash_cracker_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         
         hash_value = self.hash_cracker_hash.get_text().strip()
@@ -3826,7 +4668,7 @@ class MainWindow:
                 max_length=max_length,
                 timeout="60"  # Reasonable timeout for UI
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_text_view_text(self.hash_cracker_output, body)
             self.hash_cracker_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -3921,7 +4763,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_hash_benchmark_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
             
         algo_idx = self.hash_benchmark_algorithm.get_selected()
@@ -3932,7 +4774,7 @@ class MainWindow:
 
         try:
             result = self._active_tool.run(algorithm=algorithm, duration=duration)
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_text_view_text(self.hash_benchmark_output, body)
             self.hash_benchmark_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4033,7 +4875,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_hash_format_converter_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
             
         hash_input = self.hash_format_converter_input.get_text().strip()
@@ -4056,7 +4898,7 @@ class MainWindow:
                 source_format=source_format,
                 target_format=target_format
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_text_view_text(self.hash_format_converter_output, body)
             self.hash_format_converter_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4286,7 +5128,7 @@ class MainWindow:
         self._update_hashcat_attack_subtitle()
 
     def _on_hashcat_build(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         tool_choice = self._hashcat_selected_tool()
         try:
@@ -4302,7 +5144,7 @@ class MainWindow:
                 format_hint=self.hashcat_format_row.get_text().strip(),
                 potfile=self.hashcat_potfile_row.get_text().strip(),
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_hashcat_output(body)
             self.hashcat_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4439,7 +5281,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_htpasswd_generate(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         username = self.htpasswd_username_entry.get_text().strip()
         password = self.htpasswd_password_entry.get_text()
@@ -4453,7 +5295,7 @@ class MainWindow:
             return
         try:
             result = self._active_tool.run(username=username, password=password, algorithm=algorithm, salt=salt)
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_htpasswd_output(body)
             self.htpasswd_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4602,7 +5444,7 @@ class MainWindow:
         self.rsa_crt_box.set_visible(not is_analyse)
 
     def _on_rsa_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         mode = self.rsa_mode_combo.get_active_id() or "analyse"
         try:
@@ -4627,7 +5469,7 @@ class MainWindow:
                     instances=instances,
                     e=self.rsa_crt_e_entry.get_text().strip() or "3",
                 )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_rsa_output(body)
             self.rsa_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4788,7 +5630,7 @@ class MainWindow:
         self.xor_apply_box.set_visible(mode == "apply_keystream")
 
     def _on_xor_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         mode = self.xor_mode_combo.get_active_id() or "known_plaintext"
         try:
@@ -4823,7 +5665,7 @@ class MainWindow:
                     keystream=keystream,
                     input_format=self.xor_apply_format_combo.get_active_id() or "hex",
                 )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_xor_output(body)
             self.xor_copy_btn.set_sensitive(True)
             self._set_tool_output(body)
@@ -4835,6 +5677,11 @@ class MainWindow:
         self._copy_text_view_to_clipboard(self.xor_output_view)
         
     def _navigate_back_to_tools(self) -> None:
+        self._cancel_tool_subprocess()
+        self._cancel_zsteg_stream()
+        self._unbind_path_buffer()
+        for token in self._stream_cancels.values():
+            token.cancel()
         self._current_view = ("tools", None)
         self._show_tools()
         self.refresh_sidebar()
@@ -4941,7 +5788,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_caesar_compute(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         buffer = self.caesar_input.get_buffer()
         start, end = buffer.get_bounds()
@@ -4959,7 +5806,7 @@ class MainWindow:
                 alphabet=self.caesar_alphabet.get_text(),
                 include_digits="true" if self.caesar_digits.get_active() else "false",
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_caesar_output(body)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
@@ -4967,7 +5814,7 @@ class MainWindow:
     def _set_caesar_output(self, text: str) -> None:
         buffer = self.caesar_output.get_buffer()
         buffer.set_text(text)
-        self.caesar_copy_btn.set_sensitive(bool(text.strip()))
+        self.caesar_copy_btn.set_sensitive(bool(text) and not text.isspace())
 
     def _on_caesar_copy(self, _btn: Gtk.Button) -> None:
         display = self.window.get_display()
@@ -5079,7 +5926,7 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_vigenere_compute(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         buffer = self.vigenere_input_view.get_buffer()
         start, end = buffer.get_bounds()
@@ -5101,7 +5948,7 @@ class MainWindow:
                 include_digits="true" if self.vigenere_include_digits.get_active() else "false",
                 autokey="true" if self.vigenere_autokey.get_active() else "false",
             )
-            body = getattr(result, "body", str(result))
+            body = result.body
             self._set_vigenere_output(body)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
@@ -5109,7 +5956,7 @@ class MainWindow:
     def _set_vigenere_output(self, text: str) -> None:
         buffer = self.vigenere_output_view.get_buffer()
         buffer.set_text(text)
-        self.vigenere_copy_btn.set_sensitive(bool(text.strip()))
+        self.vigenere_copy_btn.set_sensitive(bool(text) and not text.isspace())
 
     def _on_vigenere_copy(self, _btn: Gtk.Button) -> None:
         display = self.window.get_display()
@@ -5239,7 +6086,7 @@ class MainWindow:
         dialog.destroy()
 
     def _on_inspect_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         file_path = self.inspect_file_entry.get_text().strip()
         if not file_path:
@@ -5255,9 +6102,9 @@ class MainWindow:
                 strings_limit=str(int(self.inspect_strings_limit.get_value())),
             )
             buffer = self.inspect_result_view.get_buffer()
-            payload = getattr(result, "body", str(result))
+            payload = result.body
             buffer.set_text(payload)
-            self.inspect_copy_btn.set_sensitive(bool(payload.strip()))
+            self.inspect_copy_btn.set_sensitive(bool(payload) and not payload.isspace())
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
 
@@ -5270,88 +6117,175 @@ class MainWindow:
         start, end = buffer.get_bounds()
         clipboard.set_text(buffer.get_text(start, end, True))
 
-    # ---------------------- PCAP viewer detail ----------------------
-    def _build_pcap_viewer_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("PCAP Viewer")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
-
-        # Capture file section
-        capture_label = Gtk.Label(label="Capture File", xalign=0)
-        capture_label.add_css_class("title-4")
-        form.append(capture_label)
+    def _bind_path_buffer(self, entry: Gtk.Entry) -> None:
+        """Attach the shared, emptied path buffer to ``entry`` while its page is open."""
+        if self._path_entry is not entry:
+            self._unbind_path_buffer()
+            entry.set_buffer(self._path_buffer)
+            self._path_entry = entry
+        self._path_buffer.set_text("", 0)
+
+    def _unbind_path_buffer(self) -> None:
+        entry = self._path_entry
+        self._path_entry = None
+        if entry is not None:
+            entry.set_buffer(Gtk.EntryBuffer())
+
+    # ---------------------- Shared tool detail factory ----------------------
+    def _build_tool_detail(self, root: Gtk.Box, spec: ToolDetailSpec) -> None:
+        form = self._build_tool_shell(root, spec.prefix, spec.title, spec.run_label, spec.on_run, spec.on_copy)
+
+        # Input file section
+        file_label = Gtk.Label(label=spec.file_label, xalign=0)
+        file_label.add_css_class("title-4")
+        form.append(file_label)
 
         file_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.pcap_file_entry = Gtk.Entry()
-        self.pcap_file_entry.add_css_class("modern-entry")
-        self.pcap_file_entry.set_placeholder_text("Select a .pcap file...")
-        self.pcap_file_entry.set_hexpand(True)
-        file_row.append(self.pcap_file_entry)
-        browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_pcap_browse)
-        file_row.append(browse_btn)
+        file_entry = Gtk.Entry()
+        file_entry.add_css_class("modern-entry")
+        file_entry.set_placeholder_text(spec.file_placeholder)
+        file_entry.set_hexpand(True)
+        file_row.append(file_entry)
+        setattr(self, spec.file_attr, file_entry)
+        for label, handler in spec.browse:
+            browse_btn = Gtk.Button(label=label)
+            browse_btn.connect("clicked", handler)
+            file_row.append(browse_btn)
         form.append(file_row)
 
-        # Analysis options section
-        options_label = Gtk.Label(label="Analysis Options", xalign=0)
+        # Options section
+        options_label = Gtk.Label(label=spec.options_label, xalign=0)
         options_label.add_css_class("title-4")
         form.append(options_label)
 
-        options_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        options_row.append(Gtk.Label(label="Packet limit", xalign=0))
-        self.pcap_limit_spin = Gtk.SpinButton()
-        self.pcap_limit_spin.set_adjustment(Gtk.Adjustment(lower=10, upper=100000, step_increment=10, page_increment=1000))
-        self.pcap_limit_spin.set_value(500)
-        options_row.append(self.pcap_limit_spin)
-        self.pcap_hex_check = Gtk.CheckButton(label="Include hex preview")
-        options_row.append(self.pcap_hex_check)
-        form.append(options_row)
-
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.pcap_run_btn = Gtk.Button(label="Analyze")
-        self.pcap_run_btn.add_css_class("suggested-action")
-        self.pcap_run_btn.connect("clicked", self._on_pcap_run)
-        actions_row.append(self.pcap_run_btn)
-        self.pcap_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.pcap_copy_btn.set_tooltip_text("Copy result")
-        self.pcap_copy_btn.set_sensitive(False)
-        self.pcap_copy_btn.connect("clicked", self._on_pcap_copy)
-        actions_row.append(self.pcap_copy_btn)
-        form.append(actions_row)
+        for entry in spec.options:
+            if isinstance(entry, OptionGrid):
+                grid = Gtk.Grid()
+                grid.set_row_spacing(8)
+                grid.set_column_spacing(12)
+                for column, option in enumerate(entry.options):
+                    grid.attach(Gtk.Label(label=option.label, xalign=0), 2 * column, 0, 1, 1)
+                    spin = self._spin_option(option)
+                    grid.attach(spin, 2 * column + 1, 0, 1, 1)
+                    setattr(self, option.name, spin)
+                form.append(grid)
+            elif isinstance(entry, tuple):
+                row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+                for option in entry:
+                    self._append_tool_option(row, option)
+                form.append(row)
+            elif isinstance(entry, CheckOption):
+                self._append_tool_option(form, entry)
+            else:
+                row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+                self._append_tool_option(row, entry)
+                form.append(row)
 
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
+    def _build_tool_shell(
+        self,
+        root: Gtk.Box,
+        prefix: str,
+        title: str,
+        run_label: str,
+        on_run: Callable[[Gtk.Button], None],
+        on_copy: Callable[[Gtk.Button], None],
+        result_heading: bool = True,
+    ) -> Gtk.Box:
+        """Append the header, action row and result view from ``tool_shell.ui`` to ``root``.
+
+        Sets ``<prefix>_run_btn``, ``<prefix>_copy_btn`` and ``<prefix>_result_view``
+        and returns the box the tool's own input rows go into. Pages that never
+        had a "Result" heading above the output pass ``result_heading=False``.
+        """
+        if self._tool_shell_ui is None:
+            self._tool_shell_ui = self.app.resources.ui_data("tool_shell.ui")
+        builder = Gtk.Builder.new_from_string(self._tool_shell_ui, -1)
+        builder.get_object("back_btn").connect("clicked", lambda *_: self._navigate_back_to_tools())
+        builder.get_object("title").set_text(title)
+        run_btn = builder.get_object("run_btn")
+        run_btn.set_label(run_label)
+        run_btn.connect("clicked", on_run)
+        copy_btn = builder.get_object("copy_btn")
+        copy_btn.connect("clicked", on_copy)
+        setattr(self, f"{prefix}_run_btn", run_btn)
+        setattr(self, f"{prefix}_copy_btn", copy_btn)
+        setattr(self, f"{prefix}_result_view", builder.get_object("result_view"))
+        if not result_heading:
+            builder.get_object("form").remove(builder.get_object("result_label"))
+        root.append(builder.get_object("header_row"))
+        root.append(builder.get_object("clamp"))
+        return builder.get_object("fields")
+
+    def _append_tool_option(self, container: Gtk.Box, option: OptionSpec) -> None:
+        if isinstance(option, CheckOption):
+            widget = Gtk.CheckButton(label=option.label)
+            widget.set_active(option.active)
+            container.append(widget)
+        elif isinstance(option, SpinOption):
+            container.append(Gtk.Label(label=option.label, xalign=0))
+            widget = self._spin_option(option)
+            container.append(widget)
+        elif isinstance(option, ComboOption):
+            container.append(Gtk.Label(label=option.label, xalign=0))
+            widget = Gtk.ComboBoxText()
+            for item_id, item_label in option.items:
+                widget.append(item_id, item_label)
+            widget.set_active_id(option.active_id)
+            container.append(widget)
+        else:
+            label = Gtk.Label(label=option.label, xalign=0)
+            if option.label_width is not None:
+                label.set_width_chars(option.label_width)
+            container.append(label)
+            widget = Gtk.Entry()
+            widget.add_css_class("modern-entry")
+            widget.set_placeholder_text(option.placeholder)
+            widget.set_hexpand(True)
+            if option.secret:
+                widget.set_visibility(False)
+            container.append(widget)
+            if option.browse is not None:
+                browse_btn = Gtk.Button(label="Browse…")
+                browse_btn.connect("clicked", option.browse)
+                container.append(browse_btn)
+        setattr(self, option.name, widget)
+
+    def _spin_option(self, option: SpinOption) -> Gtk.SpinButton:
+        spin = Gtk.SpinButton.new_with_range(option.lower, option.upper, option.step)
+        if option.page is not None:
+            spin.set_increments(option.step, option.page)
+        spin.set_value(option.value)
+        return spin
 
-        self.pcap_result_view = Gtk.TextView()
-        self.pcap_result_view.add_css_class("output-text")
-        self.pcap_result_view.set_editable(False)
-        self.pcap_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.pcap_result_view)
-        form.append(result_scroller)
+    # ---------------------- PCAP viewer detail ----------------------
+    def _build_pcap_viewer_detail(self, root: Gtk.Box) -> None:
+        self._build_tool_detail(
+            root,
+            ToolDetailSpec(
+                prefix="pcap",
+                title="PCAP Viewer",
+                file_label="Capture File",
+                file_attr="pcap_file_entry",
+                file_placeholder="Select a .pcap file...",
+                browse=(("Browse…", self._on_pcap_browse),),
+                options=(
+                    (
+                        SpinOption("pcap_limit_spin", 10, 100000, 10, 500, "Packet limit", page=1000),
+                        CheckOption("pcap_hex_check", "Include hex preview"),
+                    ),
+                ),
+                run_label="Analyze",
+                on_run=self._on_pcap_run,
+                on_copy=self._on_pcap_copy,
+            ),
+        )
 
     def _open_pcap_viewer(self, tool) -> None:
         self._active_tool = tool
-        self.pcap_file_entry.set_text("")
+        self._bind_path_buffer(self.pcap_file_entry)
         self.pcap_limit_spin.set_value(500)
         self.pcap_hex_check.set_active(False)
-        self._set_text_view_text(self.pcap_result_view, "")
+        self._clear_result_text(self.pcap_result_view)
         self.pcap_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("pcap_viewer")
         self.content_stack.set_visible_child_name("tool_detail")
@@ -5367,134 +6301,62 @@ class MainWindow:
         dialog.destroy()
 
     def _on_pcap_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.pcap_file_entry.get_text().strip()
+        values = self._read_widgets("pcap_file_entry", "pcap_limit_spin", "pcap_hex_check")
+        path = values["pcap_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a capture file"))
             return
-        limit = str(int(self.pcap_limit_spin.get_value()))
-        include_hex = "true" if self.pcap_hex_check.get_active() else "false"
+        limit = values["pcap_limit_spin"]
+        include_hex = values["pcap_hex_check"]
         self.pcap_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.pcap_result_view, "Analyzing capture…")
+        self._set_result_text(self.pcap_result_view, "Analyzing capture…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.pcap_run_btn}
             try:
                 result = self._active_tool.run(file_path=path, packet_limit=limit, include_hex=include_hex)
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.pcap_result_view, body)
-                GLib.idle_add(self.pcap_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.pcap_result_view, text=body, copy_btn=self.pcap_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.pcap_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.pcap_run_btn})
 
     def _on_pcap_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.pcap_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.pcap_result_view)
 
     # ---------------------- Memory analyzer detail ----------------------
     def _build_memory_analyzer_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Memory Analyzer")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
-
-        # Memory dump section
-        dump_label = Gtk.Label(label="Memory Dump", xalign=0)
-        dump_label.add_css_class("title-4")
-        form.append(dump_label)
-
-        file_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.memory_file_entry = Gtk.Entry()
-        self.memory_file_entry.add_css_class("modern-entry")
-        self.memory_file_entry.set_placeholder_text("Select a memory image...")
-        self.memory_file_entry.set_hexpand(True)
-        file_row.append(self.memory_file_entry)
-        browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_memory_browse)
-        file_row.append(browse_btn)
-        form.append(file_row)
-
-        # Analysis options section
-        options_label = Gtk.Label(label="Analysis Options", xalign=0)
-        options_label.add_css_class("title-4")
-        form.append(options_label)
-
-        strings_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        strings_row.append(Gtk.Label(label="String sample", xalign=0))
-        self.memory_strings_spin = Gtk.SpinButton()
-        self.memory_strings_spin.set_adjustment(Gtk.Adjustment(lower=50, upper=5000, step_increment=50, page_increment=500))
-        self.memory_strings_spin.set_value(300)
-        strings_row.append(self.memory_strings_spin)
-        form.append(strings_row)
-
-        keyword_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        keyword_label = Gtk.Label(label="Keywords", xalign=0)
-        keyword_label.set_width_chars(14)
-        keyword_row.append(keyword_label)
-        self.memory_keywords_entry = Gtk.Entry()
-        self.memory_keywords_entry.add_css_class("modern-entry")
-        self.memory_keywords_entry.set_placeholder_text("flag,password,secret")
-        self.memory_keywords_entry.set_hexpand(True)
-        keyword_row.append(self.memory_keywords_entry)
-        form.append(keyword_row)
-
-        self.memory_hash_check = Gtk.CheckButton(label="Include hashes (slower)")
-        form.append(self.memory_hash_check)
-
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.memory_run_btn = Gtk.Button(label="Analyze")
-        self.memory_run_btn.add_css_class("suggested-action")
-        self.memory_run_btn.connect("clicked", self._on_memory_run)
-        actions_row.append(self.memory_run_btn)
-        self.memory_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.memory_copy_btn.set_tooltip_text("Copy result")
-        self.memory_copy_btn.set_sensitive(False)
-        self.memory_copy_btn.connect("clicked", self._on_memory_copy)
-        actions_row.append(self.memory_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.memory_result_view = Gtk.TextView()
-        self.memory_result_view.add_css_class("output-text")
-        self.memory_result_view.set_editable(False)
-        self.memory_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.memory_result_view)
-        form.append(result_scroller)
+        self._build_tool_detail(
+            root,
+            ToolDetailSpec(
+                prefix="memory",
+                title="Memory Analyzer",
+                file_label="Memory Dump",
+                file_attr="memory_file_entry",
+                file_placeholder="Select a memory image...",
+                browse=(("Browse…", self._on_memory_browse),),
+                options=(
+                    SpinOption("memory_strings_spin", 50, 5000, 50, 300, "String sample", page=500),
+                    TextOption("memory_keywords_entry", "Keywords", "flag,password,secret", label_width=14),
+                    CheckOption("memory_hash_check", "Include hashes (slower)"),
+                ),
+                run_label="Analyze",
+                on_run=self._on_memory_run,
+                on_copy=self._on_memory_copy,
+            ),
+        )
 
     def _open_memory_analyzer(self, tool) -> None:
         self._active_tool = tool
-        self.memory_file_entry.set_text("")
+        self._bind_path_buffer(self.memory_file_entry)
         self.memory_strings_spin.set_value(300)
         self.memory_keywords_entry.set_text("flag,password,secret")
         self.memory_hash_check.set_active(False)
-        self._set_text_view_text(self.memory_result_view, "")
+        self._clear_result_text(self.memory_result_view)
         self.memory_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("memory_analyzer")
         self.content_stack.set_visible_child_name("tool_detail")
@@ -5510,139 +6372,74 @@ class MainWindow:
         dialog.destroy()
 
     def _on_memory_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.memory_file_entry.get_text().strip()
+        values = self._read_widgets(
+            "memory_file_entry", "memory_strings_spin", "memory_keywords_entry", "memory_hash_check"
+        )
+        path = values["memory_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a memory image"))
             return
-        sample_limit = str(int(self.memory_strings_spin.get_value()))
-        keywords = self.memory_keywords_entry.get_text().strip()
-        include_hash = "true" if self.memory_hash_check.get_active() else "false"
+        args = MemoryAnalyzerArgs(
+            file_path=path,
+            strings_limit=values["memory_strings_spin"],
+            keywords=tuple(
+                token.strip() for token in values["memory_keywords_entry"].split(",") if token.strip()
+            ),
+            include_hashes=values["memory_hash_check"],
+        )
         self.memory_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.memory_result_view, "Scanning memory dump…")
+        self._set_result_text(self.memory_result_view, "Scanning memory dump…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.memory_run_btn}
             try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    strings_limit=sample_limit,
-                    keywords=keywords,
-                    include_hashes=include_hash,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.memory_result_view, body)
-                GLib.idle_add(self.memory_copy_btn.set_sensitive, bool(body.strip()))
+                result = self._active_tool.run_args(args)
+                body = result.body
+                updates.update(view=self.memory_result_view, text=body, copy_btn=self.memory_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.memory_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.memory_run_btn})
 
     def _on_memory_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.memory_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.memory_result_view)
 
     # ---------------------- Disk image detail ----------------------
     def _build_disk_image_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Disk Image Tools")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
-
-        # Disk image section
-        image_label = Gtk.Label(label="Disk Image", xalign=0)
-        image_label.add_css_class("title-4")
-        form.append(image_label)
-
-        file_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.disk_file_entry = Gtk.Entry()
-        self.disk_file_entry.add_css_class("modern-entry")
-        self.disk_file_entry.set_placeholder_text("Select a raw image...")
-        self.disk_file_entry.set_hexpand(True)
-        file_row.append(self.disk_file_entry)
-        browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_disk_browse)
-        file_row.append(browse_btn)
-        form.append(file_row)
-
-        # Analysis options section
-        options_label = Gtk.Label(label="Analysis Options", xalign=0)
-        options_label.add_css_class("title-4")
-        form.append(options_label)
-
-        options_grid = Gtk.Grid()
-        options_grid.set_row_spacing(8)
-        options_grid.set_column_spacing(12)
-        
-        options_grid.attach(Gtk.Label(label="Sector size", xalign=0), 0, 0, 1, 1)
-        self.disk_sector_spin = Gtk.SpinButton()
-        self.disk_sector_spin.set_adjustment(Gtk.Adjustment(lower=128, upper=8192, step_increment=128, page_increment=512))
-        self.disk_sector_spin.set_value(512)
-        options_grid.attach(self.disk_sector_spin, 1, 0, 1, 1)
-        
-        options_grid.attach(Gtk.Label(label="Max partitions", xalign=0), 2, 0, 1, 1)
-        self.disk_partition_spin = Gtk.SpinButton()
-        self.disk_partition_spin.set_adjustment(Gtk.Adjustment(lower=1, upper=256, step_increment=1, page_increment=8))
-        self.disk_partition_spin.set_value(16)
-        options_grid.attach(self.disk_partition_spin, 3, 0, 1, 1)
-        
-        form.append(options_grid)
-
-        self.disk_hash_check = Gtk.CheckButton(label="Include hashes (slower)")
-        form.append(self.disk_hash_check)
-
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.disk_run_btn = Gtk.Button(label="Analyze")
-        self.disk_run_btn.add_css_class("suggested-action")
-        self.disk_run_btn.connect("clicked", self._on_disk_run)
-        actions_row.append(self.disk_run_btn)
-        self.disk_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.disk_copy_btn.set_tooltip_text("Copy result")
-        self.disk_copy_btn.set_sensitive(False)
-        self.disk_copy_btn.connect("clicked", self._on_disk_copy)
-        actions_row.append(self.disk_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.disk_result_view = Gtk.TextView()
-        self.disk_result_view.add_css_class("output-text")
-        self.disk_result_view.set_editable(False)
-        self.disk_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.disk_result_view)
-        form.append(result_scroller)
+        self._build_tool_detail(
+            root,
+            ToolDetailSpec(
+                prefix="disk",
+                title="Disk Image Tools",
+                file_label="Disk Image",
+                file_attr="disk_file_entry",
+                file_placeholder="Select a raw image...",
+                browse=(("Browse…", self._on_disk_browse),),
+                options=(
+                    OptionGrid(
+                        (
+                            SpinOption("disk_sector_spin", 128, 8192, 128, 512, "Sector size", page=512),
+                            SpinOption("disk_partition_spin", 1, 256, 1, 16, "Max partitions", page=8),
+                        )
+                    ),
+                    CheckOption("disk_hash_check", "Include hashes (slower)"),
+                ),
+                run_label="Analyze",
+                on_run=self._on_disk_run,
+                on_copy=self._on_disk_copy,
+            ),
+        )
 
     def _open_disk_image_tools(self, tool) -> None:
         self._active_tool = tool
-        self.disk_file_entry.set_text("")
+        self._bind_path_buffer(self.disk_file_entry)
         self.disk_sector_spin.set_value(512)
         self.disk_partition_spin.set_value(16)
         self.disk_hash_check.set_active(False)
-        self._set_text_view_text(self.disk_result_view, "")
+        self._clear_result_text(self.disk_result_view)
         self.disk_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("disk_image_tools")
         self.content_stack.set_visible_child_name("tool_detail")
@@ -5658,19 +6455,21 @@ class MainWindow:
         dialog.destroy()
 
     def _on_disk_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.disk_file_entry.get_text().strip()
+        values = self._read_widgets("disk_file_entry", "disk_sector_spin", "disk_partition_spin", "disk_hash_check")
+        path = values["disk_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a disk image"))
             return
-        sector = str(int(self.disk_sector_spin.get_value()))
-        partitions = str(int(self.disk_partition_spin.get_value()))
-        include_hash = "true" if self.disk_hash_check.get_active() else "false"
+        sector = values["disk_sector_spin"]
+        partitions = values["disk_partition_spin"]
+        include_hash = values["disk_hash_check"]
         self.disk_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.disk_result_view, "Parsing partition tables…")
+        self._set_result_text(self.disk_result_view, "Parsing partition tables…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.disk_run_btn}
             try:
                 result = self._active_tool.run(
                     file_path=path,
@@ -5678,124 +6477,56 @@ class MainWindow:
                     max_partitions=partitions,
                     include_hashes=include_hash,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.disk_result_view, body)
-                GLib.idle_add(self.disk_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.disk_result_view, text=body, copy_btn=self.disk_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.disk_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.disk_run_btn})
 
     def _on_disk_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.disk_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.disk_result_view)
 
     # ---------------------- Timeline builder detail ----------------------
     def _build_timeline_builder_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Timeline Builder")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
-
-        # Target section
-        target_label = Gtk.Label(label="Target", xalign=0)
-        target_label.add_css_class("title-4")
-        form.append(target_label)
-
-        target_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.timeline_target_entry = Gtk.Entry()
-        self.timeline_target_entry.add_css_class("modern-entry")
-        self.timeline_target_entry.set_placeholder_text("Directory or file to index...")
-        self.timeline_target_entry.set_hexpand(True)
-        target_row.append(self.timeline_target_entry)
-        browse_file_btn = Gtk.Button(label="Browse File…")
-        browse_file_btn.connect("clicked", self._on_timeline_browse_file)
-        target_row.append(browse_file_btn)
-        browse_folder_btn = Gtk.Button(label="Browse Folder…")
-        browse_folder_btn.connect("clicked", self._on_timeline_browse_folder)
-        target_row.append(browse_folder_btn)
-        form.append(target_row)
-
-        # Timeline options section
-        options_label = Gtk.Label(label="Timeline Options", xalign=0)
-        options_label.add_css_class("title-4")
-        form.append(options_label)
-
-        limit_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        limit_row.append(Gtk.Label(label="Max entries", xalign=0))
-        self.timeline_limit_spin = Gtk.SpinButton()
-        self.timeline_limit_spin.set_adjustment(Gtk.Adjustment(lower=50, upper=10000, step_increment=50, page_increment=500))
-        self.timeline_limit_spin.set_value(500)
-        limit_row.append(self.timeline_limit_spin)
-        self.timeline_include_dirs_check = Gtk.CheckButton(label="Include directories")
-        self.timeline_include_dirs_check.set_active(True)
-        limit_row.append(self.timeline_include_dirs_check)
-        form.append(limit_row)
-
-        format_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        format_row.append(Gtk.Label(label="Format", xalign=0))
-        self.timeline_format_combo = Gtk.ComboBoxText()
-        self.timeline_format_combo.append("csv", "CSV")
-        self.timeline_format_combo.append("json", "JSON")
-        self.timeline_format_combo.set_active_id("csv")
-        format_row.append(self.timeline_format_combo)
-        self.timeline_hash_check = Gtk.CheckButton(label="Hash files (sha256)")
-        format_row.append(self.timeline_hash_check)
-        form.append(format_row)
-
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.timeline_run_btn = Gtk.Button(label="Build Timeline")
-        self.timeline_run_btn.add_css_class("suggested-action")
-        self.timeline_run_btn.connect("clicked", self._on_timeline_run)
-        actions_row.append(self.timeline_run_btn)
-        self.timeline_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.timeline_copy_btn.set_tooltip_text("Copy result")
-        self.timeline_copy_btn.set_sensitive(False)
-        self.timeline_copy_btn.connect("clicked", self._on_timeline_copy)
-        actions_row.append(self.timeline_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.timeline_result_view = Gtk.TextView()
-        self.timeline_result_view.add_css_class("output-text")
-        self.timeline_result_view.set_editable(False)
-        self.timeline_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.timeline_result_view)
-        form.append(result_scroller)
+        self._build_tool_detail(
+            root,
+            ToolDetailSpec(
+                prefix="timeline",
+                title="Timeline Builder",
+                file_label="Target",
+                file_attr="timeline_target_entry",
+                file_placeholder="Directory or file to index...",
+                browse=(
+                    ("Browse File…", self._on_timeline_browse_file),
+                    ("Browse Folder…", self._on_timeline_browse_folder),
+                ),
+                options=(
+                    (
+                        SpinOption("timeline_limit_spin", 50, 10000, 50, 500, "Max entries", page=500),
+                        CheckOption("timeline_include_dirs_check", "Include directories", active=True),
+                    ),
+                    (
+                        ComboOption("timeline_format_combo", "Format", (("csv", "CSV"), ("json", "JSON")), "csv"),
+                        CheckOption("timeline_hash_check", "Hash files (sha256)"),
+                    ),
+                ),
+                run_label="Build Timeline",
+                on_run=self._on_timeline_run,
+                on_copy=self._on_timeline_copy,
+                options_label="Timeline Options",
+            ),
+        )
 
     def _open_timeline_builder(self, tool) -> None:
         self._active_tool = tool
-        self.timeline_target_entry.set_text("")
+        self._bind_path_buffer(self.timeline_target_entry)
         self.timeline_limit_spin.set_value(500)
         self.timeline_include_dirs_check.set_active(True)
         self.timeline_format_combo.set_active_id("csv")
         self.timeline_hash_check.set_active(False)
-        self._set_text_view_text(self.timeline_result_view, "")
+        self._clear_result_text(self.timeline_result_view)
         self.timeline_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("timeline_builder")
         self.content_stack.set_visible_child_name("tool_detail")
@@ -5821,20 +6552,28 @@ class MainWindow:
         dialog.destroy()
 
     def _on_timeline_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
-            return
-        path = self.timeline_target_entry.get_text().strip()
+        if self._active_tool is None:
+            return
+        values = self._read_widgets(
+            "timeline_target_entry",
+            "timeline_limit_spin",
+            "timeline_include_dirs_check",
+            "timeline_format_combo",
+            "timeline_hash_check",
+        )
+        path = values["timeline_target_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a file or folder"))
             return
-        limit = str(int(self.timeline_limit_spin.get_value()))
-        include_dirs = "true" if self.timeline_include_dirs_check.get_active() else "false"
-        format_choice = self.timeline_format_combo.get_active_id() or "csv"
-        include_hash = "true" if self.timeline_hash_check.get_active() else "false"
+        limit = values["timeline_limit_spin"]
+        include_dirs = values["timeline_include_dirs_check"]
+        format_choice = values["timeline_format_combo"] or "csv"
+        include_hash = values["timeline_hash_check"]
         self.timeline_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.timeline_result_view, "Building timeline…")
+        self._set_result_text(self.timeline_result_view, "Building timeline…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.timeline_run_btn}
             try:
                 result = self._active_tool.run(
                     target_path=path,
@@ -5843,133 +6582,67 @@ class MainWindow:
                     output_format=format_choice,
                     include_hashes=include_hash,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.timeline_result_view, body)
-                GLib.idle_add(self.timeline_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.timeline_result_view, text=body, copy_btn=self.timeline_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.timeline_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.timeline_run_btn})
 
     def _on_timeline_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.timeline_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.timeline_result_view)
 
     # ---------------------- Image stego detail ----------------------
     def _build_image_stego_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Image Stego Toolkit")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
-
-        # Image section
-        image_label = Gtk.Label(label="Image", xalign=0)
-        image_label.add_css_class("title-4")
-        form.append(image_label)
-
-        file_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.image_stego_file_entry = Gtk.Entry()
-        self.image_stego_file_entry.add_css_class("modern-entry")
-        self.image_stego_file_entry.set_placeholder_text("Select an image file...")
-        self.image_stego_file_entry.set_hexpand(True)
-        file_row.append(self.image_stego_file_entry)
-        browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_image_stego_browse)
-        file_row.append(browse_btn)
-        form.append(file_row)
-
-        # Analysis options section
-        options_label = Gtk.Label(label="Analysis Options", xalign=0)
-        options_label.add_css_class("title-4")
-        form.append(options_label)
-
-        password_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        password_row.append(Gtk.Label(label="Steghide password", xalign=0))
-        self.image_stego_password_entry = Gtk.Entry()
-        self.image_stego_password_entry.add_css_class("modern-entry")
-        self.image_stego_password_entry.set_placeholder_text("Optional passphrase...")
-        self.image_stego_password_entry.set_visibility(False)
-        self.image_stego_password_entry.set_hexpand(True)
-        password_row.append(self.image_stego_password_entry)
-        self.image_stego_extract_check = Gtk.CheckButton(label="Attempt extraction")
-        password_row.append(self.image_stego_extract_check)
-        form.append(password_row)
-
-        stegsolve_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        stegsolve_row.append(Gtk.Label(label="stegsolve.jar", xalign=0))
-        self.image_stego_jar_entry = Gtk.Entry()
-        self.image_stego_jar_entry.add_css_class("modern-entry")
-        self.image_stego_jar_entry.set_placeholder_text("Optional path to stegsolve.jar...")
-        self.image_stego_jar_entry.set_hexpand(True)
-        stegsolve_row.append(self.image_stego_jar_entry)
-        jar_btn = Gtk.Button(label="Browse…")
-        jar_btn.connect("clicked", self._on_image_stego_jar_browse)
-        stegsolve_row.append(jar_btn)
-        form.append(stegsolve_row)
-
-        tool_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        tool_row.append(Gtk.Label(label="Tool", xalign=0))
-        self.image_stego_tool_combo = Gtk.ComboBoxText()
-        self.image_stego_tool_combo.append("zsteg", "zsteg")
-        self.image_stego_tool_combo.append("steghide", "steghide")
-        self.image_stego_tool_combo.append("all", "Run both")
-        self.image_stego_tool_combo.set_active(0)
-        tool_row.append(self.image_stego_tool_combo)
-        form.append(tool_row)
-
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.image_stego_run_btn = Gtk.Button(label="Run Toolkit")
-        self.image_stego_run_btn.add_css_class("suggested-action")
-        self.image_stego_run_btn.connect("clicked", self._on_image_stego_run)
-        actions_row.append(self.image_stego_run_btn)
-        self.image_stego_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.image_stego_copy_btn.set_tooltip_text("Copy result")
-        self.image_stego_copy_btn.set_sensitive(False)
-        self.image_stego_copy_btn.connect("clicked", self._on_image_stego_copy)
-        actions_row.append(self.image_stego_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.image_stego_result_view = Gtk.TextView()
-        self.image_stego_result_view.add_css_class("output-text")
-        self.image_stego_result_view.set_editable(False)
-        self.image_stego_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.image_stego_result_view)
-        form.append(result_scroller)
+        self._build_tool_detail(
+            root,
+            ToolDetailSpec(
+                prefix="image_stego",
+                title="Image Stego Toolkit",
+                file_label="Image",
+                file_attr="image_stego_file_entry",
+                file_placeholder="Select an image file...",
+                browse=(("Browse…", self._on_image_stego_browse),),
+                options=(
+                    (
+                        TextOption(
+                            "image_stego_password_entry",
+                            "Steghide password",
+                            "Optional passphrase...",
+                            secret=True,
+                        ),
+                        CheckOption("image_stego_extract_check", "Attempt extraction"),
+                    ),
+                    TextOption(
+                        "image_stego_jar_entry",
+                        "stegsolve.jar",
+                        "Optional path to stegsolve.jar...",
+                        browse=self._on_image_stego_jar_browse,
+                    ),
+                    ComboOption(
+                        "image_stego_tool_combo",
+                        "Tool",
+                        (("zsteg", "zsteg"), ("steghide", "steghide"), ("all", "Run both")),
+                        "zsteg",
+                    ),
+                ),
+                run_label="Run Toolkit",
+                on_run=self._on_image_stego_run,
+                on_copy=self._on_image_stego_copy,
+            ),
+        )
 
     def _open_image_stego(self, tool) -> None:
+        self._ensure_pane("image_stego")
         self._active_tool = tool
-        self.image_stego_file_entry.set_text("")
+        self._bind_path_buffer(self.image_stego_file_entry)
         self.image_stego_password_entry.set_text("")
         self.image_stego_extract_check.set_active(False)
         self.image_stego_jar_entry.set_text("")
         self.image_stego_tool_combo.set_active(0)
-        self._set_text_view_text(self.image_stego_result_view, "")
+        self._cancel_zsteg_stream()
+        self._clear_result_text(self.image_stego_result_view)
         self.image_stego_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("image_stego")
         self.content_stack.set_visible_child_name("tool_detail")
@@ -5995,64 +6668,122 @@ class MainWindow:
         dialog.destroy()
 
     def _on_image_stego_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
-            return
-        path = self.image_stego_file_entry.get_text().strip()
+        if self._active_tool is None:
+            return
+        values = self._read_widgets(
+            "image_stego_file_entry",
+            "image_stego_password_entry",
+            "image_stego_extract_check",
+            "image_stego_jar_entry",
+            "image_stego_tool_combo",
+        )
+        path = values["image_stego_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose an image file"))
             return
-        password = self.image_stego_password_entry.get_text()
-        extract = "true" if self.image_stego_extract_check.get_active() else "false"
-        jar = self.image_stego_jar_entry.get_text().strip()
-        tool_choice = self.image_stego_tool_combo.get_active_id() or "zsteg"
+        password = values["image_stego_password_entry"]
+        extract = values["image_stego_extract_check"]
+        jar = values["image_stego_jar_entry"].strip()
+        tool_choice = values["image_stego_tool_combo"] or "zsteg"
         self.image_stego_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.image_stego_result_view, f"Running {tool_choice}…")
+        self._set_result_text(self.image_stego_result_view, f"Running {tool_choice}…")
 
-        def worker() -> None:
+        stego = self._active_tool_as(ImageStegoTool)
+        if tool_choice == "zsteg" and Path(path).expanduser().exists():
+            argv = stego.zsteg_argv(path)
+            if argv is not None:
+                self._start_zsteg_stream(argv)
+                return
+
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.image_stego_run_btn}
             try:
-                result = self._active_tool.run(
+                result = stego.run(
                     image_path=path,
                     steghide_password=password,
                     steghide_extract=extract,
                     stegsolve_jar=jar,
                     tool_choice=tool_choice,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.image_stego_result_view, body)
-                GLib.idle_add(self.image_stego_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.image_stego_result_view, text=body, copy_btn=self.image_stego_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.image_stego_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.image_stego_run_btn})
 
-    def _on_image_stego_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
+    def _start_zsteg_stream(self, argv: List[str]) -> None:
+        """Run zsteg via Gio.Subprocess and append its output line by line on the main loop."""
+        launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_MERGE)
+        launcher.setenv("LC_ALL", "C", False)
+        try:
+            proc = launcher.spawnv(argv)
+        except GLib.Error as exc:
+            self._show_error_toast(f"Error: {exc.message}")
+            self.image_stego_run_btn.set_sensitive(True)
             return
-        clipboard = display.get_clipboard()
-        buffer = self.image_stego_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._zsteg_proc = proc
+        self._zsteg_timeout_id = GLib.timeout_add_seconds(60, self._on_zsteg_timeout, proc)
+        self._set_result_text(self.image_stego_result_view, "=== ZSTEG ===\n")
+        stream = Gio.DataInputStream.new(proc.get_stdout_pipe())
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, self._on_zsteg_line, proc)
+
+    def _on_zsteg_line(self, stream: Gio.DataInputStream, result: Gio.AsyncResult, proc: Gio.Subprocess) -> None:
+        if self._zsteg_proc is not proc:
+            return
+        try:
+            line, _length = stream.read_line_finish(result)
+        except GLib.Error:
+            line = None
+        if line is None:
+            proc.wait_async(None, self._on_zsteg_exit)
+            return
+        # Lines past RESULT_DISPLAY_LIMIT are kept in the stash for Copy only.
+        self._append_result_text(self.image_stego_result_view, bytes(line).decode("utf-8", errors="replace") + "\n")
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, self._on_zsteg_line, proc)
+
+    def _on_zsteg_timeout(self, proc: Gio.Subprocess) -> bool:
+        self._zsteg_timeout_id = 0
+        self._append_result_text(self.image_stego_result_view, "timed_out: zsteg timed out after 60 seconds.\n")
+        proc.force_exit()
+        return False
+
+    def _on_zsteg_exit(self, proc: Gio.Subprocess, result: Gio.AsyncResult) -> None:
+        try:
+            proc.wait_finish(result)
+        except GLib.Error:
+            pass
+        if self._zsteg_proc is not proc:
+            return
+        self._zsteg_proc = None
+        if self._zsteg_timeout_id:
+            GLib.source_remove(self._zsteg_timeout_id)
+            self._zsteg_timeout_id = 0
+        if proc.get_if_exited():
+            self._append_result_text(self.image_stego_result_view, f"exit_code: {proc.get_exit_status()}")
+        self.image_stego_copy_btn.set_sensitive(True)
+        self.image_stego_run_btn.set_sensitive(True)
+
+    def _cancel_zsteg_stream(self) -> None:
+        proc = self._zsteg_proc
+        if proc is None:
+            return
+        self._zsteg_proc = None
+        if self._zsteg_timeout_id:
+            GLib.source_remove(self._zsteg_timeout_id)
+            self._zsteg_timeout_id = 0
+        proc.force_exit()
+        self.image_stego_run_btn.set_sensitive(True)
+
+    def _on_image_stego_copy(self, _btn: Gtk.Button) -> None:
+        self._copy_result_to_clipboard(self.image_stego_result_view)
 
     # ---------------------- EXIF metadata detail ----------------------
     def _build_exif_metadata_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("EXIF Metadata Viewer")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
+        form = self._build_tool_shell(
+            root, "exif", "EXIF Metadata Viewer", "Inspect Metadata", self._on_exif_run, self._on_exif_copy
+        )
 
         # Media file section
         media_label = Gtk.Label(label="Media File", xalign=0)
@@ -6066,7 +6797,7 @@ class MainWindow:
         self.exif_file_entry.set_hexpand(True)
         file_row.append(self.exif_file_entry)
         browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_exif_browse)
+        browse_btn.connect("clicked", lambda *_: self._browse_into(self.exif_file_entry, "Select media"))
         file_row.append(browse_btn)
         form.append(file_row)
 
@@ -6081,102 +6812,78 @@ class MainWindow:
         options_row.append(self.exif_prefer_check)
         form.append(options_row)
 
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.exif_run_btn = Gtk.Button(label="Inspect Metadata")
-        self.exif_run_btn.add_css_class("suggested-action")
-        self.exif_run_btn.connect("clicked", self._on_exif_run)
-        actions_row.append(self.exif_run_btn)
-        self.exif_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.exif_copy_btn.set_tooltip_text("Copy result")
-        self.exif_copy_btn.set_sensitive(False)
-        self.exif_copy_btn.connect("clicked", self._on_exif_copy)
-        actions_row.append(self.exif_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.exif_result_view = Gtk.TextView()
-        self.exif_result_view.add_css_class("output-text")
-        self.exif_result_view.set_editable(False)
-        self.exif_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.exif_result_view)
-        form.append(result_scroller)
-
     def _open_exif_metadata(self, tool) -> None:
+        self._ensure_pane("exif_metadata")
         self._active_tool = tool
         self.exif_file_entry.set_text("")
         self.exif_prefer_check.set_active(True)
-        self._set_text_view_text(self.exif_result_view, "")
+        self._clear_result_text(self.exif_result_view)
         self.exif_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("exif_metadata")
         self.content_stack.set_visible_child_name("tool_detail")
 
-    def _on_exif_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select media", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.exif_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
     def _on_exif_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         path = self.exif_file_entry.get_text().strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a file"))
             return
         prefer = "true" if self.exif_prefer_check.get_active() else "false"
+        tool = self._active_tool_as(ExifMetadataTool)
         self.exif_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.exif_result_view, "Collecting metadata…")
+        folder = Path(path).expanduser()
+        if folder.is_dir():
+            self.exif_copy_btn.set_sensitive(False)
+            self._clear_result_text(self.exif_result_view)
+            self._run_tool_task(
+                lambda: self._stream_exif_folder(tool, folder, prefer), {"run_btn": self.exif_run_btn}
+            )
+            return
+        self._set_result_text(self.exif_result_view, "Collecting metadata…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.exif_run_btn}
             try:
-                result = self._active_tool.run(file_path=path, prefer_exiftool=prefer)
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.exif_result_view, body)
-                GLib.idle_add(self.exif_copy_btn.set_sensitive, bool(body.strip()))
+                result = tool.run(file_path=path, prefer_exiftool=prefer)
+                body = result.body
+                updates.update(view=self.exif_result_view, text=body, copy_btn=self.exif_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.exif_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.exif_run_btn})
+
+    def _stream_exif_folder(self, tool: ExifMetadataTool, folder: Path, prefer: str) -> Dict[str, Any]:
+        """Append one metadata record per file in ``folder`` as each lookup finishes.
+
+        The final state goes through the same ``_post_ui`` queue as the
+        records, so the run button only comes back once every record queued
+        before it is shown; the task itself completes with no updates.
+        """
+        updates: Dict[str, Any] = {"run_btn": self.exif_run_btn}
+        try:
+            files = sorted(str(item) for item in folder.iterdir() if item.is_file())
+            if not files:
+                updates.update(view=self.exif_result_view, text="No files found in folder", copy_btn=self.exif_copy_btn)
+            else:
+                for result in tool.run_many(files, prefer):
+                    self._post_ui(
+                        self._append_result_text, self.exif_result_view, result.body + "\n", self.exif_copy_btn
+                    )
+        except Exception as exc:
+            updates["error"] = f"Error: {exc}"
+        self._post_ui(self._ui_apply, updates)
+        return {}
 
     def _on_exif_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.exif_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.exif_result_view)
 
     # ---------------------- Audio analyzer detail ----------------------
     def _build_audio_analyzer_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Audio Analyzer")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
+        form = self._build_tool_shell(
+            root, "audio", "Audio Analyzer", "Analyze Audio", self._on_audio_run, self._on_audio_copy
+        )
 
         # Audio file section
         audio_label = Gtk.Label(label="Audio File", xalign=0)
@@ -6190,7 +6897,7 @@ class MainWindow:
         self.audio_file_entry.set_hexpand(True)
         file_row.append(self.audio_file_entry)
         browse_btn = Gtk.Button(label="Browse…")
-        browse_btn.connect("clicked", self._on_audio_browse)
+        browse_btn.connect("clicked", lambda *_: self._browse_into(self.audio_file_entry, "Select audio"))
         file_row.append(browse_btn)
         form.append(file_row)
 
@@ -6216,63 +6923,27 @@ class MainWindow:
         self.audio_channel_combo.set_active_id("mixed")
         channel_row.append(self.audio_channel_combo)
         channel_row.append(Gtk.Label(label="Window (ms)", xalign=0))
-        self.audio_window_spin = Gtk.SpinButton()
-        self.audio_window_spin.set_adjustment(Gtk.Adjustment(lower=20, upper=500, step_increment=10, page_increment=50))
+        self.audio_window_spin = Gtk.SpinButton.new_with_range(20, 500, 10)
+        self.audio_window_spin.set_increments(10, 50)
         self.audio_window_spin.set_value(80)
         channel_row.append(self.audio_window_spin)
         form.append(channel_row)
 
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.audio_run_btn = Gtk.Button(label="Analyze Audio")
-        self.audio_run_btn.add_css_class("suggested-action")
-        self.audio_run_btn.connect("clicked", self._on_audio_run)
-        actions_row.append(self.audio_run_btn)
-        self.audio_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.audio_copy_btn.set_tooltip_text("Copy result")
-        self.audio_copy_btn.set_sensitive(False)
-        self.audio_copy_btn.connect("clicked", self._on_audio_copy)
-        actions_row.append(self.audio_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.audio_result_view = Gtk.TextView()
-        self.audio_result_view.add_css_class("output-text")
-        self.audio_result_view.set_editable(False)
-        self.audio_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.audio_result_view)
-        form.append(result_scroller)
-
     def _open_audio_analyzer(self, tool) -> None:
+        self._ensure_pane("audio_analyzer")
         self._active_tool = tool
         self.audio_file_entry.set_text("")
         self.audio_dtmf_check.set_active(True)
         self.audio_morse_check.set_active(False)
         self.audio_channel_combo.set_active_id("mixed")
         self.audio_window_spin.set_value(80)
-        self._set_text_view_text(self.audio_result_view, "")
+        self._clear_result_text(self.audio_result_view)
         self.audio_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("audio_analyzer")
         self.content_stack.set_visible_child_name("tool_detail")
 
-    def _on_audio_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select audio", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.audio_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
     def _on_audio_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         path = self.audio_file_entry.get_text().strip()
         if not path:
@@ -6283,9 +6954,10 @@ class MainWindow:
         channel = self.audio_channel_combo.get_active_id() or "mixed"
         window = str(int(self.audio_window_spin.get_value()))
         self.audio_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.audio_result_view, "Analyzing audio…")
+        self._set_result_text(self.audio_result_view, "Analyzing audio…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.audio_run_btn}
             try:
                 result = self._active_tool.run(
                     file_path=path,
@@ -6294,42 +6966,28 @@ class MainWindow:
                     channel=channel,
                     window_ms=window,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.audio_result_view, body)
-                GLib.idle_add(self.audio_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.audio_result_view, text=body, copy_btn=self.audio_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.audio_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.audio_run_btn})
 
     def _on_audio_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.audio_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.audio_result_view)
 
     # ---------------------- Video exporter detail ----------------------
     def _build_video_exporter_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("Video Frame Exporter")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
+        form = self._build_tool_shell(
+            root,
+            "video",
+            "Video Frame Exporter",
+            "Export Frames",
+            self._on_video_run,
+            self._on_video_copy,
+            result_heading=False,
+        )
 
         input_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         input_row.append(Gtk.Label(label="Video", xalign=0))
@@ -6338,7 +6996,7 @@ class MainWindow:
         self.video_input_entry.set_placeholder_text("Select a video file")
         input_row.append(self.video_input_entry)
         browse_input_btn = Gtk.Button(label="Browse…")
-        browse_input_btn.connect("clicked", self._on_video_input_browse)
+        browse_input_btn.connect("clicked", lambda *_: self._browse_into(self.video_input_entry, "Select video"))
         input_row.append(browse_input_btn)
         form.append(input_row)
 
@@ -6349,83 +7007,42 @@ class MainWindow:
         self.video_output_entry.set_placeholder_text("Optional destination for frames")
         output_row.append(self.video_output_entry)
         browse_output_btn = Gtk.Button(label="Browse…")
-        browse_output_btn.connect("clicked", self._on_video_output_browse)
+        browse_output_btn.connect(
+            "clicked",
+            lambda *_: self._browse_into(self.video_output_entry, "Select output folder", Gtk.FileChooserAction.SELECT_FOLDER),
+        )
         output_row.append(browse_output_btn)
         form.append(output_row)
 
         options_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         options_row.append(Gtk.Label(label="Interval (s)", xalign=0))
-        self.video_interval_spin = Gtk.SpinButton()
-        self.video_interval_spin.set_adjustment(Gtk.Adjustment(lower=0.1, upper=600, step_increment=0.1, page_increment=5))
+        self.video_interval_spin = Gtk.SpinButton.new_with_range(0.1, 600, 0.1)
         self.video_interval_spin.set_increments(0.1, 1.0)
-        self.video_interval_spin.set_digits(1)
         self.video_interval_spin.set_value(2.0)
         options_row.append(self.video_interval_spin)
         options_row.append(Gtk.Label(label="Max frames", xalign=0))
-        self.video_max_frames_spin = Gtk.SpinButton()
-        self.video_max_frames_spin.set_adjustment(Gtk.Adjustment(lower=0, upper=5000, step_increment=10, page_increment=100))
+        self.video_max_frames_spin = Gtk.SpinButton.new_with_range(0, 5000, 10)
         self.video_max_frames_spin.set_value(0)
         options_row.append(self.video_max_frames_spin)
         self.video_analyze_check = Gtk.CheckButton(label="Hash generated frames")
         options_row.append(self.video_analyze_check)
         form.append(options_row)
 
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.video_run_btn = Gtk.Button(label="Export Frames")
-        self.video_run_btn.add_css_class("suggested-action")
-        self.video_run_btn.connect("clicked", self._on_video_run)
-        actions_row.append(self.video_run_btn)
-        self.video_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.video_copy_btn.set_tooltip_text("Copy result")
-        self.video_copy_btn.set_sensitive(False)
-        self.video_copy_btn.connect("clicked", self._on_video_copy)
-        actions_row.append(self.video_copy_btn)
-        form.append(actions_row)
-
-        self.video_result_view = Gtk.TextView()
-        self.video_result_view.add_css_class("output-text")
-        self.video_result_view.set_editable(False)
-        self.video_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.video_result_view)
-        form.append(result_scroller)
-
     def _open_video_exporter(self, tool) -> None:
+        self._ensure_pane("video_frame_exporter")
         self._active_tool = tool
         self.video_input_entry.set_text("")
         self.video_output_entry.set_text("")
         self.video_interval_spin.set_value(2.0)
         self.video_max_frames_spin.set_value(0)
         self.video_analyze_check.set_active(False)
-        self._set_text_view_text(self.video_result_view, "")
+        self._clear_result_text(self.video_result_view)
         self.video_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("video_frame_exporter")
         self.content_stack.set_visible_child_name("tool_detail")
 
-    def _on_video_input_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select video", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.video_input_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
-    def _on_video_output_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select output folder", self.window, Gtk.FileChooserAction.SELECT_FOLDER, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.video_output_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
     def _on_video_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         input_path = self.video_input_entry.get_text().strip()
         if not input_path:
@@ -6436,53 +7053,74 @@ class MainWindow:
         max_frames = str(int(self.video_max_frames_spin.get_value()))
         analyse = "true" if self.video_analyze_check.get_active() else "false"
         self.video_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.video_result_view, "Exporting frames…")
+        self._set_result_text(self.video_result_view, "Exporting frames…")
 
-        def worker() -> None:
+        tool = self._active_tool_as(VideoFrameExporterTool)
+        try:
+            plan = tool.plan_export(input_path, output_dir, interval, max_frames, analyse)
+        except Exception as exc:
+            self._ui_apply({"run_btn": self.video_run_btn, "error": f"Error: {exc}"})
+            return
+        if plan.argv is not None:
+            self._run_tool_async(
+                plan.argv,
+                lambda code, stdout, stderr: self._on_video_export_done(plan, code, stdout, stderr),
+                timeout=EXPORT_TIMEOUT,
+                on_timeout=lambda message: self._on_video_export_done(plan, None, "", message, timed_out=True),
+            )
+            return
+
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.video_run_btn}
             try:
-                result = self._active_tool.run(
+                result = tool.run(
                     file_path=input_path,
                     output_dir=output_dir,
                     interval_seconds=interval,
                     max_frames=max_frames,
                     analyze_frames=analyse,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.video_result_view, body)
-                GLib.idle_add(self.video_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.video_result_view, text=body, copy_btn=self.video_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.video_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.video_run_btn})
+
+    def _on_video_export_done(
+        self, plan: FrameExportPlan, code: Optional[int], stdout: str, stderr: str, timed_out: bool = False
+    ) -> None:
+        if code is None and not timed_out:
+            error = f"ffmpeg failed: {stderr}" if stderr else None  # no stderr: cancelled
+            self._ui_apply({"run_btn": self.video_run_btn, "error": error})
+            self._clear_result_text(self.video_result_view)
+            return
+        tool = self._active_tool_as(VideoFrameExporterTool)
+
+        def worker() -> Dict[str, Any]:
+            # Hashing exported frames reads every PNG, so keep it off the main loop.
+            # A timed-out export still summarises the frames written so far.
+            updates: Dict[str, Any] = {"run_btn": self.video_run_btn}
+            if timed_out:
+                updates["error"] = stderr
+            try:
+                result = tool.finish_export(plan, code, stdout, stderr, timed_out=timed_out)
+                updates.update(view=self.video_result_view, text=result.body, copy_btn=self.video_copy_btn)
+            except Exception as exc:
+                updates["error"] = f"Error: {exc}"
+            return updates
+
+        self._run_tool_task(worker, {"run_btn": self.video_run_btn})
 
     def _on_video_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.video_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.video_result_view)
 
     # ---------------------- QR/Barcode scanner detail ----------------------
     def _build_qr_scanner_detail(self, root: Gtk.Box) -> None:
-        header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
-        back_btn.set_tooltip_text("Back to tools")
-        back_btn.connect("clicked", lambda *_: self._navigate_back_to_tools())
-        header_row.append(back_btn)
-        title = Gtk.Label(xalign=0)
-        title.add_css_class("title-3")
-        title.set_text("QR/Barcode Scanner")
-        header_row.append(title)
-        root.append(header_row)
-
-        clamp = Adw.Clamp(maximum_size=760, tightening_threshold=620)
-        root.append(clamp)
-        form = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        clamp.set_child(form)
+        form = self._build_tool_shell(
+            root, "qr", "QR/Barcode Scanner", "Scan Codes", self._on_qr_run, self._on_qr_copy
+        )
 
         # Target section
         target_section_label = Gtk.Label(label="Target", xalign=0)
@@ -6496,10 +7134,13 @@ class MainWindow:
         self.qr_target_entry.set_hexpand(True)
         target_row.append(self.qr_target_entry)
         browse_file_btn = Gtk.Button(label="File…")
-        browse_file_btn.connect("clicked", self._on_qr_browse_file)
+        browse_file_btn.connect("clicked", lambda *_: self._browse_into(self.qr_target_entry, "Select file"))
         target_row.append(browse_file_btn)
         browse_folder_btn = Gtk.Button(label="Folder…")
-        browse_folder_btn.connect("clicked", self._on_qr_browse_folder)
+        browse_folder_btn.connect(
+            "clicked",
+            lambda *_: self._browse_into(self.qr_target_entry, "Select folder", Gtk.FileChooserAction.SELECT_FOLDER),
+        )
         target_row.append(browse_folder_btn)
         form.append(target_row)
 
@@ -6515,65 +7156,19 @@ class MainWindow:
         options_row.append(self.qr_raw_check)
         form.append(options_row)
 
-        actions_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        self.qr_run_btn = Gtk.Button(label="Scan Codes")
-        self.qr_run_btn.add_css_class("suggested-action")
-        self.qr_run_btn.connect("clicked", self._on_qr_run)
-        actions_row.append(self.qr_run_btn)
-        self.qr_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
-        self.qr_copy_btn.set_tooltip_text("Copy result")
-        self.qr_copy_btn.set_sensitive(False)
-        self.qr_copy_btn.connect("clicked", self._on_qr_copy)
-        actions_row.append(self.qr_copy_btn)
-        form.append(actions_row)
-
-        # Result section
-        result_label = Gtk.Label(label="Result", xalign=0)
-        result_label.add_css_class("title-4")
-        form.append(result_label)
-
-        self.qr_result_view = Gtk.TextView()
-        self.qr_result_view.add_css_class("output-text")
-        self.qr_result_view.set_editable(False)
-        self.qr_result_view.set_monospace(True)
-        result_scroller = Gtk.ScrolledWindow()
-        result_scroller.add_css_class("output-box")
-        result_scroller.set_min_content_height(550)
-        result_scroller.set_child(self.qr_result_view)
-        form.append(result_scroller)
-
     def _open_qr_scanner(self, tool) -> None:
+        self._ensure_pane("qr_scanner")
         self._active_tool = tool
         self.qr_target_entry.set_text("")
         self.qr_recursive_check.set_active(False)
         self.qr_raw_check.set_active(False)
-        self._set_text_view_text(self.qr_result_view, "")
+        self._clear_result_text(self.qr_result_view)
         self.qr_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("qr_scanner")
         self.content_stack.set_visible_child_name("tool_detail")
 
-    def _on_qr_browse_file(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select file", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.qr_target_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
-    def _on_qr_browse_folder(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select folder", self.window, Gtk.FileChooserAction.SELECT_FOLDER, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.qr_target_entry.set_text(file.get_path() or "")
-        dialog.destroy()
-
     def _on_qr_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         target = self.qr_target_entry.get_text().strip()
         if not target:
@@ -6582,33 +7177,26 @@ class MainWindow:
         recursive = "true" if self.qr_recursive_check.get_active() else "false"
         raw = "true" if self.qr_raw_check.get_active() else "false"
         self.qr_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.qr_result_view, "Scanning for codes…")
+        self._set_result_text(self.qr_result_view, "Scanning for codes…")
 
-        def worker() -> None:
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.qr_run_btn}
             try:
                 result = self._active_tool.run(
                     target_path=target,
                     recursive=recursive,
                     include_raw_output=raw,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.qr_result_view, body)
-                GLib.idle_add(self.qr_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                updates.update(view=self.qr_result_view, text=body, copy_btn=self.qr_copy_btn)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.qr_run_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, {"run_btn": self.qr_run_btn})
 
-    def _on_qr_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.qr_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+    def _on_qr_copy(self, _btn: Gtk.Button) -> None:
+        self._copy_result_to_clipboard(self.qr_result_view)
 
     def _build_strings_detail(self, root: Gtk.Box) -> None:
         header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -6650,15 +7238,21 @@ class MainWindow:
 
         params_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         params_row.append(Gtk.Label(label="Min length", xalign=0))
-        self.strings_min_spin = Gtk.SpinButton()
-        self.strings_min_spin.set_adjustment(Gtk.Adjustment(lower=1, upper=32, step_increment=1, page_increment=2))
+        self.strings_min_spin = Gtk.SpinButton.new_with_range(1, 32, 1)
+        self.strings_min_spin.set_increments(1, 2)
         self.strings_min_spin.set_value(4)
         params_row.append(self.strings_min_spin)
         params_row.append(Gtk.Label(label="Limit", xalign=0))
-        self.strings_limit_spin = Gtk.SpinButton()
-        self.strings_limit_spin.set_adjustment(Gtk.Adjustment(lower=0, upper=500, step_increment=5, page_increment=20))
+        self.strings_limit_spin = Gtk.SpinButton.new_with_range(0, 500, 5)
+        self.strings_limit_spin.set_increments(5, 20)
         self.strings_limit_spin.set_value(0)
         params_row.append(self.strings_limit_spin)
+        params_row.append(Gtk.Label(label="Max lines", xalign=0))
+        self.strings_max_lines_spin = Gtk.SpinButton.new_with_range(1000, 1_000_000, 1000)
+        self.strings_max_lines_spin.set_increments(1000, 10_000)
+        self.strings_max_lines_spin.set_value(RESULT_MAX_LINES)
+        self.strings_max_lines_spin.set_tooltip_text("Older lines are dropped from view; Copy keeps everything")
+        params_row.append(self.strings_max_lines_spin)
         form.append(params_row)
 
         flags_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -6710,59 +7304,50 @@ class MainWindow:
         self.strings_file_entry.set_text("")
         self.strings_min_spin.set_value(4)
         self.strings_limit_spin.set_value(0)
+        self.strings_max_lines_spin.set_value(RESULT_MAX_LINES)
         self.strings_unicode_check.set_active(False)
         self.strings_unique_check.set_active(True)
         self.strings_search_entry.set_text("")
-        self.strings_result_view.get_buffer().set_text("")
+        self._clear_result_text(self.strings_result_view)
         self.strings_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("strings")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_strings_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select file", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.strings_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.strings_file_entry, "Select file")
 
     def _on_strings_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.strings_file_entry.get_text().strip()
+        path = self._entry_text(self.strings_file_entry)
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a file"))
             return
         self.strings_run_btn.set_sensitive(False)
-        self.strings_result_view.get_buffer().set_text("Extracting strings…")
-
-        min_len = str(int(self.strings_min_spin.get_value()))
-        limit = str(int(self.strings_limit_spin.get_value()))
-        unicode_flag = "true" if self.strings_unicode_check.get_active() else "false"
-        unique_flag = "true" if self.strings_unique_check.get_active() else "false"
-        search_term = self.strings_search_entry.get_text().strip()
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    min_length=min_len,
-                    unicode=unicode_flag,
-                    unique=unique_flag,
-                    search=search_term,
-                    limit=limit,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self.strings_result_view.get_buffer().set_text, body)
-                GLib.idle_add(self.strings_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.strings_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.strings_result_view, "Extracting strings…")
+
+        min_len = int(self.strings_min_spin.get_value())
+        limit = int(self.strings_limit_spin.get_value())
+        max_lines = int(self.strings_max_lines_spin.get_value())
+        unicode_flag = self.strings_unicode_check.get_active()
+        unique_flag = self.strings_unique_check.get_active()
+        search_term = self._entry_text(self.strings_search_entry)
+
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "file_path": path,
+                "min_length": min_len,
+                "unicode": unicode_flag,
+                "unique": unique_flag,
+                "search": search_term,
+                "limit": limit,
+            },
+            self.strings_result_view,
+            self.strings_copy_btn,
+            self.strings_run_btn,
+            max_lines,
+        )
 
     # ---------------------- Disassembler launcher detail ----------------------
     def _build_disassembler_detail(self, root: Gtk.Box) -> None:
@@ -6808,27 +7393,12 @@ class MainWindow:
         tool_grid.set_column_spacing(12)
         
         tool_grid.attach(Gtk.Label(label="Tool", xalign=0), 0, 0, 1, 1)
-        self.disassembler_tool_combo = Gtk.ComboBoxText()
-        self.disassembler_tool_combo.append("auto", "Auto (first available)")
-        self.disassembler_tool_combo.append("ghidra", "Ghidra")
-        self.disassembler_tool_combo.append("ghidra-headless", "Ghidra (headless)")
-        self.disassembler_tool_combo.append("ida", "IDA Pro")
-        self.disassembler_tool_combo.append("binaryninja", "Binary Ninja")
-        self.disassembler_tool_combo.append("hopper", "Hopper")
-        self.disassembler_tool_combo.append("cutter", "Cutter")
-        self.disassembler_tool_combo.append("rizin", "rizin")
-        self.disassembler_tool_combo.append("radare2", "radare2")
-        self.disassembler_tool_combo.set_active_id("auto")
+        self.disassembler_tool_combo = _option_dropdown(DISASSEMBLER_TOOL_OPTIONS)
         self.disassembler_tool_combo.set_hexpand(True)
         tool_grid.attach(self.disassembler_tool_combo, 1, 0, 1, 1)
 
         tool_grid.attach(Gtk.Label(label="Launch mode", xalign=0), 0, 1, 1, 1)
-        self.disassembler_mode_combo = Gtk.ComboBoxText()
-        self.disassembler_mode_combo.append("auto", "Auto")
-        self.disassembler_mode_combo.append("gui", "GUI")
-        self.disassembler_mode_combo.append("cli", "CLI")
-        self.disassembler_mode_combo.append("headless", "Headless")
-        self.disassembler_mode_combo.set_active_id("auto")
+        self.disassembler_mode_combo = _option_dropdown(DISASSEMBLER_MODE_OPTIONS)
         self.disassembler_mode_combo.set_hexpand(True)
         tool_grid.attach(self.disassembler_mode_combo, 1, 1, 1, 1)
         
@@ -6899,20 +7469,11 @@ class MainWindow:
         preview_grid.set_column_spacing(12)
         
         preview_grid.attach(Gtk.Label(label="Backend", xalign=0), 0, 0, 1, 1)
-        self.disassembler_preview_backend_combo = Gtk.ComboBoxText()
-        self.disassembler_preview_backend_combo.append("auto", "Auto")
-        self.disassembler_preview_backend_combo.append("objdump", "objdump")
-        self.disassembler_preview_backend_combo.append("radare2", "radare2")
-        self.disassembler_preview_backend_combo.append("rizin", "rizin")
-        self.disassembler_preview_backend_combo.set_active_id("auto")
+        self.disassembler_preview_backend_combo = _option_dropdown(PREVIEW_BACKEND_OPTIONS)
         preview_grid.attach(self.disassembler_preview_backend_combo, 1, 0, 1, 1)
         
         preview_grid.attach(Gtk.Label(label="Syntax", xalign=0), 2, 0, 1, 1)
-        self.disassembler_preview_syntax_combo = Gtk.ComboBoxText()
-        self.disassembler_preview_syntax_combo.append("auto", "Auto")
-        self.disassembler_preview_syntax_combo.append("intel", "Intel")
-        self.disassembler_preview_syntax_combo.append("att", "AT&T")
-        self.disassembler_preview_syntax_combo.set_active_id("auto")
+        self.disassembler_preview_syntax_combo = _option_dropdown(PREVIEW_SYNTAX_OPTIONS)
         preview_grid.attach(self.disassembler_preview_syntax_combo, 3, 0, 1, 1)
         
         preview_grid.attach(Gtk.Label(label="Instructions", xalign=0), 4, 0, 1, 1)
@@ -6943,9 +7504,10 @@ class MainWindow:
         self.disassembler_output_view = Gtk.TextView()
         self.disassembler_output_view.add_css_class("output-text")
         self.disassembler_output_view.set_editable(False)
-        self.disassembler_output_view.set_wrap_mode(Gtk.WrapMode.WORD)
+        self.disassembler_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         self.disassembler_output_view.set_monospace(True)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.disassembler_output_view)
@@ -6954,17 +7516,17 @@ class MainWindow:
     def _open_disassembler(self, tool) -> None:
         self._active_tool = tool
         self.disassembler_file_entry.set_text("")
-        self.disassembler_tool_combo.set_active_id("auto")
-        self.disassembler_mode_combo.set_active_id("auto")
+        self.disassembler_tool_combo.set_selected(0)
+        self.disassembler_mode_combo.set_selected(0)
         self.disassembler_list_check.set_active(False)
         self.disassembler_extra_entry.set_text("")
         self.disassembler_script_entry.set_text("")
         self.disassembler_workdir_entry.set_text("")
         self.disassembler_project_entry.set_text("")
-        self.disassembler_preview_backend_combo.set_active_id("auto")
-        self.disassembler_preview_syntax_combo.set_active_id("auto")
+        self.disassembler_preview_backend_combo.set_selected(0)
+        self.disassembler_preview_syntax_combo.set_selected(0)
         self.disassembler_preview_count_spin.set_value(400)
-        self._set_text_view_text(self.disassembler_output_view, "")
+        self._clear_result_text(self.disassembler_output_view)
         self.disassembler_copy_btn.set_sensitive(False)
         self.disassembler_launch_btn.set_sensitive(True)
         self.disassembler_preview_btn.set_sensitive(True)
@@ -6972,92 +7534,100 @@ class MainWindow:
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_disassembler_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select binary", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.disassembler_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.disassembler_file_entry, "Select binary")
 
     def _on_disassembler_workdir_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select working directory", self.window, Gtk.FileChooserAction.SELECT_FOLDER, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            folder = dialog.get_file()
-            if folder:
-                self.disassembler_workdir_entry.set_text(folder.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.disassembler_workdir_entry, "Select working directory", Gtk.FileChooserAction.SELECT_FOLDER)
 
     def _on_disassembler_script_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select script", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.disassembler_script_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.disassembler_script_entry, "Select script")
 
     def _on_disassembler_project_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select project directory", self.window, Gtk.FileChooserAction.SELECT_FOLDER, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            folder = dialog.get_file()
-            if folder:
-                self.disassembler_project_entry.set_text(folder.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.disassembler_project_entry, "Select project directory", Gtk.FileChooserAction.SELECT_FOLDER)
 
     def _on_disassembler_launch(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.disassembler_file_entry.get_text().strip()
+        path = self._entry_text(self.disassembler_file_entry)
         listing_only = self.disassembler_list_check.get_active()
         if not listing_only and not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary to launch"))
             return
-        preferred = self.disassembler_tool_combo.get_active_id() or "auto"
-        extra = self.disassembler_extra_entry.get_text().strip()
-        workdir = self.disassembler_workdir_entry.get_text().strip()
-        mode = self.disassembler_mode_combo.get_active_id() or "auto"
-        script = self.disassembler_script_entry.get_text().strip()
-        project_dir = self.disassembler_project_entry.get_text().strip()
-        list_flag = "true" if listing_only else "false"
+        preferred = _selected_option(self.disassembler_tool_combo, DISASSEMBLER_TOOL_OPTIONS)
+        extra = self._entry_text(self.disassembler_extra_entry)
+        workdir = self._entry_text(self.disassembler_workdir_entry)
+        mode = _selected_option(self.disassembler_mode_combo, DISASSEMBLER_MODE_OPTIONS)
+        script = self._entry_text(self.disassembler_script_entry)
+        project_dir = self._entry_text(self.disassembler_project_entry)
         self.disassembler_launch_btn.set_sensitive(False)
         busy_text = "Listing available disassemblers…" if listing_only else "Launching disassembler…"
-        self._set_text_view_text(self.disassembler_output_view, busy_text)
+        self._reset_result_text(self.disassembler_output_view, busy_text)
 
-        def worker() -> None:
+        tool = self._active_tool_as(DisassemblerLauncher)
+
+        def worker() -> Dict[str, Any]:
+            updates: Dict[str, Any] = {"run_btn": self.disassembler_launch_btn}
             try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    preferred=preferred,
-                    extra=extra,
-                    workdir=workdir,
-                    mode=mode,
-                    script=script,
-                    project_dir=project_dir,
-                    list_available=list_flag,
+                if listing_only:
+                    result = tool.run(
+                        file_path=path,
+                        preferred=preferred,
+                        extra=extra,
+                        workdir=workdir,
+                        mode=mode,
+                        script=script,
+                        project_dir=project_dir,
+                        list_available=listing_only,
+                    )
+                else:
+                    # Planning scans PATH for every candidate, so it runs here
+                    # once and the plan is either streamed or spawned.
+                    plan = tool.plan_launch(path, preferred, extra, workdir, mode, script, project_dir)
+                    if plan.execution_mode == "capture":
+                        self._post_ui(self._start_disassembler_capture, tool, plan)
+                        return {}
+                    result = tool.spawn(plan)
+                body = result.body
+                updates.update(
+                    view=self.disassembler_output_view,
+                    text=body,
+                    max_lines=RESULT_MAX_LINES,
+                    copy_btn=self.disassembler_copy_btn,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.disassembler_output_view, body)
-                GLib.idle_add(self.disassembler_copy_btn.set_sensitive, bool(body.strip()))
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.disassembler_launch_btn.set_sensitive, True)
+                updates["error"] = f"Error: {exc}"
+            return updates
+
+        self._run_tool_task(worker, {"run_btn": self.disassembler_launch_btn})
+
+    def _start_disassembler_capture(self, tool: DisassemblerLauncher, plan: LaunchPlan) -> None:
+        # CLI disassemblers can run for minutes; show their output live.
+        view = self.disassembler_output_view
+        self._begin_result_stream(view, self.disassembler_copy_btn)
+        self._append_result_text(view, tool.capture_header(plan), None, RESULT_MAX_LINES)
+        self._stream_tool_async(
+            plan.argv,
+            lambda text: self._append_result_text(view, text, None, RESULT_MAX_LINES),
+            lambda code, message: self._on_disassembler_capture_done(tool, plan, code, message),
+            cwd=str(plan.cwd),
+        )
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _on_disassembler_capture_done(
+        self, tool: DisassemblerLauncher, plan: LaunchPlan, code: Optional[int], message: str
+    ) -> None:
+        view = self.disassembler_output_view
+        if code is None and not message:
+            self._append_result_text(view, "\n(cancelled)", None, RESULT_MAX_LINES)
+        elif code is None:
+            self._append_result_text(view, f"\n[{message}]\n", None, RESULT_MAX_LINES)
+            self._show_error_toast(f"Error: {message}")
+        else:
+            self._append_result_text(view, tool.capture_footer(plan, code), None, RESULT_MAX_LINES)
+        self._end_result_stream(view, self.disassembler_copy_btn)
+        self.disassembler_launch_btn.set_sensitive(True)
 
     def _on_disassembler_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.disassembler_output_view))
+        self._copy_result_to_clipboard(self.disassembler_output_view)
 
     def _on_disassembler_preview(self, _btn: Gtk.Button) -> None:
         if not getattr(self, "quick_disassembler", None):
@@ -7066,21 +7636,16 @@ class MainWindow:
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary to disassemble"))
             return
-        backend = self.disassembler_preview_backend_combo.get_active_id() or "auto"
-        syntax = self.disassembler_preview_syntax_combo.get_active_id() or "auto"
-        count = str(int(self.disassembler_preview_count_spin.get_value()))
+        backend = _selected_option(self.disassembler_preview_backend_combo, PREVIEW_BACKEND_OPTIONS)
+        syntax = _selected_option(self.disassembler_preview_syntax_combo, PREVIEW_SYNTAX_OPTIONS)
+        count = int(self.disassembler_preview_count_spin.get_value())
         self.disassembler_preview_btn.set_sensitive(False)
-        self._ensure_disassembly_preview_window()
-        if self.disassembly_preview_window:
-            self.disassembly_preview_window.present()
-        if self.disassembly_preview_view:
-            self._set_text_view_text(self.disassembly_preview_view, "Generating disassembly…")
-        if self.disassembly_preview_status_label:
-            self.disassembly_preview_status_label.set_text("Working…")
-        if self.disassembly_preview_copy_btn:
-            self.disassembly_preview_copy_btn.set_sensitive(False)
-        if self.disassembly_preview_search:
-            self.disassembly_preview_search.set_text("")
+        preview = self._ensure_disassembly_preview_window()
+        preview.window.present()
+        self._set_result_text(preview.view, "Generating disassembly…")
+        preview.status_label.set_text("Working…")
+        preview.copy_btn.set_sensitive(False)
+        preview.search.set_text("")
 
         def worker() -> None:
             try:
@@ -7090,17 +7655,17 @@ class MainWindow:
                     max_instructions=count,
                     syntax=syntax,
                 )
-                GLib.idle_add(self._update_disassembly_preview, result.title, result.body)
+                self._post_ui(self._update_disassembly_preview, result.title, result.body)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.disassembler_preview_btn.set_sensitive, True)
+                self._post_ui(self.disassembler_preview_btn.set_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
-    def _ensure_disassembly_preview_window(self) -> None:
-        if self.disassembly_preview_window is not None:
-            return
+    def _ensure_disassembly_preview_window(self) -> DisassemblyPreview:
+        if self._disassembly_preview is not None:
+            return self._disassembly_preview
         window = Adw.ApplicationWindow(application=self.app)
         window.set_transient_for(self.window)
         window.set_title("Quick Disassembly")
@@ -7124,7 +7689,9 @@ class MainWindow:
         search_entry = Gtk.SearchEntry()
         search_entry.set_hexpand(True)
         search_entry.set_placeholder_text("Find text…")
-        search_entry.connect("search-changed", self._on_disassembly_preview_search)
+        # Debounced by hand on "changed" so the delay is not stacked on
+        # SearchEntry's own search-changed delay.
+        search_entry.connect("changed", self._on_disassembly_preview_search)
         search_row.append(search_entry)
         copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
         copy_btn.set_tooltip_text("Copy disassembly")
@@ -7138,76 +7705,146 @@ class MainWindow:
         status_label.set_text("Ready")
         content.append(status_label)
 
-        text_view = Gtk.TextView()
+        if GtkSource is not None:
+            buffer = GtkSource.Buffer()
+            text_view = GtkSource.View.new_with_buffer(buffer)
+            settings = GtkSource.SearchSettings(case_sensitive=False, wrap_around=True)
+            preview = DisassemblyPreview(
+                window,
+                text_view,
+                search_entry,
+                status_label,
+                copy_btn,
+                search_settings=settings,
+                search_ctx=GtkSource.SearchContext.new(buffer, settings),
+            )
+        else:
+            text_view = Gtk.TextView()
+            tag = text_view.get_buffer().create_tag(
+                "disassembly-highlight",
+                background="#f9f06b",
+            )
+            preview = DisassemblyPreview(window, text_view, search_entry, status_label, copy_btn, highlight_tag=tag)
         text_view.set_editable(False)
         text_view.set_wrap_mode(Gtk.WrapMode.NONE)
         text_view.set_monospace(True)
-        buffer = text_view.get_buffer()
-        self._disassembly_preview_highlight_tag = buffer.create_tag(
-            "disassembly-highlight",
-            background="#f9f06b",
-        )
         scroll = Gtk.ScrolledWindow()
         scroll.set_hexpand(True)
         scroll.set_vexpand(True)
         scroll.set_child(text_view)
         content.append(scroll)
 
-        self.disassembly_preview_window = window
-        self.disassembly_preview_view = text_view
-        self.disassembly_preview_search = search_entry
-        self.disassembly_preview_status_label = status_label
-        self.disassembly_preview_copy_btn = copy_btn
+        self._disassembly_preview = preview
+        return preview
 
     def _update_disassembly_preview(self, title: str, body: str) -> bool:
-        if self.disassembly_preview_status_label:
-            self.disassembly_preview_status_label.set_text(title)
-        if self.disassembly_preview_view:
-            self._set_text_view_text(self.disassembly_preview_view, body)
-        if self.disassembly_preview_copy_btn:
-            self.disassembly_preview_copy_btn.set_sensitive(bool(body.strip()))
+        preview = self._disassembly_preview
+        if preview is None:
+            return False
+        preview.status_label.set_text(title)
+        self._set_result_text(preview.view, body)
+        preview.copy_btn.set_sensitive(bool(body) and not body.isspace())
+        preview.reset_search()
         self._clear_disassembly_highlight()
         return False
 
     def _on_disassembly_preview_search(self, entry: Gtk.SearchEntry) -> None:
-        if not self.disassembly_preview_view:
-            return
-        buffer = self.disassembly_preview_view.get_buffer()
+        if self._preview_search_source_id:
+            GLib.source_remove(self._preview_search_source_id)
+        self._preview_search_source_id = GLib.timeout_add(150, self._do_preview_search, entry.get_text())
+
+    def _do_preview_search(self, text: str) -> bool:
+        self._preview_search_source_id = 0
+        preview = self._disassembly_preview
+        if preview is None:
+            return GLib.SOURCE_REMOVE
+        query = text.strip()
+        if preview.search_ctx is not None:
+            self._search_disassembly_preview_source(preview, query)
+            return GLib.SOURCE_REMOVE
+        buffer = preview.view.get_buffer()
         start = buffer.get_start_iter()
         end = buffer.get_end_iter()
-        if self._disassembly_preview_highlight_tag:
-            buffer.remove_tag(self._disassembly_preview_highlight_tag, start, end)
-        query = entry.get_text().strip()
+        tag = preview.highlight_tag
+        buffer.remove_tag(tag, start, end)
         if not query:
+            preview.last_query = ""
+            buffer.select_range(start, start)
+            return GLib.SOURCE_REMOVE
+        if preview.haystack is None:
+            text = buffer.get_text(start, end, False)
+            preview.haystack = text.lower()
+            # Lower-casing can change some character counts; offsets must stay
+            # aligned with the buffer, so such text is matched case-sensitively.
+            preview.fold_case = len(preview.haystack) == len(text)
+            if not preview.fold_case:
+                preview.haystack = text
+        haystack = preview.haystack
+        needle = query.lower() if preview.fold_case else query
+        offsets = match_offsets(haystack, needle, preview.last_query, preview.match_offsets)
+        preview.last_query = needle
+        preview.match_offsets = offsets
+        if not offsets:
+            return GLib.SOURCE_REMOVE
+        for index in offsets:
+            buffer.apply_tag(tag, buffer.get_iter_at_offset(index), buffer.get_iter_at_offset(index + len(needle)))
+        resume = 0
+        if preview.last_match is not None:
+            resume = buffer.get_iter_at_mark(preview.last_match).get_offset()
+        index = offsets[bisect.bisect_left(offsets, resume) % len(offsets)]
+        match_start = buffer.get_iter_at_offset(index)
+        buffer.select_range(match_start, buffer.get_iter_at_offset(index + len(needle)))
+        self._remember_preview_match(preview, match_start)
+        preview.view.scroll_to_iter(match_start, 0.2, True, 0.5, 0.1)
+        return GLib.SOURCE_REMOVE
+
+    def _remember_preview_match(self, preview: DisassemblyPreview, match_start: Gtk.TextIter) -> None:
+        # A mark survives buffer edits where a TextIter would be invalidated.
+        buffer = preview.view.get_buffer()
+        if preview.last_match is None:
+            preview.last_match = buffer.create_mark(None, match_start, True)
+        else:
+            buffer.move_mark(preview.last_match, match_start)
+
+    def _search_disassembly_preview_source(self, preview: DisassemblyPreview, query: str) -> None:
+        """Search through the GtkSource context, which highlights every match itself."""
+        buffer = preview.view.get_buffer()
+        preview.search_settings.set_search_text(query or None)
+        if not query:
+            start = buffer.get_start_iter()
             buffer.select_range(start, start)
             return
-        result = start.forward_search(query, Gtk.TextSearchFlags.CASE_INSENSITIVE, end)
-        if not result:
-            return
-        match_start, match_end = result
-        if self._disassembly_preview_highlight_tag:
-            buffer.apply_tag(self._disassembly_preview_highlight_tag, match_start, match_end)
-        buffer.select_range(match_start, match_end)
-        self.disassembly_preview_view.scroll_to_iter(match_start, 0.2, True, 0.5, 0.1)
+        context = preview.search_ctx
+
+        def on_found(_ctx: Any, result: Gio.AsyncResult) -> None:
+            try:
+                found, match_start, match_end, _wrapped = context.forward_finish(result)
+            except GLib.Error:
+                return
+            if not found:
+                return
+            buffer.select_range(match_start, match_end)
+            self._remember_preview_match(preview, match_start)
+            preview.view.scroll_to_iter(match_start, 0.2, True, 0.5, 0.1)
+
+        resume = buffer.get_start_iter()
+        if preview.last_match is not None:
+            resume = buffer.get_iter_at_mark(preview.last_match)
+        context.forward_async(resume, None, on_found)
 
     def _clear_disassembly_highlight(self) -> None:
-        if not self.disassembly_preview_view or not self._disassembly_preview_highlight_tag:
+        preview = self._disassembly_preview
+        if preview is None:
             return
-        buffer = self.disassembly_preview_view.get_buffer()
-        buffer.remove_tag(
-            self._disassembly_preview_highlight_tag,
-            buffer.get_start_iter(),
-            buffer.get_end_iter(),
-        )
+        if preview.search_settings is not None:
+            preview.search_settings.set_search_text(None)
+            return
+        buffer = preview.view.get_buffer()
+        buffer.remove_tag(preview.highlight_tag, buffer.get_start_iter(), buffer.get_end_iter())
 
     def _on_disassembly_preview_copy(self, _btn: Gtk.Button) -> None:
-        if not self.disassembly_preview_view:
-            return
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.disassembly_preview_view))
+        if self._disassembly_preview is not None:
+            self._copy_result_to_clipboard(self._disassembly_preview.view)
 
     # ---------------------- Rizin console detail ----------------------
     def _build_rizin_console_detail(self, root: Gtk.Box) -> None:
@@ -7262,11 +7899,7 @@ class MainWindow:
 
         options_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         options_row.append(Gtk.Label(label="Tool", xalign=0))
-        self.rizin_tool_combo = Gtk.ComboBoxText()
-        self.rizin_tool_combo.append("auto", "Auto")
-        self.rizin_tool_combo.append("rizin", "rizin")
-        self.rizin_tool_combo.append("radare2", "radare2")
-        self.rizin_tool_combo.set_active_id("auto")
+        self.rizin_tool_combo = _option_dropdown(RIZIN_TOOL_OPTIONS)
         options_row.append(self.rizin_tool_combo)
         self.rizin_quiet_check = Gtk.CheckButton(label="Quiet mode")
         self.rizin_quiet_check.set_active(True)
@@ -7278,6 +7911,10 @@ class MainWindow:
         self.rizin_run_btn.add_css_class("suggested-action")
         self.rizin_run_btn.connect("clicked", self._on_rizin_run)
         actions_row.append(self.rizin_run_btn)
+        self.rizin_cancel_btn = Gtk.Button(label="Cancel")
+        self.rizin_cancel_btn.set_sensitive(False)
+        self.rizin_cancel_btn.connect("clicked", self._on_stream_cancel)
+        actions_row.append(self.rizin_cancel_btn)
         self.rizin_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
         self.rizin_copy_btn.set_tooltip_text("Copy output")
         self.rizin_copy_btn.set_sensitive(False)
@@ -7294,72 +7931,60 @@ class MainWindow:
         self.rizin_output_view.add_css_class("output-text")
         self.rizin_output_view.set_editable(False)
         self.rizin_output_view.set_monospace(True)
-        self.rizin_output_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.rizin_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.rizin_output_view)
         form.append(output_scroll)
 
     def _open_rizin_console(self, tool) -> None:
+        self._ensure_pane("rizin_console")
         self._active_tool = tool
         self.rizin_file_entry.set_text("")
         self._set_text_view_text(self.rizin_commands_view, "aaa\ns main\npdf @ main")
-        self.rizin_tool_combo.set_active_id("auto")
+        self.rizin_tool_combo.set_selected(0)
         self.rizin_quiet_check.set_active(True)
-        self._set_text_view_text(self.rizin_output_view, "")
+        self._clear_result_text(self.rizin_output_view)
         self.rizin_copy_btn.set_sensitive(False)
         self.rizin_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("rizin_console")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_rizin_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select binary", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.rizin_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.rizin_file_entry, "Select binary")
 
     def _on_rizin_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.rizin_file_entry.get_text().strip()
+        path = self._entry_text(self.rizin_file_entry)
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary to analyze"))
             return
         commands = self._get_text_view_text(self.rizin_commands_view)
-        tool_choice = self.rizin_tool_combo.get_active_id() or "auto"
-        quiet = "true" if self.rizin_quiet_check.get_active() else "false"
+        tool_choice = _selected_option(self.rizin_tool_combo, RIZIN_TOOL_OPTIONS)
+        quiet = self.rizin_quiet_check.get_active()
         self.rizin_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.rizin_output_view, "Running commands…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    commands=commands,
-                    tool=tool_choice,
-                    quiet=quiet,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.rizin_output_view, body)
-                GLib.idle_add(self.rizin_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.rizin_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.rizin_output_view, "Running commands…")
+
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "file_path": path,
+                "commands": commands,
+                "tool": tool_choice,
+                "quiet": quiet,
+            },
+            self.rizin_output_view,
+            self.rizin_copy_btn,
+            self.rizin_run_btn,
+            RESULT_MAX_LINES,
+            self.rizin_cancel_btn,
+        )
 
     def _on_rizin_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.rizin_output_view))
+        self._copy_result_to_clipboard(self.rizin_output_view)
 
     # ---------------------- GDB runner detail ----------------------
     def _build_gdb_runner_detail(self, root: Gtk.Box) -> None:
@@ -7456,6 +8081,10 @@ class MainWindow:
         self.gdb_run_btn.add_css_class("suggested-action")
         self.gdb_run_btn.connect("clicked", self._on_gdb_run)
         actions_row.append(self.gdb_run_btn)
+        self.gdb_cancel_btn = Gtk.Button(label="Cancel")
+        self.gdb_cancel_btn.set_sensitive(False)
+        self.gdb_cancel_btn.connect("clicked", self._on_stream_cancel)
+        actions_row.append(self.gdb_cancel_btn)
         self.gdb_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
         self.gdb_copy_btn.set_tooltip_text("Copy output")
         self.gdb_copy_btn.set_sensitive(False)
@@ -7471,15 +8100,17 @@ class MainWindow:
         self.gdb_output_view = Gtk.TextView()
         self.gdb_output_view.add_css_class("output-text")
         self.gdb_output_view.set_editable(False)
-        self.gdb_output_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.gdb_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         self.gdb_output_view.set_monospace(True)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.gdb_output_view)
         form.append(output_scroll)
 
     def _open_gdb_runner(self, tool) -> None:
+        self._ensure_pane("gdb_runner")
         self._active_tool = tool
         self.gdb_file_entry.set_text("")
         self.gdb_args_entry.set_text("")
@@ -7488,65 +8119,51 @@ class MainWindow:
         self._set_text_view_text(self.gdb_breakpoints_view, "")
         self._set_text_view_text(self.gdb_commands_view, "info registers\nbacktrace\ninfo shared")
         self._set_text_view_text(self.gdb_additional_view, "")
-        self._set_text_view_text(self.gdb_output_view, "")
+        self._clear_result_text(self.gdb_output_view)
         self.gdb_copy_btn.set_sensitive(False)
         self.gdb_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("gdb_runner")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_gdb_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select binary", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.gdb_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.gdb_file_entry, "Select binary")
 
     def _on_gdb_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.gdb_file_entry.get_text().strip()
+        values = self._read_widgets("gdb_file_entry", "gdb_args_entry", "gdb_attach_entry", "gdb_stop_check")
+        path = values["gdb_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary to debug"))
             return
         breakpoints = self._get_text_view_text(self.gdb_breakpoints_view)
         commands = self._get_text_view_text(self.gdb_commands_view)
-        run_args = self.gdb_args_entry.get_text().strip()
-        attach_pid = self.gdb_attach_entry.get_text().strip()
+        run_args = values["gdb_args_entry"].strip()
+        attach_pid = values["gdb_attach_entry"].strip()
         additional = self._get_text_view_text(self.gdb_additional_view)
-        stop_flag = "true" if self.gdb_stop_check.get_active() else "false"
         self.gdb_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.gdb_output_view, "Running gdb…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    breakpoints=breakpoints,
-                    run_args=run_args,
-                    commands=commands,
-                    stop_on_entry=stop_flag,
-                    attach_pid=attach_pid,
-                    additional_files=additional,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.gdb_output_view, body)
-                GLib.idle_add(self.gdb_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.gdb_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.gdb_output_view, "Running gdb…")
+
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "file_path": path,
+                "breakpoints": breakpoints,
+                "run_args": run_args,
+                "commands": commands,
+                "stop_on_entry": values["gdb_stop_check"],
+                "attach_pid": attach_pid,
+                "additional_files": additional,
+            },
+            self.gdb_output_view,
+            self.gdb_copy_btn,
+            self.gdb_run_btn,
+            RESULT_MAX_LINES,
+            self.gdb_cancel_btn,
+        )
 
     def _on_gdb_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.gdb_output_view))
+        self._copy_result_to_clipboard(self.gdb_output_view)
 
     # ---------------------- ROP gadget detail ----------------------
     def _build_rop_gadget_detail(self, root: Gtk.Box) -> None:
@@ -7602,12 +8219,7 @@ class MainWindow:
 
         tool_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         tool_row.append(Gtk.Label(label="Tool", xalign=0))
-        self.rop_tool_combo = Gtk.ComboBoxText()
-        self.rop_tool_combo.append("auto", "Auto")
-        self.rop_tool_combo.append("ropgadget", "ROPgadget")
-        self.rop_tool_combo.append("ropper", "ropper")
-        self.rop_tool_combo.append("rizin", "rizin")
-        self.rop_tool_combo.set_active_id("auto")
+        self.rop_tool_combo = _option_dropdown(ROP_TOOL_OPTIONS)
         tool_row.append(self.rop_tool_combo)
         self.rop_run_all_check = Gtk.CheckButton(label="Run all detected")
         tool_row.append(self.rop_run_all_check)
@@ -7615,15 +8227,7 @@ class MainWindow:
 
         arch_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         arch_row.append(Gtk.Label(label="Architecture", xalign=0))
-        self.rop_arch_combo = Gtk.ComboBoxText()
-        self.rop_arch_combo.append("auto", "Auto")
-        self.rop_arch_combo.append("x86", "x86 (32-bit)")
-        self.rop_arch_combo.append("x86_64", "x86_64")
-        self.rop_arch_combo.append("arm", "ARM 32")
-        self.rop_arch_combo.append("arm64", "ARM64 / AArch64")
-        self.rop_arch_combo.append("mips", "MIPS")
-        self.rop_arch_combo.append("riscv64", "RISC-V 64")
-        self.rop_arch_combo.set_active_id("auto")
+        self.rop_arch_combo = _option_dropdown(ROP_ARCH_OPTIONS)
         arch_row.append(self.rop_arch_combo)
         arch_row.append(Gtk.Label(label="Limit lines", xalign=0))
         self.rop_limit_spin = Gtk.SpinButton()
@@ -7639,6 +8243,10 @@ class MainWindow:
         self.rop_run_btn.add_css_class("suggested-action")
         self.rop_run_btn.connect("clicked", self._on_rop_run)
         actions_row.append(self.rop_run_btn)
+        self.rop_cancel_btn = Gtk.Button(label="Cancel")
+        self.rop_cancel_btn.set_sensitive(False)
+        self.rop_cancel_btn.connect("clicked", self._on_stream_cancel)
+        actions_row.append(self.rop_cancel_btn)
         self.rop_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
         self.rop_copy_btn.set_tooltip_text("Copy output")
         self.rop_copy_btn.set_sensitive(False)
@@ -7655,79 +8263,70 @@ class MainWindow:
         self.rop_output_view.add_css_class("output-text")
         self.rop_output_view.set_editable(False)
         self.rop_output_view.set_monospace(True)
-        self.rop_output_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.rop_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.rop_output_view)
         form.append(output_scroll)
 
     def _open_rop_gadget(self, tool) -> None:
+        self._ensure_pane("rop_gadget")
         self._active_tool = tool
         self.rop_file_entry.set_text("")
         self.rop_search_entry.set_text("")
         self.rop_depth_spin.set_value(6)
-        self.rop_tool_combo.set_active_id("auto")
+        self.rop_tool_combo.set_selected(0)
         self.rop_run_all_check.set_active(False)
-        self.rop_arch_combo.set_active_id("auto")
+        self.rop_arch_combo.set_selected(0)
         self.rop_limit_spin.set_value(0)
-        self._set_text_view_text(self.rop_output_view, "")
+        self._clear_result_text(self.rop_output_view)
         self.rop_copy_btn.set_sensitive(False)
         self.rop_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("rop_gadget")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_rop_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select binary", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.rop_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.rop_file_entry, "Select binary")
 
     def _on_rop_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        path = self.rop_file_entry.get_text().strip()
+        values = self._read_widgets(
+            "rop_file_entry", "rop_search_entry", "rop_depth_spin", "rop_run_all_check", "rop_limit_spin"
+        )
+        path = values["rop_file_entry"].strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary"))
             return
-        search = self.rop_search_entry.get_text().strip()
-        depth = str(int(self.rop_depth_spin.get_value()))
-        tool_choice = "all" if self.rop_run_all_check.get_active() else (self.rop_tool_combo.get_active_id() or "auto")
-        architecture = self.rop_arch_combo.get_active_id() or "auto"
-        limit = str(int(self.rop_limit_spin.get_value()))
+        search = values["rop_search_entry"].strip()
+        tool_choice = (
+            "all" if values["rop_run_all_check"] else _selected_option(self.rop_tool_combo, ROP_TOOL_OPTIONS)
+        )
+        architecture = _selected_option(self.rop_arch_combo, ROP_ARCH_OPTIONS)
         self.rop_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.rop_output_view, "Finding gadgets…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    search=search,
-                    max_depth=depth,
-                    tool=tool_choice,
-                    architecture=architecture,
-                    limit=limit,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.rop_output_view, body)
-                GLib.idle_add(self.rop_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.rop_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.rop_output_view, "Finding gadgets…")
+
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "file_path": path,
+                "search": search,
+                "max_depth": values["rop_depth_spin"],
+                "tool": tool_choice,
+                "architecture": architecture,
+                "limit": values["rop_limit_spin"],
+            },
+            self.rop_output_view,
+            self.rop_copy_btn,
+            self.rop_run_btn,
+            RESULT_MAX_LINES,
+            self.rop_cancel_btn,
+        )
 
     def _on_rop_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.rop_output_view))
+        self._copy_result_to_clipboard(self.rop_output_view)
 
     # ---------------------- Binary diff detail ----------------------
     def _build_binary_diff_detail(self, root: Gtk.Box) -> None:
@@ -7761,7 +8360,7 @@ class MainWindow:
         self.bindiff_original_entry.set_hexpand(True)
         orig_row.append(self.bindiff_original_entry)
         orig_btn = Gtk.Button(label="Browse…")
-        orig_btn.connect("clicked", lambda btn: self._on_bindiff_browse(btn, self.bindiff_original_entry))
+        orig_btn.connect("clicked", self._on_bindiff_original_browse)
         orig_row.append(orig_btn)
         form.append(orig_row)
 
@@ -7774,7 +8373,7 @@ class MainWindow:
         self.bindiff_modified_entry.set_hexpand(True)
         mod_row.append(self.bindiff_modified_entry)
         mod_btn = Gtk.Button(label="Browse…")
-        mod_btn.connect("clicked", lambda btn: self._on_bindiff_browse(btn, self.bindiff_modified_entry))
+        mod_btn.connect("clicked", self._on_bindiff_modified_browse)
         mod_row.append(mod_btn)
         form.append(mod_row)
 
@@ -7785,12 +8384,7 @@ class MainWindow:
 
         options_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         options_row.append(Gtk.Label(label="Tool", xalign=0))
-        self.bindiff_tool_combo = Gtk.ComboBoxText()
-        self.bindiff_tool_combo.append("auto", "Auto")
-        self.bindiff_tool_combo.append("radiff2", "radiff2")
-        self.bindiff_tool_combo.append("cmp", "cmp")
-        self.bindiff_tool_combo.append("hash", "Hash summary")
-        self.bindiff_tool_combo.set_active_id("auto")
+        self.bindiff_tool_combo = _option_dropdown(BINDIFF_TOOL_OPTIONS)
         self.bindiff_tool_combo.set_hexpand(True)
         options_row.append(self.bindiff_tool_combo)
         form.append(options_row)
@@ -7805,6 +8399,10 @@ class MainWindow:
         self.bindiff_run_btn.add_css_class("suggested-action")
         self.bindiff_run_btn.connect("clicked", self._on_bindiff_run)
         actions_row.append(self.bindiff_run_btn)
+        self.bindiff_cancel_btn = Gtk.Button(label="Cancel")
+        self.bindiff_cancel_btn.set_sensitive(False)
+        self.bindiff_cancel_btn.connect("clicked", self._on_stream_cancel)
+        actions_row.append(self.bindiff_cancel_btn)
         self.bindiff_copy_btn = Gtk.Button.new_from_icon_name("edit-copy-symbolic")
         self.bindiff_copy_btn.set_tooltip_text("Copy output")
         self.bindiff_copy_btn.set_sensitive(False)
@@ -7821,72 +8419,64 @@ class MainWindow:
         self.bindiff_output_view.add_css_class("output-text")
         self.bindiff_output_view.set_editable(False)
         self.bindiff_output_view.set_monospace(True)
-        self.bindiff_output_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.bindiff_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.bindiff_output_view)
         form.append(output_scroll)
 
     def _open_binary_diff(self, tool) -> None:
+        self._ensure_pane("binary_diff")
         self._active_tool = tool
         self.bindiff_original_entry.set_text("")
         self.bindiff_modified_entry.set_text("")
-        self.bindiff_tool_combo.set_active_id("auto")
+        self.bindiff_tool_combo.set_selected(0)
         self.bindiff_extra_entry.set_text("")
-        self._set_text_view_text(self.bindiff_output_view, "")
+        self._clear_result_text(self.bindiff_output_view)
         self.bindiff_copy_btn.set_sensitive(False)
         self.bindiff_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("binary_diff")
         self.content_stack.set_visible_child_name("tool_detail")
 
-    def _on_bindiff_browse(self, _btn: Gtk.Button, entry: Gtk.Entry) -> None:
-        dialog = Gtk.FileChooserNative.new("Select file", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                entry.set_text(file.get_path() or "")
-        dialog.destroy()
+    def _on_bindiff_original_browse(self, _btn: Gtk.Button) -> None:
+        self._browse_into(self.bindiff_original_entry, "Select original file")
+
+    def _on_bindiff_modified_browse(self, _btn: Gtk.Button) -> None:
+        self._browse_into(self.bindiff_modified_entry, "Select modified file")
 
     def _on_bindiff_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
-        original = self.bindiff_original_entry.get_text().strip()
-        modified = self.bindiff_modified_entry.get_text().strip()
+        values = self._read_widgets("bindiff_original_entry", "bindiff_modified_entry", "bindiff_extra_entry")
+        original = values["bindiff_original_entry"].strip()
+        modified = values["bindiff_modified_entry"].strip()
         if not original or not modified:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose both files to compare"))
             return
-        tool_choice = self.bindiff_tool_combo.get_active_id() or "auto"
-        extra = self.bindiff_extra_entry.get_text().strip()
+        tool_choice = _selected_option(self.bindiff_tool_combo, BINDIFF_TOOL_OPTIONS)
+        extra = values["bindiff_extra_entry"].strip()
         self.bindiff_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.bindiff_output_view, "Running diff…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    original=original,
-                    modified=modified,
-                    tool=tool_choice,
-                    extra=extra,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.bindiff_output_view, body)
-                GLib.idle_add(self.bindiff_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.bindiff_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.bindiff_output_view, "Running diff…")
+
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "original": original,
+                "modified": modified,
+                "tool": tool_choice,
+                "extra": extra,
+            },
+            self.bindiff_output_view,
+            self.bindiff_copy_btn,
+            self.bindiff_run_btn,
+            RESULT_MAX_LINES,
+            self.bindiff_cancel_btn,
+        )
 
     def _on_bindiff_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.bindiff_output_view))
+        self._copy_result_to_clipboard(self.bindiff_output_view)
 
     # ---------------------- Binary inspector detail ----------------------
     def _build_binary_inspector_detail(self, root: Gtk.Box) -> None:
@@ -7927,38 +8517,15 @@ class MainWindow:
         options_label.add_css_class("title-4")
         form.append(options_label)
 
-        primary_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        self.binary_inspect_file_check = Gtk.CheckButton(label="File metadata")
-        self.binary_inspect_file_check.set_active(True)
-        primary_row.append(self.binary_inspect_file_check)
-        self.binary_inspect_headers_check = Gtk.CheckButton(label="Headers")
-        self.binary_inspect_headers_check.set_active(True)
-        primary_row.append(self.binary_inspect_headers_check)
-        self.binary_inspect_sections_check = Gtk.CheckButton(label="Sections")
-        self.binary_inspect_sections_check.set_active(True)
-        primary_row.append(self.binary_inspect_sections_check)
-        self.binary_inspect_segments_check = Gtk.CheckButton(label="Segments")
-        self.binary_inspect_segments_check.set_active(False)
-        primary_row.append(self.binary_inspect_segments_check)
-        form.append(primary_row)
-
-        secondary_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        self.binary_inspect_symbols_check = Gtk.CheckButton(label="Symbols")
-        self.binary_inspect_symbols_check.set_active(True)
-        secondary_row.append(self.binary_inspect_symbols_check)
-        self.binary_inspect_dynamic_check = Gtk.CheckButton(label="Dynamic entries")
-        self.binary_inspect_dynamic_check.set_active(False)
-        secondary_row.append(self.binary_inspect_dynamic_check)
-        self.binary_inspect_checksec_check = Gtk.CheckButton(label="Security flags")
-        self.binary_inspect_checksec_check.set_active(True)
-        secondary_row.append(self.binary_inspect_checksec_check)
-        self.binary_inspect_libraries_check = Gtk.CheckButton(label="Libraries")
-        self.binary_inspect_libraries_check.set_active(False)
-        secondary_row.append(self.binary_inspect_libraries_check)
-        self.binary_inspect_strings_check = Gtk.CheckButton(label="Strings")
-        self.binary_inspect_strings_check.set_active(False)
-        secondary_row.append(self.binary_inspect_strings_check)
-        form.append(secondary_row)
+        self._binary_inspect_checks: Dict[str, Gtk.CheckButton] = {}
+        for checks in BINARY_INSPECT_CHECKS:
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+            for name, label, default in checks:
+                check = Gtk.CheckButton(label=label)
+                check.set_active(default)
+                row.append(check)
+                self._binary_inspect_checks[name] = check
+            form.append(row)
 
         config_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         config_row.append(Gtk.Label(label="Strings min length", xalign=0))
@@ -7996,96 +8563,61 @@ class MainWindow:
         self.binary_inspect_output_view.add_css_class("output-text")
         self.binary_inspect_output_view.set_editable(False)
         self.binary_inspect_output_view.set_monospace(True)
-        self.binary_inspect_output_view.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.binary_inspect_output_view.set_wrap_mode(Gtk.WrapMode.NONE)
         output_scroll = Gtk.ScrolledWindow()
+        output_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         output_scroll.add_css_class("output-box")
         output_scroll.set_min_content_height(550)
         output_scroll.set_child(self.binary_inspect_output_view)
         form.append(output_scroll)
 
     def _open_binary_inspector(self, tool) -> None:
+        self._ensure_pane("binary_inspector")
         self._active_tool = tool
         self.binary_inspect_file_entry.set_text("")
-        self.binary_inspect_file_check.set_active(True)
-        self.binary_inspect_headers_check.set_active(True)
-        self.binary_inspect_sections_check.set_active(True)
-        self.binary_inspect_segments_check.set_active(False)
-        self.binary_inspect_symbols_check.set_active(True)
-        self.binary_inspect_dynamic_check.set_active(False)
-        self.binary_inspect_checksec_check.set_active(True)
-        self.binary_inspect_libraries_check.set_active(False)
-        self.binary_inspect_strings_check.set_active(False)
+        for checks in BINARY_INSPECT_CHECKS:
+            for name, _label, default in checks:
+                self._binary_inspect_checks[name].set_active(default)
         self.binary_inspect_strings_spin.set_value(4)
         self.binary_inspect_max_lines_spin.set_value(400)
-        self._set_text_view_text(self.binary_inspect_output_view, "")
+        self._clear_result_text(self.binary_inspect_output_view)
         self.binary_inspect_copy_btn.set_sensitive(False)
         self.binary_inspect_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("binary_inspector")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_binary_inspect_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select binary", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.binary_inspect_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.binary_inspect_file_entry, "Select binary")
 
     def _on_binary_inspect_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None or "binary_inspect" in self._runs_inflight:
             return
         path = self.binary_inspect_file_entry.get_text().strip()
         if not path:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a binary"))
             return
-        include_file = "true" if self.binary_inspect_file_check.get_active() else "false"
-        include_headers = "true" if self.binary_inspect_headers_check.get_active() else "false"
-        include_sections = "true" if self.binary_inspect_sections_check.get_active() else "false"
-        include_segments = "true" if self.binary_inspect_segments_check.get_active() else "false"
-        include_symbols = "true" if self.binary_inspect_symbols_check.get_active() else "false"
-        include_dynamic = "true" if self.binary_inspect_dynamic_check.get_active() else "false"
-        include_checksec = "true" if self.binary_inspect_checksec_check.get_active() else "false"
-        include_libraries = "true" if self.binary_inspect_libraries_check.get_active() else "false"
-        include_strings = "true" if self.binary_inspect_strings_check.get_active() else "false"
-        strings_min = str(int(self.binary_inspect_strings_spin.get_value()))
-        max_lines = str(int(self.binary_inspect_max_lines_spin.get_value()))
+        options = {name: check.get_active() for name, check in self._binary_inspect_checks.items()}
+        strings_min = int(self.binary_inspect_strings_spin.get_value())
+        max_lines = int(self.binary_inspect_max_lines_spin.get_value())
+        self._runs_inflight.add("binary_inspect")
         self.binary_inspect_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.binary_inspect_output_view, "Collecting metadata…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    file_path=path,
-                    include_sections=include_sections,
-                    include_symbols=include_symbols,
-                    include_checksec=include_checksec,
-                    include_file=include_file,
-                    include_headers=include_headers,
-                    include_segments=include_segments,
-                    include_dynamic=include_dynamic,
-                    include_libraries=include_libraries,
-                    include_strings=include_strings,
-                    strings_min_length=strings_min,
-                    max_lines=max_lines,
-                )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self._set_text_view_text, self.binary_inspect_output_view, body)
-                GLib.idle_add(self.binary_inspect_copy_btn.set_sensitive, bool(body.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.binary_inspect_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+        self._reset_result_text(self.binary_inspect_output_view, "Collecting metadata…")
+        self._run_tool_stream(
+            self._active_tool,
+            {
+                "file_path": path,
+                "strings_min_length": strings_min,
+                "max_lines": max_lines,
+                **options,
+            },
+            self.binary_inspect_output_view,
+            self.binary_inspect_copy_btn,
+            self.binary_inspect_run_btn,
+            inflight="binary_inspect",
+        )
 
     def _on_binary_inspect_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.binary_inspect_output_view))
+        self._copy_result_to_clipboard(self.binary_inspect_output_view)
 
     # ---------------------- EXE Decompiler ----------------------
     def _build_exe_decompiler_detail(self, root: Gtk.Box) -> None:
@@ -8128,12 +8660,13 @@ class MainWindow:
         engine_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         engine_row.append(Gtk.Label(label="Engine:", xalign=0))
         self.exe_decompiler_engine_combo = Gtk.ComboBoxText()
-        self.exe_decompiler_engine_combo.append("auto", "Auto-detect (Best Available)")
-        self.exe_decompiler_engine_combo.append("ghidra", "Ghidra (Best Quality)")
-        self.exe_decompiler_engine_combo.append("rizin", "Rizin/r2dec (Fast)")
-        self.exe_decompiler_engine_combo.append("objdump", "objdump (Basic Disassembly)")
-        self.exe_decompiler_engine_combo.set_active(0)
+        self._exe_engines_listed: Optional[Tuple[str, ...]] = None
+        self._list_exe_engines(tuple(engine for engine, _label in EXE_ENGINE_OPTIONS))
         engine_row.append(self.exe_decompiler_engine_combo)
+        refresh_btn = Gtk.Button.new_from_icon_name("view-refresh-symbolic")
+        refresh_btn.set_tooltip_text("Look for installed engines again")
+        refresh_btn.connect("clicked", self._on_exe_decompiler_refresh_engines)
+        engine_row.append(refresh_btn)
         form.append(engine_row)
 
         function_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
@@ -8184,72 +8717,99 @@ class MainWindow:
         output_scroll.set_child(self.exe_decompiler_output_view)
         form.append(output_scroll)
 
-        self.tool_detail_stack.add_named(root, "exe_decompiler")
-
     def _open_exe_decompiler(self, tool) -> None:
+        self._ensure_pane("exe_decompiler")
         self._active_tool = tool
         self.exe_decompiler_file_entry.set_text("")
+        self._detect_exe_engines(tool, refresh=False)
         self.exe_decompiler_engine_combo.set_active(0)
         self.exe_decompiler_function_entry.set_text("main")
         self.exe_decompiler_verbose_check.set_active(False)
-        self._set_text_view_text(self.exe_decompiler_output_view, "")
+        self._clear_result_text(self.exe_decompiler_output_view)
         self.exe_decompiler_copy_btn.set_sensitive(False)
         self.exe_decompiler_run_btn.set_sensitive(True)
         self.tool_detail_stack.set_visible_child_name("exe_decompiler")
         self.content_stack.set_visible_child_name("tool_detail")
 
+    def _list_exe_engines(self, engines: Tuple[str, ...]) -> None:
+        """Offer Auto plus the installed ``engines``; the combo is only rebuilt when they change."""
+        if engines == self._exe_engines_listed:
+            return
+        self._exe_engines_listed = engines
+        combo = self.exe_decompiler_engine_combo
+        combo.remove_all()
+        combo.append("auto", "Auto-detect (Best Available)")
+        for engine, label in EXE_ENGINE_OPTIONS:
+            if engine in engines:
+                combo.append(engine, label)
+        combo.set_active(0)
+
+    def _on_exe_decompiler_refresh_engines(self, _btn: Gtk.Button) -> None:
+        if self._active_tool is None:
+            return
+        self._detect_exe_engines(self._active_tool_as(ExeDecompiler), refresh=True)
+
+    def _detect_exe_engines(self, tool: ExeDecompiler, refresh: bool) -> None:
+        """Search PATH for decompilers off the main loop, then list them; a refresh also reports them."""
+
+        def show(engines: Tuple[str, ...]) -> None:
+            self._list_exe_engines(engines)
+            if refresh:
+                found = ", ".join(engines) if engines else "none"
+                self.toast_overlay.add_toast(Adw.Toast.new(f"Engines found: {found}"))
+
+        def worker() -> Dict[str, Any]:
+            self._post_ui(show, tool.detect_engines(refresh=refresh))
+            return {}
+
+        self._run_tool_task(worker)
+
     def _on_exe_decompiler_browse(self, _btn: Gtk.Button) -> None:
-        dialog = Gtk.FileChooserNative.new("Select executable", self.window, Gtk.FileChooserAction.OPEN, None, None)
-        dialog.set_modal(True)
-        response = self._run_native_dialog(dialog)
-        if response == Gtk.ResponseType.ACCEPT:
-            file = dialog.get_file()
-            if file:
-                self.exe_decompiler_file_entry.set_text(file.get_path() or "")
-        dialog.destroy()
+        self._browse_into(self.exe_decompiler_file_entry, "Select executable")
 
     def _on_exe_decompiler_run(self, _btn: Gtk.Button) -> None:
-        if not self._active_tool:
+        if self._active_tool is None or "exe_decompiler" in self._runs_inflight:
             return
 
         file_path = self.exe_decompiler_file_entry.get_text().strip()
         if not file_path:
-            self._set_text_view_text(self.exe_decompiler_output_view, "Error: Please select a binary file.")
+            self._set_result_text(self.exe_decompiler_output_view, "Error: Please select a binary file.")
             return
 
         engine = self.exe_decompiler_engine_combo.get_active_id() or "auto"
         function = self.exe_decompiler_function_entry.get_text().strip() or "main"
+        if not FUNCTION_RE.match(function):
+            self.toast_overlay.add_toast(Adw.Toast.new("Invalid function name or address"))
+            return
         verbose = "true" if self.exe_decompiler_verbose_check.get_active() else "false"
 
+        self._runs_inflight.add("exe_decompiler")
         self.exe_decompiler_run_btn.set_sensitive(False)
-        self._set_text_view_text(self.exe_decompiler_output_view, "Decompiling... This may take a moment.")
+        self._reset_result_text(self.exe_decompiler_output_view, "Decompiling... This may take a moment.")
 
-        def worker():
-            try:
-                result = self._active_tool.run(
-                    file_path=file_path,
-                    engine=engine,
-                    function=function,
-                    verbose=verbose
-                )
-                body = getattr(result, "body", str(result))
-                title = getattr(result, "title", "Result")
-                output = f"{title}\n{'=' * len(title)}\n\n{body}"
-                GLib.idle_add(self._set_text_view_text, self.exe_decompiler_output_view, output)
-                GLib.idle_add(self.exe_decompiler_copy_btn.set_sensitive, bool(output.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.exe_decompiler_run_btn.set_sensitive, True)
+        tool = self._active_tool
+        done = {"run_btn": self.exe_decompiler_run_btn, "inflight": "exe_decompiler"}
+
+        def worker() -> Dict[str, Any]:
+            result = tool.run(
+                file_path=file_path,
+                engine=engine,
+                function=function,
+                verbose=verbose
+            )
+            title = result.title
+            output = f"{title}\n{'=' * len(title)}\n\n{result.body}"
+            return {
+                **done,
+                "view": self.exe_decompiler_output_view,
+                "text": output,
+                "copy_btn": self.exe_decompiler_copy_btn,
+            }
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, done)
 
     def _on_exe_decompiler_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        clipboard.set_text(self._get_text_view_text(self.exe_decompiler_output_view))
+        self._copy_result_to_clipboard(self.exe_decompiler_output_view)
 
     # ---------------------- JWT tool detail ----------------------
     def _build_jwt_tool_detail(self, root: Gtk.Box) -> None:
@@ -8397,6 +8957,7 @@ class MainWindow:
         form.append(results_scroll)
 
     def _open_jwt_tool(self, tool) -> None:
+        self._ensure_pane("jwt_tool")
         self._active_tool = tool
         self._set_text_view_text(self.jwt_token_view, "")
         self.jwt_secret_entry.set_text("")
@@ -8408,13 +8969,13 @@ class MainWindow:
         self.jwt_verify_switch.set_active(True)
         self.jwt_resign_switch.set_active(False)
         self.jwt_none_switch.set_active(False)
-        self.jwt_results.get_buffer().set_text("")
+        self._clear_result_text(self.jwt_results)
         self.jwt_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("jwt_tool")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_jwt_tool_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None or "jwt" in self._runs_inflight:
             return
         token = self._get_text_view_text(self.jwt_token_view).strip()
         if not token:
@@ -8430,47 +8991,36 @@ class MainWindow:
         resign = "true" if self.jwt_resign_switch.get_active() else "false"
         none_attack = "true" if self.jwt_none_switch.get_active() else "false"
 
+        self._runs_inflight.add("jwt")
         self.jwt_run_btn.set_sensitive(False)
         self.jwt_copy_btn.set_sensitive(False)
-        self.jwt_results.get_buffer().set_text("Analyzing token…")
-
-        def worker() -> None:
-            try:
-                result = self._active_tool.run(
-                    token=token,
-                    secret=secret,
-                    verify=verify,
-                    public_key=public_key,
-                    private_key=private_key,
-                    override_alg=override_alg,
-                    new_header=new_header,
-                    new_payload=new_payload,
-                    resign=resign,
-                    none_attack=none_attack,
-                )
-                body_text = getattr(result, "body", str(result))
-                GLib.idle_add(self.jwt_results.get_buffer().set_text, body_text)
-                GLib.idle_add(self.jwt_copy_btn.set_sensitive, bool(body_text.strip()))
-            except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
-            finally:
-                GLib.idle_add(self.jwt_run_btn.set_sensitive, True)
+        self._reset_result_text(self.jwt_results, "Analyzing token…")
+
+        tool = self._active_tool
+        done = {"run_btn": self.jwt_run_btn, "inflight": "jwt"}
+
+        def worker() -> Dict[str, Any]:
+            result = tool.run(
+                token=token,
+                secret=secret,
+                verify=verify,
+                public_key=public_key,
+                private_key=private_key,
+                override_alg=override_alg,
+                new_header=new_header,
+                new_payload=new_payload,
+                resign=resign,
+                none_attack=none_attack,
+            )
+            return {**done, "view": self.jwt_results, "text": result.body, "copy_btn": self.jwt_copy_btn}
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_tool_task(worker, done)
 
     def _on_jwt_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.jwt_results.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.jwt_results)
 
     # ---------------------- File upload tester detail ----------------------
     def _build_file_upload_detail(self, root: Gtk.Box) -> None:
-        from .modules.web.file_upload import DEFAULT_PAYLOAD, VARIANTS
-
         header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
         back_btn.set_tooltip_text("Back to tools")
@@ -8494,8 +9044,7 @@ class MainWindow:
 
         variant_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         self.upload_variant = Gtk.ComboBoxText()
-        for key in VARIANTS.keys():
-            label = key.replace("_", " ").title()
+        for key, label in VARIANTS_ITEMS:
             self.upload_variant.append(key, label)
         self.upload_variant.set_active_id("polyglot_png_php")
         variant_row.append(self.upload_variant)
@@ -8577,8 +9126,7 @@ class MainWindow:
         form.append(results_scroll)
 
     def _open_file_upload(self, tool) -> None:
-        from .modules.web.file_upload import DEFAULT_PAYLOAD
-
+        self._ensure_pane("file_upload")
         self._active_tool = tool
         self.upload_variant.set_active_id("polyglot_png_php")
         self.upload_base.set_text("shell")
@@ -8586,7 +9134,7 @@ class MainWindow:
         self.upload_field.set_text("file")
         self.upload_target.set_text("http://localhost/upload")
         self._set_text_view_text(self.upload_payload_view, DEFAULT_PAYLOAD)
-        self.upload_results.get_buffer().set_text("")
+        self._clear_result_text(self.upload_results)
         self.tool_detail_stack.set_visible_child_name("file_upload")
         self.content_stack.set_visible_child_name("tool_detail")
 
@@ -8600,7 +9148,7 @@ class MainWindow:
         self._run_file_upload_action("cleanup")
 
     def _run_file_upload_action(self, action: str) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         variant = self.upload_variant.get_active_id() or "polyglot_png_php"
         payload = self._get_text_view_text(self.upload_payload_view)
@@ -8611,7 +9159,7 @@ class MainWindow:
 
         for btn in (self.upload_generate_btn, self.upload_list_btn, self.upload_cleanup_btn):
             btn.set_sensitive(False)
-        self.upload_results.get_buffer().set_text("Working…")
+        self._reset_result_text(self.upload_results, "Working…")
 
         def worker() -> None:
             try:
@@ -8624,14 +9172,14 @@ class MainWindow:
                     target=target,
                     action=action,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self.upload_results.get_buffer().set_text, body)
+                body = result.body
+                self._post_ui(self._set_result_text, self.upload_results, body)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self._set_upload_buttons_sensitive, True)
+                self._post_ui(self._set_upload_buttons_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
     def _set_upload_buttons_sensitive(self, enabled: bool) -> None:
         self.upload_generate_btn.set_sensitive(enabled)
@@ -8639,13 +9187,7 @@ class MainWindow:
         self.upload_cleanup_btn.set_sensitive(enabled)
 
     def _on_strings_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        clipboard = display.get_clipboard()
-        buffer = self.strings_result_view.get_buffer()
-        start, end = buffer.get_bounds()
-        clipboard.set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.strings_result_view)
 
     def _build_wordlist_generator_detail(self, root: Gtk.Box) -> None:
         header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -8718,19 +9260,19 @@ class MainWindow:
         self.wordlist_tokens.set_text("")
         self.wordlist_min.set_value(1)
         self.wordlist_max.set_value(3)
-        self.wordlist_result.get_buffer().set_text("")
+        self._clear_result_text(self.wordlist_result)
         self.tool_detail_stack.set_visible_child_name("wordlist")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_wordlist_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         tokens = self.wordlist_tokens.get_text().strip()
         min_len = str(int(self.wordlist_min.get_value()))
         max_len = str(int(self.wordlist_max.get_value()))
         try:
             result = self._active_tool.run(tokens=tokens, min_length=min_len, max_length=max_len)
-            self.wordlist_result.get_buffer().set_text(getattr(result, "body", str(result)))
+            self._set_text_view_text(self.wordlist_result, result.body)
         except Exception as exc:
             self.toast_overlay.add_toast(Adw.Toast.new(f"Error: {exc}"))
 
@@ -8789,8 +9331,6 @@ class MainWindow:
         scan_label.add_css_class("title-4")
         form.append(scan_label)
 
-        from .modules.network.nmap import PROFILE_CHOICES
-
         self._nmap_profile_descriptions = {profile.profile_id: profile.description for profile in PROFILE_CHOICES}
 
         options_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -8884,7 +9424,6 @@ class MainWindow:
         self.nmap_profile_desc.set_text(description)
 
     def _open_nmap(self, tool) -> None:
-        from .modules.network.nmap import network_consent_enabled, is_nmap_available
         self._active_tool = tool
         # Update notice
         if not is_nmap_available():
@@ -8905,7 +9444,7 @@ class MainWindow:
         self.nmap_skip_ping.set_active(False)
         self.nmap_ports.set_text("")
         self.nmap_extra.set_text("")
-        self.nmap_results.get_buffer().set_text("")
+        self._clear_result_text(self.nmap_results)
         self.tool_detail_stack.set_visible_child_name("nmap")
         self.content_stack.set_visible_child_name("tool_detail")
 
@@ -8916,13 +9455,11 @@ class MainWindow:
         self.discovery_wordlist.set_text("")
         self.discovery_threads.set_text("20")
         self.discovery_auto_download.set_active(True)
-        self.discovery_results.get_buffer().set_text("")
+        self._clear_result_text(self.discovery_results)
         self._refresh_discovery_wordlists()
         self.tool_detail_stack.set_visible_child_name("discovery")
         self.content_stack.set_visible_child_name("tool_detail")
     def _refresh_discovery_wordlists(self) -> None:
-        from .modules.web.discovery import available_wordlists
-
         current = self.discovery_wordlist_choice.get_active_id()
         self.discovery_wordlist_choice.remove_all()
 
@@ -8953,8 +9490,6 @@ class MainWindow:
             self.discovery_wordlist_status.set_text("No preset wordlists downloaded yet")
 
     def _on_discovery_download_wordlist(self, _btn: Gtk.Button) -> None:
-        from .modules.web.discovery import ensure_wordlist
-
         slug = self.discovery_wordlist_choice.get_active_id()
         if not slug:
             self.toast_overlay.add_toast(Adw.Toast.new("Choose a preset first"))
@@ -8979,7 +9514,7 @@ class MainWindow:
         dialog.destroy()
 
     def _on_discovery_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         target = self.discovery_target.get_text().strip()
         if not target:
@@ -8992,7 +9527,7 @@ class MainWindow:
         download_missing = "true" if self.discovery_auto_download.get_active() else "false"
 
         self.discovery_run_btn.set_sensitive(False)
-        self.discovery_results.get_buffer().set_text("Running discovery…")
+        self._reset_result_text(self.discovery_results, "Running discovery…")
 
         def worker() -> None:
             try:
@@ -9004,19 +9539,17 @@ class MainWindow:
                     wordlist_choice=preset,
                     download_missing=download_missing,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self.discovery_results.get_buffer().set_text, body)
+                body = result.body
+                self._post_ui(self._set_result_text, self.discovery_results, body)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.discovery_run_btn.set_sensitive, True)
+                self._post_ui(self.discovery_run_btn.set_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
     # ---------------------- SQLi tester detail ----------------------
     def _build_sqli_tester_detail(self, root: Gtk.Box) -> None:
-        from .modules.web.sqli_tester import PAYLOAD_PRESETS
-
         header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
         back_btn.set_tooltip_text("Back to tools")
@@ -9194,12 +9727,12 @@ class MainWindow:
         self.sqli_sqlmap_hint.set_active(True)
         self.sqli_profile.set_active_id("basic")
         self._on_sqli_profile_changed(self.sqli_profile)
-        self.sqli_results.get_buffer().set_text("")
+        self._clear_result_text(self.sqli_results)
         self.tool_detail_stack.set_visible_child_name("sqli_tester")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_sqli_tester_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         target = self.sqli_target.get_text().strip()
         if not target:
@@ -9217,7 +9750,7 @@ class MainWindow:
         include_hint = "true" if self.sqli_sqlmap_hint.get_active() else "false"
 
         self.sqli_run_btn.set_sensitive(False)
-        self.sqli_results.get_buffer().set_text("Probing target…")
+        self._reset_result_text(self.sqli_results, "Probing target…")
 
         def worker() -> None:
             try:
@@ -9234,14 +9767,14 @@ class MainWindow:
                     timeout=timeout,
                     include_sqlmap_hint=include_hint,
                 )
-                body_text = getattr(result, "body", str(result))
-                GLib.idle_add(self.sqli_results.get_buffer().set_text, body_text)
+                body_text = result.body
+                self._post_ui(self._set_result_text, self.sqli_results, body_text)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.sqli_run_btn.set_sensitive, True)
+                self._post_ui(self.sqli_run_btn.set_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
     def _open_sqlmap(self, tool) -> None:
         self._active_tool = tool
@@ -9256,13 +9789,13 @@ class MainWindow:
         self.sqlmap_timeout.set_text("30")
         self.sqlmap_options.set_text("")
         self.sqlmap_consent.set_active(False)
-        self.sqlmap_results.get_buffer().set_text("")
+        self._clear_result_text(self.sqlmap_results)
         self.sqlmap_copy_btn.set_sensitive(False)
         self.tool_detail_stack.set_visible_child_name("sqlmap")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_sqlmap_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         if not self.sqlmap_consent.get_active():
             self.toast_overlay.add_toast(Adw.Toast.new("You must tick the consent box"))
@@ -9282,7 +9815,7 @@ class MainWindow:
         timeout = self.sqlmap_timeout.get_text().strip() or "30"
 
         self.sqlmap_run_btn.set_sensitive(False)
-        self.sqlmap_results.get_buffer().set_text("Running sqlmap…")
+        self._reset_result_text(self.sqlmap_results, "Running sqlmap…")
 
         def worker() -> None:
             try:
@@ -9299,18 +9832,18 @@ class MainWindow:
                     timeout=timeout,
                     i_understand="yes",
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self.sqlmap_results.get_buffer().set_text, body)
-                GLib.idle_add(self.sqlmap_copy_btn.set_sensitive, bool(body.strip()))
+                body = result.body
+                self._post_ui(self._set_result_text, self.sqlmap_results, body)
+                self._post_ui(self.sqlmap_copy_btn.set_sensitive, bool(body) and not body.isspace())
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.sqlmap_run_btn.set_sensitive, True)
+                self._post_ui(self.sqlmap_run_btn.set_sensitive, True)
+
+        self._tool_executor.submit(worker)
 
     # ---------------------- XSS tester detail ----------------------
     def _build_xss_tester_detail(self, root: Gtk.Box) -> None:
-        from .modules.web.xss_tester import PAYLOAD_SETS
-
         header_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         back_btn = Gtk.Button.new_from_icon_name("go-previous-symbolic")
         back_btn.set_tooltip_text("Back to tools")
@@ -9484,12 +10017,12 @@ class MainWindow:
         self.xss_follow_redirects.set_active(True)
         self.xss_profile.set_active_id("basic")
         self._on_xss_profile_changed(self.xss_profile)
-        self.xss_results.get_buffer().set_text("")
+        self._clear_result_text(self.xss_results)
         self.tool_detail_stack.set_visible_child_name("xss_tester")
         self.content_stack.set_visible_child_name("tool_detail")
 
     def _on_xss_tester_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         target = self.xss_target.get_text().strip()
         if not target:
@@ -9506,7 +10039,7 @@ class MainWindow:
         follow = "true" if self.xss_follow_redirects.get_active() else "false"
 
         self.xss_run_btn.set_sensitive(False)
-        self.xss_results.get_buffer().set_text("Testing payloads…")
+        self._reset_result_text(self.xss_results, "Testing payloads…")
 
         def worker() -> None:
             try:
@@ -9522,27 +10055,20 @@ class MainWindow:
                     timeout=timeout,
                     follow_redirects=follow,
                 )
-                body_text = getattr(result, "body", str(result))
-                GLib.idle_add(self.xss_results.get_buffer().set_text, body_text)
+                body_text = result.body
+                self._post_ui(self._set_result_text, self.xss_results, body_text)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.xss_run_btn.set_sensitive, True)
-
-        threading.Thread(target=worker, daemon=True).start()
+                self._post_ui(self.xss_run_btn.set_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
     def _on_sqlmap_copy(self, _btn: Gtk.Button) -> None:
-        display = self.window.get_display()
-        if display is None:
-            return
-        buffer = self.sqlmap_results.get_buffer()
-        start, end = buffer.get_bounds()
-        display.get_clipboard().set_text(buffer.get_text(start, end, True))
+        self._copy_result_to_clipboard(self.sqlmap_results)
 
     def _on_nmap_run(self, _btn: Gtk.Button) -> None:
-        if not getattr(self, "_active_tool", None):
+        if self._active_tool is None:
             return
         target = self.nmap_target.get_text().strip()
         if not target:
@@ -9557,7 +10083,7 @@ class MainWindow:
         ports = self.nmap_ports.get_text().strip()
 
         self.nmap_run_btn.set_sensitive(False)
-        self.nmap_results.get_buffer().set_text("Running nmap…")
+        self._reset_result_text(self.nmap_results, "Running nmap…")
 
         def worker() -> None:
             try:
@@ -9571,18 +10097,16 @@ class MainWindow:
                     skip_ping=skip_ping,
                     ports=ports,
                 )
-                body = getattr(result, "body", str(result))
-                GLib.idle_add(self.nmap_results.get_buffer().set_text, body)
+                body = result.body
+                self._post_ui(self._set_result_text, self.nmap_results, body)
             except Exception as exc:
-                GLib.idle_add(self.toast_overlay.add_toast, Adw.Toast.new(f"Error: {exc}"))
+                self._post_ui(self._show_error_toast, f"Error: {exc}")
             finally:
-                GLib.idle_add(self.nmap_run_btn.set_sensitive, True)
+                self._post_ui(self.nmap_run_btn.set_sensitive, True)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._tool_executor.submit(worker)
 
     def _on_enable_network_tools(self, _btn: Gtk.Button) -> None:
-        from .modules.network.nmap import set_network_consent
-
         set_network_consent(True)
         self.app.module_registry = ModuleRegistry()
         self.toast_overlay.add_toast(Adw.Toast.new("Network tools enabled"))
@@ -9598,8 +10122,6 @@ class MainWindow:
             self._show_tool("Nmap")
 
     def _on_disable_network_tools(self, _btn: Gtk.Button) -> None:
-        from .modules.network.nmap import set_network_consent
-
         set_network_consent(False)
         self.app.module_registry = ModuleRegistry()
         self.toast_overlay.add_toast(Adw.Toast.new("Network tools disabled"))
@@ -9873,6 +10395,12 @@ class CrypteaApplication(Adw.Application):
         self.performance_monitor = get_performance_monitor(
             enabled=getattr(config, 'DEBUG', False)
         )
+        # Shared pool for tool runs so repeated clicks reuse a few threads
+        # instead of spawning a fresh one per request.
+        self.tool_executor = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 4),
+            thread_name_prefix="tool",
+        )
         
         _LOG.info("CrypteaApplication initialized with performance management")
 
@@ -9907,6 +10435,8 @@ class CrypteaApplication(Adw.Application):
         # Stop all running processes
         _LOG.info("Stopping all processes...")
         self.process_manager.stop_all()
+        self.tool_executor.shutdown(wait=False, cancel_futures=True)
+        shutdown_exiftool_sessions()
         
         # Unload all modules
         _LOG.info("Unloading all modules...")
@@ -9931,6 +10461,7 @@ class CrypteaApplication(Adw.Application):
         self._add_simple_action("import_pack", self.import_pack)
         self._add_simple_action("export_pack", self.export_pack)
         self._add_simple_action("settings", self.show_preferences)
+        self._add_simple_action("clear_inspector_cache", self.clear_inspector_cache)
         self._add_simple_action("new_challenge", self._action_new_challenge)
         self._add_simple_action("focus_search", self._action_focus_search)
         self.set_accels_for_action("app.new_challenge", ["<Primary>n"])
@@ -9956,6 +10487,16 @@ class CrypteaApplication(Adw.Application):
         clipboard = display.get_clipboard()
         clipboard.set_text(diagnostics)
 
+    def clear_inspector_cache(self) -> None:
+        try:
+            inspector = self.module_registry.find("PE/ELF Inspector")
+        except KeyError:
+            return
+        removed = inspector.clear_cache()
+        if self.main_window:
+            noun = "result" if removed == 1 else "results"
+            self.main_window.toast_overlay.add_toast(Adw.Toast.new(f"Cleared {removed} cached inspector {noun}"))
+
     def open_logs(self) -> None:
         folder = Gio.File.new_for_path(str(log_dir()))
         launcher = Gtk.FileLauncher.new(folder)
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import codecs
+import os
+import signal
+import subprocess
+import threading
 from dataclasses import dataclass
-from typing import Protocol
+from pathlib import Path
+from typing import Iterator, Optional, Protocol, Sequence
 
 
 @dataclass(slots=True)
@@ -30,3 +36,94 @@ class OfflineTool(Protocol):
 
     def run(self, *args, **kwargs) -> ToolResult:
         ...
+
+
+class CancelToken:
+    """Lets another thread stop a streamed command and everything it started.
+
+    Commands run in their own session, so cancelling signals the whole
+    process group rather than just the direct child.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            pid = self._pid
+        if pid is not None:
+            _kill_group(pid, signal.SIGTERM)
+
+    def _attach(self, pid: Optional[int]) -> bool:
+        with self._lock:
+            if self._cancelled and pid is not None:
+                return False
+            self._pid = pid
+            return True
+
+
+def _kill_group(pid: int, sig: int) -> None:
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def stream_command(
+    argv: Sequence[str], cwd: Optional[Path] = None, cancel: Optional[CancelToken] = None
+) -> Iterator[str]:
+    """Yield the output of ``argv``, stderr merged into stdout, as it is written.
+
+    The pipe is read in 64 KiB blocks and decoded incrementally, so chunks
+    may end mid-line. The command gets its own session and no inherited
+    descriptors; its process group is killed if the caller stops iterating
+    before it exits, and ``cancel`` can end it from another thread.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with subprocess.Popen(
+        list(argv),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL,
+        cwd=cwd,
+        close_fds=True,
+        start_new_session=True,
+    ) as proc:
+        fd = proc.stdout.fileno()
+        try:
+            if cancel is not None and not cancel._attach(proc.pid):
+                _kill_group(proc.pid, signal.SIGKILL)
+                return
+            while data := os.read(fd, 65536):
+                if text := decoder.decode(data):
+                    yield text
+            if tail := decoder.decode(b"", final=True):
+                yield tail
+        finally:
+            if cancel is not None:
+                cancel._attach(None)
+            if proc.poll() is None:
+                _kill_group(proc.pid, signal.SIGKILL)
+
+
+def stream_command_lines(
+    argv: Sequence[str], cwd: Optional[Path] = None, cancel: Optional[CancelToken] = None
+) -> Iterator[str]:
+    """Like :func:`stream_command`, but yield whole lines, each with its newline."""
+    partial = ""
+    for chunk in stream_command(argv, cwd, cancel):
+        text = partial + chunk
+        end = text.rfind("\n") + 1
+        partial = text[end:]
+        if end:
+            for line in text[: end - 1].split("\n"):
+                yield line + "\n"
+    if partial:
+        yield partial
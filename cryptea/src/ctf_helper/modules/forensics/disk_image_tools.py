@@ -22,9 +22,9 @@ class DiskImageToolkit:
     def run(
         self,
         file_path: str,
-        sector_size: str = "512",
-        include_hashes: str = "false",
-        max_partitions: str = "16",
+        sector_size: str | int = "512",
+        include_hashes: str | bool = "false",
+        max_partitions: str | int = "16",
     ) -> ToolResult:
         path = Path(file_path).expanduser()
         if not path.exists():
@@ -7,12 +7,25 @@ import json
 import math
 import re
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from ..base import ToolResult
 
+_PRINTABLE_RUN = re.compile(rb"[\x20-\x7e]+")
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryAnalyzerArgs:
+    """Typed arguments for :meth:`MemoryAnalyzerTool.run_args`, built once by the UI."""
+
+    file_path: str
+    strings_limit: int = 200
+    keywords: Tuple[str, ...] = ("flag", "password", "secret")
+    include_hashes: bool = False
+
 
 class MemoryAnalyzerTool:
     """Provide lightweight signal from large memory images without volatility."""
@@ -28,14 +41,28 @@ class MemoryAnalyzerTool:
         keywords: str = "flag,password,secret",
         include_hashes: str = "false",
     ) -> ToolResult:
-        path = Path(file_path).expanduser()
+        return self.run_args(
+            MemoryAnalyzerArgs(
+                file_path=file_path,
+                strings_limit=int(strings_limit or "200"),
+                keywords=tuple(token.strip() for token in (keywords or "").split(",") if token.strip()),
+                include_hashes=self._truthy(include_hashes),
+            )
+        )
+
+    def run_args(self, args: MemoryAnalyzerArgs) -> ToolResult:
+        """Like :meth:`run`, with the arguments already parsed by the caller."""
+        path = Path(args.file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(path)
 
-        sample_limit = max(10, int(strings_limit or "200"))
-        keyword_tokens = [token.strip() for token in (keywords or "").split(",") if token.strip()]
-        include_hash = self._truthy(include_hashes)
-        summary = self._analyze_memory(path, sample_limit=sample_limit, keywords=keyword_tokens, include_hashes=include_hash)
+        sample_limit = max(10, args.strings_limit)
+        summary = self._analyze_memory(
+            path,
+            sample_limit=sample_limit,
+            keywords=list(args.keywords),
+            include_hashes=args.include_hashes,
+        )
         body = json.dumps(summary, indent=2)
         title = f"Memory insights for {path.name}"
         return ToolResult(title=title, body=body, mime_type="application/json")
@@ -53,6 +80,13 @@ class MemoryAnalyzerTool:
     ) -> Dict[str, object]:
         stats = path.stat()
         keyword_map = {token.lower(): token for token in keywords}
+        # One C-level pass decides whether a string can contain any keyword; the
+        # per-keyword membership checks only run for strings that pass it.
+        keyword_regex = (
+            re.compile("|".join(re.escape(key) for key in keyword_map if key), re.IGNORECASE)
+            if any(keyword_map)
+            else None
+        )
         keyword_hits: Dict[str, List[Dict[str, object]]] = {token: [] for token in keyword_map}
         strings_sample: List[Dict[str, object]] = []
         flag_candidates: List[Dict[str, object]] = []
@@ -110,25 +144,43 @@ class MemoryAnalyzerTool:
                 else:
                     signature_tail = b""
 
-                for i, byte in enumerate(chunk):
-                    if 32 <= byte <= 126:
-                        if not string_buffer:
-                            current_start = offset + i
-                        string_buffer.append(byte)
-                    else:
+                # A run carried over from the previous chunk ends if this chunk
+                # does not start with a printable byte.
+                if string_buffer and not 32 <= chunk[0] <= 126:
+                    total_strings = self._finalise_string(
+                        string_buffer,
+                        current_start,
+                        total_strings,
+                        sample_limit,
+                        keyword_map,
+                        keyword_regex,
+                        keyword_hits,
+                        flag_candidates,
+                        flag_regex,
+                        min_length,
+                        strings_sample,
+                    )
+                chunk_len = len(chunk)
+                for match in _PRINTABLE_RUN.finditer(chunk):
+                    start, end = match.span()
+                    if not string_buffer:
+                        current_start = offset + start
+                    string_buffer += match.group()
+                    if end < chunk_len:
                         total_strings = self._finalise_string(
                             string_buffer,
                             current_start,
                             total_strings,
                             sample_limit,
                             keyword_map,
+                            keyword_regex,
                             keyword_hits,
                             flag_candidates,
                             flag_regex,
                             min_length,
                             strings_sample,
                         )
-                offset += len(chunk)
+                offset += chunk_len
 
         total_strings = self._finalise_string(
             string_buffer,
@@ -136,6 +188,7 @@ class MemoryAnalyzerTool:
             total_strings,
             sample_limit,
             keyword_map,
+            keyword_regex,
             keyword_hits,
             flag_candidates,
             flag_regex,
@@ -202,6 +255,7 @@ class MemoryAnalyzerTool:
         total_strings: int,
         sample_limit: int,
         keyword_map: Dict[str, str],
+        keyword_regex: Optional[re.Pattern[str]],
         keyword_hits: Dict[str, List[Dict[str, object]]],
         flag_candidates: List[Dict[str, object]],
         flag_regex: re.Pattern[str],
@@ -216,12 +270,13 @@ class MemoryAnalyzerTool:
         total_strings += 1
         if len(strings_sample) < sample_limit:
             strings_sample.append({"offset": start_offset, "value": value})
-        lower_value = value.lower()
-        for key, label in keyword_map.items():
-            if key and key in lower_value:
-                hits = keyword_hits.setdefault(key, [])
-                if len(hits) < sample_limit:
-                    hits.append({"offset": start_offset, "value": value})
+        if keyword_regex is not None and keyword_regex.search(value):
+            lower_value = value.lower()
+            for key, label in keyword_map.items():
+                if key and key in lower_value:
+                    hits = keyword_hits.setdefault(key, [])
+                    if len(hits) < sample_limit:
+                        hits.append({"offset": start_offset, "value": value})
         for match in flag_regex.finditer(value):
             if len(flag_candidates) < sample_limit * 2:
                 flag_candidates.append({"offset": start_offset + match.start(), "value": match.group()})
@@ -19,7 +19,12 @@ class PcapViewerTool:
     description = "Summarise packet captures (PCAP and PCAPNG), conversations, and top talkers."
     category = "Forensics"
 
-    def run(self, file_path: str, packet_limit: str = "200", include_hex: str = "false") -> ToolResult:
+    def run(
+        self,
+        file_path: str,
+        packet_limit: str | int = "200",
+        include_hex: str | bool = "false",
+    ) -> ToolResult:
         path = Path(file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(path)
@@ -6,12 +6,27 @@ import csv
 import hashlib
 import io
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..base import ToolResult
 
+_HASH_CHUNK_SIZE = 1 << 20
+_HASH_BUFFERS = threading.local()
+
+
+def _hash_buffer() -> memoryview:
+    """Return this thread's reusable read buffer for file hashing."""
+    view = getattr(_HASH_BUFFERS, "view", None)
+    if view is None:
+        view = memoryview(bytearray(_HASH_CHUNK_SIZE))
+        _HASH_BUFFERS.view = view
+    return view
+
 
 class TimelineBuilderTool:
     """Builds lightweight timelines from local directories or files."""
@@ -23,10 +38,10 @@ class TimelineBuilderTool:
     def run(
         self,
         target_path: str,
-        max_entries: str = "500",
-        include_directories: str = "true",
+        max_entries: str | int = "500",
+        include_directories: str | bool = "true",
         output_format: str = "csv",
-        include_hashes: str = "false",
+        include_hashes: str | bool = "false",
     ) -> ToolResult:
         path = Path(target_path).expanduser()
         if not path.exists():
@@ -75,22 +90,30 @@ class TimelineBuilderTool:
         entries: List[Dict[str, object]] = []
         notes: List[str] = []
 
-        def _add_entry(candidate: Path) -> None:
+        def _index_one(candidate: Path) -> Tuple[Optional[Dict[str, object]], Optional[str]]:
             try:
-                entry = self._build_entry(candidate, include_hashes=include_hashes)
+                return self._build_entry(candidate, include_hashes=include_hashes), None
             except OSError as exc:
-                notes.append(f"Skipped {candidate}: {exc}")
-                return
-            entries.append(entry)
+                return None, f"Skipped {candidate}: {exc}"
 
         if path.is_file():
-            _add_entry(path)
+            candidates = [path]
         else:
-            iterator = path.rglob("*")
-            for candidate in iterator:
-                if candidate.is_dir() and not include_dirs:
-                    continue
-                _add_entry(candidate)
+            candidates = [
+                candidate
+                for candidate in path.rglob("*")
+                if include_dirs or not candidate.is_dir()
+            ]
+
+        # stat() and sha256 release the GIL, so a thread pool overlaps the I/O
+        # and hashing of independent files; map() keeps notes in walk order.
+        workers = min(8, os.cpu_count() or 1, max(1, len(candidates)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for entry, note in executor.map(_index_one, candidates):
+                if note is not None:
+                    notes.append(note)
+                elif entry is not None:
+                    entries.append(entry)
 
         entries.sort(key=lambda item: (item.get("modified") or "", item.get("path") or ""))
         truncated = len(entries) > limit
@@ -133,10 +156,10 @@ class TimelineBuilderTool:
 
     def _hash_file(self, path: Path) -> str:
         digest = hashlib.sha256()
-        chunk_size = 1 << 20
-        with path.open("rb") as fh:
-            while chunk := fh.read(chunk_size):
-                digest.update(chunk)
+        view = _hash_buffer()
+        with path.open("rb", buffering=0) as fh:
+            while size := fh.readinto(view):
+                digest.update(view[:size])
         return digest.hexdigest()
 
     def _truthy(self, value: str | bool | None) -> bool:
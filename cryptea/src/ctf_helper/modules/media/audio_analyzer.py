@@ -4,14 +4,28 @@ from __future__ import annotations
 
 import json
 import math
-import struct
+import sys
 import wave
+from array import array
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from ..base import ToolResult
 
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+    sliding_window_view = None  # type: ignore[assignment]
+
+_DTMF_LOW_FREQS = (697, 770, 852, 941)
+_DTMF_HIGH_FREQS = (1209, 1336, 1477, 1633)
+# Frames scored per matrix product; bounds the float copy of the signal.
+_DTMF_FRAME_BATCH = 2048
+
 
 @dataclass(slots=True)
 class AudioSummary:
@@ -24,6 +38,80 @@ class AudioSummary:
     clipping: bool
 
 
+@lru_cache(maxsize=4)
+def _decode_wav_cached(path: str, mtime_ns: int, channel_mode: str) -> tuple[AudioSummary, Sequence[int]]:
+    """Decode ``path`` into a single channel of integer samples.
+
+    ``mtime_ns`` is only part of the cache key so that an edited file is
+    decoded again. Samples are kept at 16 bits (an ``int16`` array, or an
+    ``array('b')``/``array('h')`` without numpy) so a cached entry is no
+    larger than the channel it holds. They are shared between callers and
+    must not be modified.
+    """
+    with wave.open(path, "rb") as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        sample_rate = wav.getframerate()
+        frames = wav.getnframes()
+        raw = wav.readframes(frames)
+
+    if sample_width not in {1, 2}:
+        raise ValueError("Only 8-bit and 16-bit PCM WAV files are supported")
+
+    step = sample_width * channels
+    total_frames = len(raw) // step if step else 0
+    raw = raw[: total_frames * step]
+
+    samples: Sequence[int]
+    if np is not None:
+        frame_array = np.frombuffer(raw, dtype=np.int8 if sample_width == 1 else "<i2").reshape(-1, channels)
+        if channel_mode == "left" and channels >= 1:
+            mono = frame_array[:, 0]
+        elif channel_mode == "right" and channels >= 2:
+            mono = frame_array[:, 1]
+        else:
+            mono = np.rint(frame_array.mean(axis=1))
+        mono = np.ascontiguousarray(mono, dtype=np.int16)
+        mono.flags.writeable = False
+        samples = mono
+    else:
+        interleaved = array("b" if sample_width == 1 else "h", raw)
+        if sample_width == 2 and sys.byteorder == "big":
+            interleaved.byteswap()
+        if channel_mode == "left" and channels >= 1:
+            samples = interleaved[0::channels]
+        elif channel_mode == "right" and channels >= 2:
+            samples = interleaved[1::channels]
+        elif channels == 1:
+            samples = interleaved
+        else:
+            lanes = [interleaved[index::channels] for index in range(channels)]
+            samples = array("h", (int(round(sum(frame) / channels)) for frame in zip(*lanes)))
+
+    duration = len(samples) / sample_rate if sample_rate else 0.0
+    if np is not None and len(samples):
+        # Widened for the arithmetic: int16 squares and abs(-32768) overflow.
+        wide = np.asarray(samples, dtype=np.int64)
+        rms = math.sqrt(int(np.dot(wide, wide)) / len(samples))
+        peak_val = int(np.abs(wide).max())
+    else:
+        rms = math.sqrt(sum(value * value for value in samples) / len(samples)) if samples else 0.0
+        peak_val = max((abs(value) for value in samples), default=0)
+    max_possible = float((1 << (sample_width * 8 - 1)) - 1)
+    clipping = peak_val >= max_possible
+
+    summary = AudioSummary(
+        duration_seconds=round(duration, 6),
+        channels=channels,
+        sample_rate=sample_rate,
+        sample_width=sample_width,
+        rms=rms,
+        peak=peak_val,
+        clipping=clipping,
+    )
+    return summary, samples
+
+
 class AudioAnalyzerTool:
     """Summarise PCM audio and detect simple DTMF/Morse patterns."""
 
@@ -54,9 +142,9 @@ class AudioAnalyzerTool:
             "summary": asdict(summary),
         }
 
-        if dtmf_enabled and samples:
+        if dtmf_enabled and len(samples):
             payload["dtmf_candidates"] = self._detect_dtmf(samples, summary.sample_rate, window)
-        if morse_enabled and samples:
+        if morse_enabled and len(samples):
             morse = self._detect_morse(samples, summary.sample_rate)
             if morse:
                 payload["morse"] = morse
@@ -68,47 +156,8 @@ class AudioAnalyzerTool:
     # Audio loading helpers
     # ------------------------------------------------------------------
     def _load_samples(self, path: Path, channel_mode: str) -> tuple[AudioSummary, Sequence[int]]:
-        with wave.open(str(path), "rb") as wav:
-            channels = wav.getnchannels()
-            sample_width = wav.getsampwidth()
-            sample_rate = wav.getframerate()
-            frames = wav.getnframes()
-            raw = wav.readframes(frames)
-
-        if sample_width not in {1, 2}:
-            raise ValueError("Only 8-bit and 16-bit PCM WAV files are supported")
-
-        step = sample_width * channels
-        total_frames = len(raw) // step if step else 0
-        fmt_char = "b" if sample_width == 1 else "h"
-        fmt = "<" + fmt_char * channels
-
-        samples: List[int] = []
-        for frame in struct.iter_unpack(fmt, raw[: total_frames * step]):
-            if channel_mode == "left" and channels >= 1:
-                value = frame[0]
-            elif channel_mode == "right" and channels >= 2:
-                value = frame[1]
-            else:
-                value = sum(frame) / len(frame)
-            samples.append(int(round(value)))
-
-        duration = len(samples) / sample_rate if sample_rate else 0.0
-        rms = self._rms(samples)
-        peak_val = max((abs(value) for value in samples), default=0)
-        max_possible = float((1 << (sample_width * 8 - 1)) - 1)
-        clipping = peak_val >= max_possible
-
-        summary = AudioSummary(
-            duration_seconds=round(duration, 6),
-            channels=channels,
-            sample_rate=sample_rate,
-            sample_width=sample_width,
-            rms=rms,
-            peak=peak_val,
-            clipping=clipping,
-        )
-        return summary, samples
+        summary, samples = _decode_wav_cached(str(path), path.stat().st_mtime_ns, channel_mode)
+        return AudioSummary(**asdict(summary)), samples
 
     # ------------------------------------------------------------------
     # DTMF detection
@@ -116,8 +165,6 @@ class AudioAnalyzerTool:
     def _detect_dtmf(self, samples: Sequence[int], sample_rate: int, window_ms: int) -> List[Dict[str, object]]:
         window_samples = max(int(sample_rate * window_ms / 1000), sample_rate // 20, 80)
         step = max(window_samples // 2, 40)
-        low_freqs = [697, 770, 852, 941]
-        high_freqs = [1209, 1336, 1477, 1633]
         digit_map = {
             (697, 1209): "1",
             (697, 1336): "2",
@@ -139,22 +186,14 @@ class AudioAnalyzerTool:
 
         detections: List[Dict[str, object]] = []
         active: Optional[Dict[str, object]] = None
-        total_samples = len(samples)
 
-        for start in range(0, total_samples - window_samples + 1, step):
-            window = samples[start : start + window_samples]
-            if not window:
-                continue
-            max_abs = max(abs(value) for value in window)
+        for start, max_abs, low_scores, high_scores in self._dtmf_frames(samples, sample_rate, window_samples, step):
             if max_abs < 40:
                 if active:
                     detections.append(active)
                     active = None
                 continue
 
-            low_scores = {freq: self._goertzel(window, sample_rate, freq) for freq in low_freqs}
-            high_scores = {freq: self._goertzel(window, sample_rate, freq) for freq in high_freqs}
-
             best_low = max(low_scores.items(), key=lambda item: item[1])
             best_high = max(high_scores.items(), key=lambda item: item[1])
             second_low = sorted((value for key, value in low_scores.items() if key != best_low[0]), reverse=True)
@@ -202,6 +241,56 @@ class AudioAnalyzerTool:
 
         return detections
 
+    def _dtmf_frames(
+        self, samples: Sequence[int], sample_rate: int, window_samples: int, step: int
+    ) -> Iterator[tuple[int, int, Dict[int, float], Dict[int, float]]]:
+        """Yield ``(start, max_abs, low_scores, high_scores)`` for each analysis window.
+
+        Scores are the Goertzel power of each DTMF tone. Quiet windows
+        (``max_abs < 40``) carry empty score dicts since they are never ranked.
+        """
+        if np is not None and isinstance(samples, np.ndarray):
+            yield from self._dtmf_frames_numpy(samples, sample_rate, window_samples, step)
+            return
+        for start in range(0, len(samples) - window_samples + 1, step):
+            window = samples[start : start + window_samples]
+            max_abs = max(abs(value) for value in window)
+            if max_abs < 40:
+                yield start, max_abs, {}, {}
+                continue
+            low_scores = {freq: self._goertzel(window, sample_rate, freq) for freq in _DTMF_LOW_FREQS}
+            high_scores = {freq: self._goertzel(window, sample_rate, freq) for freq in _DTMF_HIGH_FREQS}
+            yield start, max_abs, low_scores, high_scores
+
+    def _dtmf_frames_numpy(
+        self, samples: "np.ndarray", sample_rate: int, window_samples: int, step: int
+    ) -> Iterator[tuple[int, int, Dict[int, float], Dict[int, float]]]:
+        if len(samples) < window_samples:
+            return
+        freqs = _DTMF_LOW_FREQS + _DTMF_HIGH_FREQS
+        # Only eight DFT bins are needed, so project each frame onto their
+        # basis vectors rather than computing a full FFT. Bin selection
+        # matches _goertzel, whose power equals |X[k]|^2 for the same k.
+        bins = np.array([int(0.5 + (window_samples * freq) / sample_rate) for freq in freqs], dtype=np.float64)
+        phase = (2.0 * np.pi / window_samples) * np.outer(np.arange(window_samples, dtype=np.float64), bins)
+        cos_basis = np.cos(phase)
+        sin_basis = np.sin(phase)
+        frames = sliding_window_view(samples, window_samples)[::step]
+        starts = range(0, len(samples) - window_samples + 1, step)
+        for offset in range(0, len(frames), _DTMF_FRAME_BATCH):
+            batch = frames[offset : offset + _DTMF_FRAME_BATCH]
+            block = batch.astype(np.float64)
+            # Taken from the float copy, since abs() of an int16 -32768 overflows.
+            peaks = np.abs(block).max(axis=1).astype(np.int64).tolist()
+            power = ((block @ cos_basis) ** 2 + (block @ sin_basis) ** 2).tolist()
+            for index, max_abs in enumerate(peaks):
+                start = starts[offset + index]
+                if max_abs < 40:
+                    yield start, max_abs, {}, {}
+                    continue
+                scores = power[index]
+                yield start, max_abs, dict(zip(_DTMF_LOW_FREQS, scores[:4])), dict(zip(_DTMF_HIGH_FREQS, scores[4:]))
+
     def _goertzel(self, samples: Sequence[int], sample_rate: int, target_freq: int) -> float:
         k = int(0.5 + ((len(samples) * target_freq) / sample_rate))
         omega = (2.0 * math.pi * k) / len(samples)
@@ -223,18 +312,10 @@ class AudioAnalyzerTool:
     # Morse approximation
     # ------------------------------------------------------------------
     def _detect_morse(self, samples: Sequence[int], sample_rate: int) -> Dict[str, object]:
-        if not samples:
+        if not len(samples):
             return {}
         chunk = max(sample_rate // 200, 20)
-        prefix = self._prefix_squares(samples)
-        windows: List[tuple[float, int]] = []
-        for start in range(0, len(samples), chunk):
-            end = min(len(samples), start + chunk)
-            length = end - start
-            if length <= 0:
-                continue
-            rms = self._window_rms(prefix, start, end)
-            windows.append((rms, length))
+        windows = self._chunk_rms(samples, chunk)
         if not windows:
             return {}
 
@@ -340,11 +421,23 @@ class AudioAnalyzerTool:
     # ------------------------------------------------------------------
     # Misc helpers
     # ------------------------------------------------------------------
-    def _rms(self, samples: Sequence[int]) -> float:
-        if not samples:
-            return 0.0
-        mean = sum(value * value for value in samples) / len(samples)
-        return math.sqrt(mean)
+    def _chunk_rms(self, samples: Sequence[int], chunk: int) -> List[tuple[float, int]]:
+        """Return ``(rms, length)`` for consecutive ``chunk``-sized slices of ``samples``."""
+        if np is not None and isinstance(samples, np.ndarray):
+            starts = np.arange(0, len(samples), chunk)
+            sums = np.add.reduceat(samples.astype(np.float64) ** 2, starts)
+            lengths = np.diff(np.append(starts, len(samples)))
+            rms_values = np.sqrt(np.where(sums > 0, sums, 0.0) / lengths)
+            return list(zip(rms_values.tolist(), lengths.tolist()))
+        prefix = self._prefix_squares(samples)
+        windows: List[tuple[float, int]] = []
+        for start in range(0, len(samples), chunk):
+            end = min(len(samples), start + chunk)
+            length = end - start
+            if length <= 0:
+                continue
+            windows.append((self._window_rms(prefix, start, end), length))
+        return windows
 
     def _prefix_squares(self, samples: Sequence[int]) -> List[float]:
         prefix: List[float] = [0.0]
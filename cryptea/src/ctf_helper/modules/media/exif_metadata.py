@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import re
+import select
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..base import ToolResult
 
@@ -19,6 +24,180 @@ except ImportError:  # pragma: no cover - exercised when Pillow missing
     Image = None  # type: ignore
     ExifTags = None  # type: ignore
 
+try:  # Optional faster JSON decoder for large exiftool dumps
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised when orjson missing
+    orjson = None  # type: ignore
+
+
+class ExifToolSession:
+    """A long-lived ``exiftool -stay_open`` process that serves one file per request.
+
+    Perl start-up dominates exiftool's runtime on small images, so the process
+    is kept alive between runs. Requests are serialised with a lock because the
+    process reads one argument stream.
+    """
+
+    _READY = b"{ready}\n"
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+
+    def execute(self, path: Path, timeout: float = 45.0) -> Tuple[bytes, bytes]:
+        """Return exiftool's ``-json`` output for ``path`` and what it wrote to stderr.
+
+        ``path`` must pass :func:`_argfile_safe`. ``-echo4`` marks the end of
+        each request's stderr the way ``-execute`` marks the end of stdout.
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+            proc.stdin.write(f"{path}\n-echo4\n{{ready}}\n-execute\n".encode("utf-8"))
+            proc.stdin.flush()
+            pending = {proc.stdout.fileno(): bytearray(), proc.stderr.fileno(): bytearray()}
+            output, errors = pending.values()
+            deadline = time.monotonic() + timeout
+            while not (output.endswith(self._READY) and errors.endswith(self._READY)):
+                waiting = [fd for fd, data in pending.items() if not data.endswith(self._READY)]
+                remaining = deadline - time.monotonic()
+                ready = select.select(waiting, [], [], remaining)[0] if remaining > 0 else []
+                if not ready:
+                    self._terminate()
+                    raise subprocess.TimeoutExpired(self.command, timeout)
+                for fd in ready:
+                    data = os.read(fd, 65536)
+                    if not data:
+                        self._terminate()
+                        raise OSError("exiftool exited unexpectedly")
+                    pending[fd] += data
+            return bytes(output[: -len(self._READY)]), bytes(errors[: -len(self._READY)])
+
+    def close(self) -> None:
+        with self._lock:
+            proc = self._proc
+            self._proc = None
+            if proc is None or proc.poll() is not None:
+                return
+            try:
+                assert proc.stdin is not None
+                proc.stdin.write(b"-stay_open\nFalse\n")
+                proc.stdin.flush()
+                proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [self.command, "-stay_open", "True", "-@", "-", "-common_args", "-json"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+        return self._proc
+
+    def _terminate(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+class ExifToolPool:
+    """Up to ``size`` stay-open exiftool sessions shared by concurrent callers.
+
+    Sessions are spawned on demand and handed out most-recently-used first, so
+    a single caller keeps reusing one warm process while batch runs fan out
+    across the pool.
+    """
+
+    def __init__(self, command: str, size: Optional[int] = None) -> None:
+        self.command = command
+        self.size = max(1, size or min(4, os.cpu_count() or 1))
+        self._idle: "queue.LifoQueue[ExifToolSession]" = queue.LifoQueue()
+        self._sessions: List[ExifToolSession] = []
+        self._lock = threading.Lock()
+
+    def execute(self, path: Path, timeout: float = 45.0) -> Tuple[bytes, bytes]:
+        session = self._checkout()
+        try:
+            return session.execute(path, timeout=timeout)
+        finally:
+            self._idle.put(session)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+
+    def _checkout(self) -> ExifToolSession:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._sessions) < self.size:
+                session = ExifToolSession(self.command)
+                self._sessions.append(session)
+                return session
+        return self._idle.get()
+
+
+def _argfile_safe(arg: str) -> bool:
+    """Whether exiftool reads ``arg`` back unchanged from a ``-@`` argument file.
+
+    Argument files hold one argument per line with surrounding whitespace
+    stripped; lines starting with ``#`` are comments and ones starting with
+    ``-`` are options.
+    """
+    if not arg or arg != arg.strip() or "\n" in arg or "\r" in arg or arg.startswith(("#", "-")):
+        return False
+    try:
+        arg.encode("utf-8")
+    except UnicodeEncodeError:  # undecodable file name bytes
+        return False
+    return True
+
+
+def _loads_json(text: str | bytes) -> Any:
+    """Decode exiftool JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            if isinstance(text, str):
+                raise
+    if isinstance(text, bytes):
+        # exiftool passes odd tag bytes through; keep the old lenient decode.
+        text = text.decode("utf-8", errors="replace")
+    return json.loads(text)
+
+
+_POOLS: Dict[str, ExifToolPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _exiftool_pool(command: str) -> ExifToolPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(command)
+        if pool is None:
+            pool = _POOLS[command] = ExifToolPool(command)
+        return pool
+
+
+def shutdown_exiftool_sessions() -> None:
+    """Stop any persistent exiftool processes; called on application shutdown."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
 
 class ExifMetadataTool:
     """Inspect metadata via exiftool when available with safe fallbacks."""
@@ -68,6 +247,21 @@ class ExifMetadataTool:
             mime_type="application/json",
         )
 
+    def run_many(self, file_paths: Iterable[str], prefer_exiftool: str | bool = "true") -> Iterator[ToolResult]:
+        """Run :meth:`run` over several files, yielding results as they complete.
+
+        Lookups are spread over the shared exiftool pool, one worker per session.
+        """
+        paths = list(file_paths)
+        if not paths:
+            return
+        command = self._resolve_command("exiftool", "CTF_HELPER_EXIFTOOL")
+        workers = _exiftool_pool(command).size if command else 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix="exiftool") as executor:
+            futures = [executor.submit(self.run, path, prefer_exiftool) for path in paths]
+            for future in as_completed(futures):
+                yield future.result()
+
     # ------------------------------------------------------------------
     # Extraction helpers
     # ------------------------------------------------------------------
@@ -75,6 +269,22 @@ class ExifMetadataTool:
         command = self._resolve_command("exiftool", "CTF_HELPER_EXIFTOOL")
         if not command:
             return {"available": False, "message": "exiftool not detected in PATH."}
+        # The stay-open argument stream is line based, so paths it cannot
+        # carry verbatim fall back to a one-shot exiftool process.
+        path = path.absolute()
+        if _argfile_safe(str(path)):
+            try:
+                output, errors = _exiftool_pool(command).execute(path)
+            except FileNotFoundError:
+                return {"available": False, "message": "Failed to execute exiftool."}
+            except subprocess.TimeoutExpired:
+                return {"available": False, "message": "exiftool timed out after 45 seconds."}
+            except OSError as exc:
+                return {"available": False, "message": f"exiftool failed: {exc}"}
+            if not output.strip():
+                message = errors.decode("utf-8", errors="replace").strip() or "exiftool returned no metadata"
+                return {"available": False, "message": message}
+            return self._parse_exiftool_json(output)
         try:
             proc = subprocess.run(
                 [command, "-json", str(path)],
@@ -90,9 +300,12 @@ class ExifMetadataTool:
         if proc.returncode != 0:
             message = proc.stderr.strip() or "exiftool returned a non-zero exit status"
             return {"available": False, "message": message}
+        return self._parse_exiftool_json(proc.stdout)
+
+    def _parse_exiftool_json(self, text: str | bytes) -> Dict[str, Any]:
         try:
-            payload = json.loads(proc.stdout)
-        except json.JSONDecodeError as exc:
+            payload = _loads_json(text)
+        except ValueError as exc:
             return {"available": False, "message": f"Failed to parse exiftool output: {exc}"}
         data = payload[0] if isinstance(payload, list) and payload else payload
         return {"available": True, "data": data}
@@ -9,7 +9,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..base import ToolResult
 
@@ -25,7 +25,7 @@ class ImageStegoTool:
         self,
         image_path: str,
         steghide_password: str = "",
-        steghide_extract: str = "false",
+        steghide_extract: str | bool = "false",
         stegsolve_jar: str = "",
         tool_choice: str = "all",
     ) -> ToolResult:
@@ -60,6 +60,17 @@ class ImageStegoTool:
             mime_type = "application/json"
         return ToolResult(title=title, body=body, mime_type=mime_type)
 
+    def zsteg_argv(self, image_path: str) -> Optional[List[str]]:
+        """Return the zsteg command line for ``image_path``, or None when zsteg is missing.
+
+        Lets callers with their own event loop stream zsteg output instead of
+        waiting for :meth:`run` to collect it.
+        """
+        command = self._resolve_command("zsteg", "CTF_HELPER_ZSTEG")
+        if not command:
+            return None
+        return [command, "--all", str(Path(image_path).expanduser())]
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
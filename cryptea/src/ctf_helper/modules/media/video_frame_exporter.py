@@ -8,11 +8,26 @@ import os
 import shutil
 import subprocess
 import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..base import ToolResult
 
+# Seconds an ffmpeg export may run before it is stopped.
+EXPORT_TIMEOUT = 240
+
+
+@dataclass(slots=True)
+class FrameExportPlan:
+    """Everything needed to run one ffmpeg export and summarise it afterwards."""
+
+    path: Path
+    destination: Path
+    analyse: bool
+    summary: Dict[str, object] = field(default_factory=dict)
+    argv: Optional[List[str]] = None
+
 
 class VideoFrameExporterTool:
     """Use ffmpeg when available to export still frames."""
@@ -29,6 +44,35 @@ class VideoFrameExporterTool:
         max_frames: str = "0",
         analyze_frames: str = "false",
     ) -> ToolResult:
+        plan = self.plan_export(file_path, output_dir, interval_seconds, max_frames, analyze_frames)
+        if plan.argv is None:
+            return self._result(plan)
+
+        try:
+            proc = subprocess.run(plan.argv, capture_output=True, text=True, timeout=EXPORT_TIMEOUT, check=False)
+        except FileNotFoundError:
+            plan.summary["ffmpeg"] = {
+                "available": False,
+                "message": "Failed to execute ffmpeg command.",
+            }
+            return self._result(plan)
+        except subprocess.TimeoutExpired:
+            return self.finish_export(plan, None, "", "", timed_out=True)
+        return self.finish_export(plan, proc.returncode, proc.stdout, proc.stderr)
+
+    def plan_export(
+        self,
+        file_path: str,
+        output_dir: str = "",
+        interval_seconds: str = "2",
+        max_frames: str = "0",
+        analyze_frames: str = "false",
+    ) -> FrameExportPlan:
+        """Validate the options and build the ffmpeg command line without running it.
+
+        ``plan.argv`` is None when ffmpeg is missing; the summary already says so.
+        Callers that drive ffmpeg themselves pass its outcome to :meth:`finish_export`.
+        """
         path = Path(file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(path)
@@ -48,17 +92,14 @@ class VideoFrameExporterTool:
             "max_frames": limit,
             "analyze_frames": needs_analysis,
         }
+        plan = FrameExportPlan(path=path, destination=destination, analyse=needs_analysis, summary=summary)
 
         if not command:
             summary["ffmpeg"] = {
                 "available": False,
                 "message": "ffmpeg not detected. Install it or set CTF_HELPER_FFMPEG.",
             }
-            return ToolResult(
-                title=f"Frame export for {path.name}",
-                body=json.dumps(summary, indent=2),
-                mime_type="application/json",
-            )
+            return plan
 
         pattern = destination / "frame_%06d.png"
         args = [
@@ -75,54 +116,48 @@ class VideoFrameExporterTool:
         if limit:
             args.extend(["-frames:v", str(limit)])
         args.append(str(pattern))
+        plan.argv = args
+        return plan
 
-        try:
-            proc = subprocess.run(args, capture_output=True, text=True, timeout=240, check=False)
-        except FileNotFoundError:
-            summary["ffmpeg"] = {
-                "available": False,
-                "message": "Failed to execute ffmpeg command.",
-            }
-            return ToolResult(
-                title=f"Frame export for {path.name}",
-                body=json.dumps(summary, indent=2),
-                mime_type="application/json",
-            )
-        except subprocess.TimeoutExpired:
-            summary["ffmpeg"] = {
+    def finish_export(
+        self,
+        plan: FrameExportPlan,
+        exit_code: Optional[int],
+        stdout: str,
+        stderr: str,
+        timed_out: bool = False,
+    ) -> ToolResult:
+        """Summarise the frames ffmpeg wrote for ``plan``, including those written before a timeout."""
+        if timed_out:
+            plan.summary["ffmpeg"] = {
                 "available": True,
                 "timed_out": True,
-                "message": "ffmpeg timed out after 240 seconds.",
+                "message": f"ffmpeg timed out after {EXPORT_TIMEOUT} seconds.",
+            }
+        else:
+            plan.summary["ffmpeg"] = {
+                "available": True,
+                "exit_code": exit_code,
+                "stdout": (stdout or "").strip(),
+                "stderr": (stderr or "").strip(),
             }
-            return ToolResult(
-                title=f"Frame export for {path.name}",
-                body=json.dumps(summary, indent=2),
-                mime_type="application/json",
-            )
-
-        stdout = (proc.stdout or "").strip()
-        stderr = (proc.stderr or "").strip()
-        summary["ffmpeg"] = {
-            "available": True,
-            "exit_code": proc.returncode,
-            "stdout": stdout,
-            "stderr": stderr,
-        }
 
-        frames = sorted(destination.glob("frame_*.png"))
-        summary["frames_found"] = len(frames)
-        if needs_analysis:
-            summary["frames"] = [self._analyse_frame(frame) for frame in frames]
+        frames = sorted(plan.destination.glob("frame_*.png"))
+        plan.summary["frames_found"] = len(frames)
+        if plan.analyse:
+            plan.summary["frames"] = [self._analyse_frame(frame) for frame in frames]
+        return self._result(plan)
 
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _result(self, plan: FrameExportPlan) -> ToolResult:
         return ToolResult(
-            title=f"Frame export for {path.name}",
-            body=json.dumps(summary, indent=2),
+            title=f"Frame export for {plan.path.name}",
+            body=json.dumps(plan.summary, indent=2),
             mime_type="application/json",
         )
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
     def _analyse_frame(self, frame: Path) -> Dict[str, object]:
         sha256 = hashlib.sha256()
         try:
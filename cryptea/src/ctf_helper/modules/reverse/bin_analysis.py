@@ -2,14 +2,86 @@
 
 from __future__ import annotations
 
+import io
+import mmap
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Tuple
 
 from ..base import ToolResult
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=16)
+def _ascii_pattern(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"[\x20-\x7e]{%d,}" % min_len)
+
+
+@lru_cache(maxsize=16)
+def _utf16_pattern(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"(?:[\x20-\x7e]\x00){%d,}" % min_len)
+
+
+@lru_cache(maxsize=16)
+def _term_pattern(term: str, utf16: bool) -> re.Pattern[bytes]:
+    raw = term.encode("ascii")
+    if utf16:
+        needle = b"".join(re.escape(raw[i : i + 1]) + b"\x00" for i in range(len(raw)))
+    else:
+        needle = re.escape(raw)
+    return re.compile(needle, re.IGNORECASE)
+
+
+def _searchable(term: str) -> bool:
+    """True when ``term`` can only occur inside runs the scanners report."""
+    return all(0x20 <= ord(char) <= 0x7E for char in term)
+
+
+def _utf16_runs_numpy(data: bytes | mmap.mmap, min_len: int) -> List[Tuple[int, int]]:
+    """Byte spans matching :func:`_utf16_pattern`, found with vectorised masks.
+
+    A UTF-16LE character is a printable byte followed by a NUL. Runs at even
+    and odd offsets cannot share bytes, so each alignment is scanned on its own
+    and the spans are merged in file order, as ``finditer`` would report them.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    spans: List[Tuple[int, int]] = []
+    for offset in (0, 1):
+        pairs = raw[offset : offset + (raw.size - offset) // 2 * 2].reshape(-1, 2)
+        low = pairs[:, 0]
+        hits = (low >= 0x20) & (low <= 0x7E) & (pairs[:, 1] == 0)
+        edges = np.diff(np.concatenate(([0], hits.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = ends - starts >= min_len
+        spans.extend(zip((offset + 2 * starts[keep]).tolist(), (offset + 2 * ends[keep]).tolist()))
+    spans.sort()
+    return spans
+
+
+# Raw extractions of recently scanned files, keyed by (path, mtime_ns, size,
+# unicode) and holding the minimum length they were taken at and their
+# estimated size in bytes. Re-running with other filters, or a larger minimum
+# length, then skips reading the file. An extraction is only kept while it
+# fits in _EXTRACT_CACHE_MAX_BYTES; larger ones are streamed and forgotten.
+# The least recently used entries are dropped once the total passes it.
+_EXTRACT_CACHE: "OrderedDict[Tuple[str, int, int, bool], Tuple[int, Tuple[str, ...], int]]" = OrderedDict()
+_EXTRACT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_EXTRACT_CACHE_LOCK = threading.Lock()
+# Per-string cost beyond its characters: the str header plus its tuple slot.
+_STRING_OVERHEAD = sys.getsizeof("") + 8
+
 
 class StringsExtractTool:
     name = "Extract Strings"
@@ -19,85 +91,238 @@ class StringsExtractTool:
     def run(
         self,
         file_path: str,
-        min_length: str = "4",
-        unicode: str = "false",
-        unique: str = "true",
+        min_length: str | int = 4,
+        unicode: str | bool = False,
+        unique: str | bool = True,
         search: str = "",
-        limit: str = "0",
+        limit: str | int = 0,
     ) -> ToolResult:
+        path, strings = self._collect(file_path, min_length, unicode, unique, search, limit)
+        body = "\n".join(strings)
+        title = f"{len(strings)} strings from {path.name}"
+        return ToolResult(title=title, body=body)
+
+    def run_stream(
+        self,
+        file_path: str,
+        min_length: str | int = 4,
+        unicode: str | bool = False,
+        unique: str | bool = True,
+        search: str = "",
+        limit: str | int = 0,
+        chunk_size: int = 4096,
+    ) -> Iterator[str]:
+        """Yield the strings :meth:`run` reports, newline-joined in batches of about ``chunk_size`` characters.
+
+        Strings are passed on as the extractor finds them, so they come in file
+        order rather than sorted, and ``limit`` keeps the first ones found.
+        """
+        _path, strings = self._filtered(file_path, min_length, unicode, unique, search)
+        limit_count = max(0, int(limit or 0))
+        batch: List[str] = []
+        size = 0
+        for index, item in enumerate(strings):
+            if limit_count and index >= limit_count:
+                break
+            line = item if index == 0 else "\n" + item
+            batch.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield "".join(batch)
+                batch.clear()
+                size = 0
+        if batch:
+            yield "".join(batch)
+
+    def _collect(
+        self,
+        file_path: str,
+        min_length: str | int,
+        unicode: str | bool,
+        unique: str | bool,
+        search: str,
+        limit: str | int,
+    ) -> Tuple[Path, List[str]]:
+        path, found = self._filtered(file_path, min_length, unicode, unique, search)
+        strings = sorted(found, key=str.lower)
+        limit_count = max(0, int(limit or 0))
+        if limit_count > 0:
+            strings = strings[:limit_count]
+        return path, strings
+
+    def _filtered(
+        self,
+        file_path: str,
+        min_length: str | int,
+        unicode: str | bool,
+        unique: str | bool,
+        search: str,
+    ) -> Tuple[Path, Iterator[str]]:
         path = Path(file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(path)
-        min_len = max(1, int(min_length or "1"))
+        min_len = max(1, int(min_length or 1))
         include_unicode = self._truthy(unicode)
         unique_only = self._truthy(unique)
-        limit_count = max(0, int(limit or "0"))
         term = search.lower().strip()
 
-        strings = self._extract_with_system(path, min_len, include_unicode)
-        if strings is None:
-            data = path.read_bytes()
-            strings = list(self._extract_fallback(data, min_len, include_unicode))
+        found = self._extract_cached(path, min_len, include_unicode, term)
 
-        if unique_only:
+        # Dedupe and filter while extracting so only kept strings are held.
+        def kept() -> Iterator[str]:
             seen = set()
-            deduped: List[str] = []
-            for item in strings:
+            for item in found:
                 lower = item.lower()
-                if lower in seen:
+                if unique_only:
+                    if lower in seen:
+                        continue
+                    seen.add(lower)
+                if term and term not in lower:
                     continue
-                seen.add(lower)
-                deduped.append(item)
-            strings = deduped
+                yield item
 
-        if term:
-            strings = [item for item in strings if term in item.lower()]
+        return path, kept()
 
-        strings.sort(key=str.lower)
-        if limit_count > 0:
-            strings = strings[:limit_count]
+    def _extract_cached(self, path: Path, min_len: int, include_unicode: bool, term: str = "") -> Iterable[str]:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size, include_unicode)
+        with _EXTRACT_CACHE_LOCK:
+            cached = _EXTRACT_CACHE.get(key)
+            if cached is not None:
+                _EXTRACT_CACHE.move_to_end(key)
+        if cached is not None and cached[0] <= min_len:
+            cached_min, items, _size = cached
+            if cached_min == min_len:
+                return items
+            return (item for item in items if len(item) >= min_len)
 
-        body = "\n".join(strings)
-        title = f"{len(strings)} strings from {path.name}"
-        return ToolResult(title=title, body=body)
+        found = self._extract_with_system(path, min_len, include_unicode)
+        if found is None:
+            if term and _searchable(term):
+                # A filtered scan is not worth caching; it only holds the
+                # runs around each hit of the search term.
+                return self._extract_from_file(path, min_len, include_unicode, term)
+            found = self._extract_from_file(path, min_len, include_unicode)
+        return self._fill_cache(key, min_len, found)
 
-    def _extract_with_system(self, path: Path, min_len: int, include_unicode: bool) -> List[str] | None:
+    def _fill_cache(self, key: Tuple[str, int, int, bool], min_len: int, found: Iterable[str]) -> Iterator[str]:
+        """Pass ``found`` through, caching it once exhausted if it stayed within the byte budget."""
+        kept: List[str] | None = []
+        size = 0
+        for item in found:
+            if kept is not None:
+                size += len(item) + _STRING_OVERHEAD
+                if size > _EXTRACT_CACHE_MAX_BYTES:
+                    kept = None  # too big to cache; keep streaming from the source
+                else:
+                    kept.append(item)
+            yield item
+        if kept is None:
+            return
+        with _EXTRACT_CACHE_LOCK:
+            _EXTRACT_CACHE[key] = (min_len, tuple(kept), size)
+            _EXTRACT_CACHE.move_to_end(key)
+            total = sum(entry[2] for entry in _EXTRACT_CACHE.values())
+            while total > _EXTRACT_CACHE_MAX_BYTES:
+                _key, (_min, _items, dropped) = _EXTRACT_CACHE.popitem(last=False)
+                total -= dropped
+
+    def _extract_with_system(self, path: Path, min_len: int, include_unicode: bool) -> Iterator[str] | None:
         binary = shutil.which("strings")
         if not binary:
             return None
-        args = [binary, f"-n{min_len}", str(path)]
-        result = subprocess.run(
-            args,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        output = result.stdout or result.stderr
-        if not include_unicode:
-            return output.splitlines()
-        # include UTF-16LE strings via additional invocation if available
-        unicode_args = [binary, "-el", f"-n{min_len}", str(path)]
-        ures = subprocess.run(
-            unicode_args,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        combined = output.splitlines() + (ures.stdout or ures.stderr).splitlines()
-        return combined
-
-    def _extract_fallback(self, data: bytes, min_len: int, include_unicode: bool) -> Iterable[str]:
-        ascii_pattern = re.compile(rb"[\x20-\x7e]{%d,}" % min_len)
-        for match in ascii_pattern.finditer(data):
+        return self._run_system_strings(binary, path, min_len, include_unicode)
+
+    def _run_system_strings(self, binary: str, path: Path, min_len: int, include_unicode: bool) -> Iterator[str]:
+        yield from self._strings_lines([binary, f"-n{min_len}", str(path)])
+        if include_unicode:
+            # include UTF-16LE strings via additional invocation if available
+            yield from self._strings_lines([binary, "-el", f"-n{min_len}", str(path)])
+
+    def _strings_lines(self, args: List[str]) -> Iterator[str]:
+        # strings output can be larger than the input file; spill it to a
+        # temporary file and read it back line by line instead of holding it
+        # as one string.
+        with tempfile.TemporaryFile() as output:
+            result = subprocess.run(
+                args,
+                check=False,
+                stdout=output,
+                stderr=subprocess.PIPE,
+            )
+            if output.tell() == 0:
+                yield from result.stderr.decode(errors="replace").splitlines()
+                return
+            output.seek(0)
+            for line in io.TextIOWrapper(output, errors="replace"):
+                yield line.rstrip("\r\n")
+
+    def _extract_from_file(
+        self, path: Path, min_len: int, include_unicode: bool, term: str = ""
+    ) -> Iterator[str]:
+        # Map the file rather than reading it so large binaries are paged in
+        # by the scanner instead of being copied onto the Python heap.
+        with path.open("rb") as handle:
+            try:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return
+            with data:
+                if term:
+                    yield from self._extract_matching(data, min_len, include_unicode, term)
+                else:
+                    yield from self._extract_fallback(data, min_len, include_unicode)
+
+    def _extract_fallback(self, data: bytes | mmap.mmap, min_len: int, include_unicode: bool) -> Iterable[str]:
+        for match in _ascii_pattern(min_len).finditer(data):
             yield match.group().decode("ascii", errors="ignore")
 
         if include_unicode:
-            pattern = re.compile(rb"(?:[\x20-\x7e]\x00){%d,}" % min_len)
-            for match in pattern.finditer(data):
+            if np is not None:
+                for start, end in _utf16_runs_numpy(data, min_len):
+                    yield data[start:end].decode("utf-16le", errors="ignore")
+                return
+            for match in _utf16_pattern(min_len).finditer(data):
                 yield match.group().decode("utf-16le", errors="ignore")
 
+    def _extract_matching(
+        self, data: bytes | mmap.mmap, min_len: int, include_unicode: bool, term: str
+    ) -> Iterator[str]:
+        """Yield the runs :meth:`_extract_fallback` would that contain ``term``.
+
+        Rather than decoding every run and testing it, search the raw bytes for
+        the term (ignoring ASCII case, like the ``str.lower`` filter) and widen
+        each hit to the printable run around it. Only matching runs are decoded.
+        """
+        size = len(data)
+        end = -1
+        for hit in _term_pattern(term, False).finditer(data):
+            if hit.start() < end:
+                continue
+            start = hit.start()
+            while start > 0 and 0x20 <= data[start - 1] <= 0x7E:
+                start -= 1
+            end = hit.end()
+            while end < size and 0x20 <= data[end] <= 0x7E:
+                end += 1
+            if end - start >= min_len:
+                yield data[start:end].decode("ascii")
+
+        if not include_unicode:
+            return
+        end = -1
+        for hit in _term_pattern(term, True).finditer(data):
+            if hit.start() < end:
+                continue
+            start = hit.start()
+            while start > 1 and 0x20 <= data[start - 2] <= 0x7E and data[start - 1] == 0:
+                start -= 2
+            end = hit.end()
+            while end + 1 < size and 0x20 <= data[end] <= 0x7E and data[end + 1] == 0:
+                end += 2
+            if (end - start) // 2 >= min_len:
+                yield data[start:end].decode("utf-16le")
+
     def _truthy(self, value: str | bool | None) -> bool:
         if isinstance(value, bool):
             return value
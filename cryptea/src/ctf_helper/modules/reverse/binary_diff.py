@@ -7,8 +7,9 @@ import json
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Iterator, List, Optional
 
-from ..base import ToolResult
+from ..base import CancelToken, ToolResult, stream_command
 
 
 class BinaryDiffTool:
@@ -35,6 +36,34 @@ class BinaryDiffTool:
         title = f"{label} diff: {src.name} vs {dst.name}"
         return ToolResult(title=title, body=body)
 
+    def run_stream(
+        self,
+        original: str,
+        modified: str,
+        tool: str = "auto",
+        extra: str = "",
+        cancel: Optional[CancelToken] = None,
+    ) -> Iterator[str]:
+        """Yield the diff as radiff2 or cmp writes it; the hash summary comes in one piece."""
+        src = Path(original).expanduser()
+        dst = Path(modified).expanduser()
+        if not src.exists():
+            raise FileNotFoundError(src)
+        if not dst.exists():
+            raise FileNotFoundError(dst)
+
+        executor, label = self._select_tool(tool)
+        if label == "hash":
+            yield executor(src, dst, extra)
+            return
+        argv = (self._radiff2_argv if label == "radiff2" else self._cmp_argv)(src, dst, extra)
+        empty = True
+        for chunk in stream_command(argv, cancel=cancel):
+            empty = False
+            yield chunk
+        if empty:
+            yield "(no output)" if label == "radiff2" else "(files are identical)"
+
     def _select_tool(self, requested: str):
         requested = requested.strip().lower()
         if requested in {"radiff2", "rizin"}:
@@ -50,12 +79,7 @@ class BinaryDiffTool:
         return self._hash_summary, "hash"
 
     def _radiff2(self, src: Path, dst: Path, extra: str) -> str:
-        binary = shutil.which("radiff2")
-        if not binary:
-            raise RuntimeError("radiff2 not available")
-        argv = [binary, str(src), str(dst)]
-        if extra.strip():
-            argv += extra.split()
+        argv = self._radiff2_argv(src, dst, extra)
         result = subprocess.run(
             argv,
             stdout=subprocess.PIPE,
@@ -66,12 +90,7 @@ class BinaryDiffTool:
         return result.stdout or result.stderr or "(no output)"
 
     def _cmp(self, src: Path, dst: Path, extra: str) -> str:
-        binary = shutil.which("cmp")
-        if not binary:
-            raise RuntimeError("cmp not available")
-        argv = [binary, "-l", str(src), str(dst)]
-        if extra.strip():
-            argv += extra.split()
+        argv = self._cmp_argv(src, dst, extra)
         result = subprocess.run(
             argv,
             stdout=subprocess.PIPE,
@@ -81,6 +100,24 @@ class BinaryDiffTool:
         )
         return result.stdout or result.stderr or "(files are identical)"
 
+    def _radiff2_argv(self, src: Path, dst: Path, extra: str) -> List[str]:
+        binary = shutil.which("radiff2")
+        if not binary:
+            raise RuntimeError("radiff2 not available")
+        argv = [binary, str(src), str(dst)]
+        if extra.strip():
+            argv += extra.split()
+        return argv
+
+    def _cmp_argv(self, src: Path, dst: Path, extra: str) -> List[str]:
+        binary = shutil.which("cmp")
+        if not binary:
+            raise RuntimeError("cmp not available")
+        argv = [binary, "-l", str(src), str(dst)]
+        if extra.strip():
+            argv += extra.split()
+        return argv
+
     def _hash_summary(self, src: Path, dst: Path, _extra: str) -> str:
         data = {
             "source": self._digest_file(src),
@@ -89,7 +126,9 @@ class BinaryDiffTool:
         return json.dumps(data, indent=2)
 
     def _digest_file(self, path: Path) -> dict:
-        sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+        # file_digest streams the file through OpenSSL without holding it in memory.
+        with path.open("rb") as handle:
+            sha256 = hashlib.file_digest(handle, "sha256").hexdigest()
         size = path.stat().st_size
         return {"file": str(path), "size": size, "sha256": sha256}
 
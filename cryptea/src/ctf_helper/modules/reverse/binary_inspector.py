@@ -2,34 +2,313 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import mmap
+import os
+import re
 import shutil
 import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
 
+from ...data_paths import user_cache_dir
 from ..base import ToolResult
 
+# Bytes hashed into the cache key when a file's mtime cannot be trusted.
+_HEAD_DIGEST_BYTES = 64 * 1024
+# Sections collected at once; each one mostly waits on a subprocess.
+_MAX_PARALLEL_SECTIONS = 4
+
+
+class _Section(NamedTuple):
+    """One collector's output; ``ok`` is false when its tool was missing or failed."""
+
+    text: str
+    ok: bool = True
+
+
+@lru_cache(maxsize=16)
+def _printable_pattern(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"[\x20-\x7e\t\n\r]{%d,}" % min_len)
+
+
+class BinaryAnalysisCache:
+    """Inspector results on disk, keyed by file identity and the chosen options.
+
+    The key is built from ``stat()`` alone (device, inode, size, mtime), so a
+    hit never opens the binary. Files with a zero mtime, as produced by some
+    archive extractors and reproducible builds, also mix in a digest of the
+    file head since their timestamp says nothing about their content. The
+    directory is kept under ``DISK_ENTRIES`` files and ``DISK_BYTES`` bytes,
+    evicting the least recently read results first.
+    """
+
+    # Results kept in memory as well, so repeat runs skip reading the JSON.
+    MEMORY_ENTRIES = 16
+    # Bounds for the directory; the least recently used files go first.
+    DISK_ENTRIES = 256
+    DISK_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self._directory = directory
+        self._memory: "OrderedDict[str, ToolResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            self._directory = user_cache_dir() / "binary_inspect"
+        return self._directory
+
+    def key(self, target: Path, options: str) -> str:
+        st = target.stat()
+        resolved = target.resolve()
+        parts = f"{resolved}|{st.st_dev}|{st.st_ino}|{st.st_size}|{st.st_mtime_ns}|{options}"
+        if st.st_mtime_ns == 0:
+            with target.open("rb") as handle:
+                head = hashlib.sha256(handle.read(_HEAD_DIGEST_BYTES)).hexdigest()
+            parts = f"{parts}|{head}"
+        return hashlib.sha256(parts.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def get(self, key: str) -> Optional[ToolResult]:
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                return result
+        path = self.directory / f"{key}.json"
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            result = ToolResult(title=data["title"], body=data["body"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: ToolResult) -> None:
+        self._remember(key, result)
+        directory = self.directory
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump({"title": result.title, "body": result.body}, handle)
+                os.replace(tmp_name, directory / f"{key}.json")
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used files until the directory fits its bounds."""
+        entries: List[Tuple[float, int, Path]] = []
+        try:
+            for entry in self.directory.glob("*.json"):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry))
+        except OSError:
+            return
+        entries.sort(key=lambda item: item[0])
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if count <= self.DISK_ENTRIES and total <= self.DISK_BYTES:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            count -= 1
+            total -= size
+            with self._lock:
+                self._memory.pop(entry.stem, None)
+
+    def _remember(self, key: str, result: ToolResult) -> None:
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> int:
+        """Remove every cached result and return how many were dropped."""
+        with self._lock:
+            self._memory.clear()
+        removed = 0
+        try:
+            entries = list(self.directory.glob("*.json"))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            if not entry.name.startswith(".tmp-"):
+                removed += 1
+        return removed
+
 
 class BinaryInspector:
     name = "PE/ELF Inspector"
     description = "Collect headers, sections, symbols, and security flags using local toolchain programs."
     category = "Reverse"
 
+    def __init__(self, cache: Optional[BinaryAnalysisCache] = None) -> None:
+        self.cache = cache or BinaryAnalysisCache()
+
     def run(
         self,
         file_path: str,
-        include_sections: str = "true",
-        include_symbols: str = "true",
-        include_checksec: str = "true",
-        include_file: str = "true",
-        include_headers: str = "true",
-        include_segments: str = "false",
-        include_dynamic: str = "false",
-        include_libraries: str = "false",
-        include_strings: str = "false",
-        strings_min_length: str = "4",
-        max_lines: str = "400",
+        include_sections: str | bool = True,
+        include_symbols: str | bool = True,
+        include_checksec: str | bool = True,
+        include_file: str | bool = True,
+        include_headers: str | bool = True,
+        include_segments: str | bool = False,
+        include_dynamic: str | bool = False,
+        include_libraries: str | bool = False,
+        include_strings: str | bool = False,
+        strings_min_length: str | int = 4,
+        max_lines: str | int = 400,
     ) -> ToolResult:
+        target, key, collectors = self._plan(
+            file_path,
+            include_sections,
+            include_symbols,
+            include_checksec,
+            include_file,
+            include_headers,
+            include_segments,
+            include_dynamic,
+            include_libraries,
+            include_strings,
+            strings_min_length,
+            max_lines,
+        )
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        sections = list(self._collect_all(collectors))
+        body = "\n\n".join(filter(None, (section.text for section in sections))) or "(no data collected)"
+        result = ToolResult(title=f"Inspector results for {target.name}", body=body)
+        # A missing tool or a failed run is not cached, so installing the
+        # tool (or fixing the file) takes effect on the next run.
+        if key is not None and all(section.ok for section in sections):
+            self.cache.put(key, result)
+        return result
+
+    def run_stream(
+        self,
+        file_path: str,
+        include_sections: str | bool = True,
+        include_symbols: str | bool = True,
+        include_checksec: str | bool = True,
+        include_file: str | bool = True,
+        include_headers: str | bool = True,
+        include_segments: str | bool = False,
+        include_dynamic: str | bool = False,
+        include_libraries: str | bool = False,
+        include_strings: str | bool = False,
+        strings_min_length: str | int = 4,
+        max_lines: str | int = 400,
+    ) -> Iterator[str]:
+        """Yield the same body as :meth:`run`, one section at a time as each tool finishes."""
+        target, key, collectors = self._plan(
+            file_path,
+            include_sections,
+            include_symbols,
+            include_checksec,
+            include_file,
+            include_headers,
+            include_segments,
+            include_dynamic,
+            include_libraries,
+            include_strings,
+            strings_min_length,
+            max_lines,
+        )
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached.body
+                return
+
+        parts: List[str] = []
+        complete = True
+        for section in self._collect_all(collectors):
+            complete = complete and section.ok
+            snippet = section.text
+            if not snippet:
+                continue
+            part = snippet if not parts else "\n\n" + snippet
+            parts.append(part)
+            yield part
+        if not parts:
+            parts.append("(no data collected)")
+            yield parts[0]
+        # Only a stream that ran to the end with every tool succeeding is
+        # cached; closing it early (a cancelled run) never gets here.
+        if key is not None and complete:
+            self.cache.put(key, ToolResult(title=f"Inspector results for {target.name}", body="".join(parts)))
+
+    def _collect_all(self, collectors: List[Callable[[], _Section]]) -> Iterator[_Section]:
+        """Run the collectors side by side and yield their output in order.
+
+        Each collector waits on its own readelf/nm/strings process, so
+        running them together overlaps that time; the first section is
+        yielded as soon as it is ready, regardless of the others.
+        """
+        if len(collectors) <= 1:
+            for collect in collectors:
+                yield collect()
+            return
+        pool = ThreadPoolExecutor(max_workers=min(len(collectors), _MAX_PARALLEL_SECTIONS), thread_name_prefix="inspector")
+        try:
+            futures = [pool.submit(collect) for collect in collectors]
+            for future in futures:
+                yield future.result()
+        finally:
+            # A stream closed early drops the sections not yet started.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _plan(
+        self,
+        file_path: str,
+        include_sections: str | bool = True,
+        include_symbols: str | bool = True,
+        include_checksec: str | bool = True,
+        include_file: str | bool = True,
+        include_headers: str | bool = True,
+        include_segments: str | bool = False,
+        include_dynamic: str | bool = False,
+        include_libraries: str | bool = False,
+        include_strings: str | bool = False,
+        strings_min_length: str | int = 4,
+        max_lines: str | int = 400,
+    ) -> Tuple[Path, Optional[str], List[Callable[[], _Section]]]:
+        """Resolve the target, its cache key and the collectors for the enabled sections, in output order."""
         target = Path(file_path).expanduser()
         if not target.exists():
             raise FileNotFoundError(target)
@@ -37,112 +316,129 @@ class BinaryInspector:
         limit = self._safe_int(max_lines, default=400, minimum=50, maximum=2000)
         string_min = self._safe_int(strings_min_length, default=4, minimum=2, maximum=32)
 
-        snippets: List[str] = []
-        if self._truthy(include_file):
-            snippets.append(
-                self._run_tool("file", ["file", str(target)], limit=limit, fallback="file utility not found")
-            )
-        if self._truthy(include_headers):
-            snippets.append(self._collect_headers(target, limit))
-        if self._truthy(include_segments):
-            snippets.append(self._collect_segments(target, limit))
-        if self._truthy(include_sections):
-            snippets.append(self._collect_sections(target, limit))
-        if self._truthy(include_symbols):
-            snippets.append(self._collect_symbols(target, limit))
-        if self._truthy(include_dynamic):
-            snippets.append(self._collect_dynamic(target, limit))
-        if self._truthy(include_checksec):
-            snippets.append(self._collect_checksec(target, limit))
-        if self._truthy(include_libraries):
-            snippets.append(self._collect_libraries(target, limit))
-        if self._truthy(include_strings):
-            snippets.append(self._collect_strings(target, string_min, limit))
-
-        body = "\n\n".join(filter(None, snippets)) or "(no data collected)"
-        return ToolResult(title=f"Inspector results for {target.name}", body=body)
-
-    def _collect_headers(self, target: Path, limit: int) -> str:
+        flags = [
+            include_file,
+            include_headers,
+            include_sections,
+            include_segments,
+            include_symbols,
+            include_dynamic,
+            include_checksec,
+            include_libraries,
+            include_strings,
+        ]
+        options = "".join("1" if self._truthy(flag) else "0" for flag in flags)
+        try:
+            key: Optional[str] = self.cache.key(target, f"{options}|{string_min}|{limit}")
+        except OSError:
+            key = None
+
+        sections: List[Tuple[str | bool, Callable[[], _Section]]] = [
+            (
+                include_file,
+                partial(self._run_tool, "file", ["file", str(target)], limit=limit, fallback="file utility not found"),
+            ),
+            (include_headers, partial(self._collect_headers, target, limit)),
+            (include_segments, partial(self._collect_segments, target, limit)),
+            (include_sections, partial(self._collect_sections, target, limit)),
+            (include_symbols, partial(self._collect_symbols, target, limit)),
+            (include_dynamic, partial(self._collect_dynamic, target, limit)),
+            (include_checksec, partial(self._collect_checksec, target, limit)),
+            (include_libraries, partial(self._collect_libraries, target, limit)),
+            (include_strings, partial(self._collect_strings, target, string_min, limit)),
+        ]
+        collectors = [collect for flag, collect in sections if self._truthy(flag)]
+        return target, key, collectors
+
+    def clear_cache(self) -> int:
+        return self.cache.clear()
+
+    def _collect_headers(self, target: Path, limit: int) -> _Section:
         if shutil.which("readelf"):
             return self._run_tool("readelf -h", ["readelf", "-h", str(target)], limit=limit)
         if shutil.which("objdump"):
             return self._run_tool("objdump -f", ["objdump", "-f", str(target)], limit=limit)
-        return "Headers: readelf/objdump not found"
+        return _Section("Headers: readelf/objdump not found", ok=False)
 
-    def _collect_segments(self, target: Path, limit: int) -> str:
+    def _collect_segments(self, target: Path, limit: int) -> _Section:
         if shutil.which("readelf"):
             return self._run_tool("readelf -l", ["readelf", "-l", str(target)], limit=limit)
-        return "Segments: readelf not found"
+        return _Section("Segments: readelf not found", ok=False)
 
-    def _collect_sections(self, target: Path, limit: int) -> str:
+    def _collect_sections(self, target: Path, limit: int) -> _Section:
         if shutil.which("readelf"):
             return self._run_tool("readelf -S", ["readelf", "-S", str(target)], limit=limit)
         if shutil.which("objdump"):
             return self._run_tool("objdump -h", ["objdump", "-h", str(target)], limit=limit)
-        return "Sections: readelf/objdump not found"
+        return _Section("Sections: readelf/objdump not found", ok=False)
 
-    def _collect_symbols(self, target: Path, limit: int) -> str:
-        outputs: List[str] = []
+    def _collect_symbols(self, target: Path, limit: int) -> _Section:
+        outputs: List[_Section] = []
         if shutil.which("nm"):
             outputs.append(self._run_tool("nm -g", ["nm", "-g", str(target)], limit=limit))
             outputs.append(self._run_tool("nm -D", ["nm", "-D", str(target)], limit=limit))
         elif shutil.which("objdump"):
             outputs.append(self._run_tool("objdump -t", ["objdump", "-t", str(target)], limit=limit))
         else:
-            return "Symbols: nm/objdump not found"
-        return "\n\n".join(filter(None, outputs))
+            return _Section("Symbols: nm/objdump not found", ok=False)
+        text = "\n\n".join(filter(None, (output.text for output in outputs)))
+        return _Section(text, all(output.ok for output in outputs))
 
-    def _collect_dynamic(self, target: Path, limit: int) -> str:
+    def _collect_dynamic(self, target: Path, limit: int) -> _Section:
         if shutil.which("readelf"):
             return self._run_tool("readelf -d", ["readelf", "-d", str(target)], limit=limit)
         if shutil.which("objdump"):
             return self._run_tool("objdump -p", ["objdump", "-p", str(target)], limit=limit)
-        return "Dynamic section: readelf/objdump not found"
+        return _Section("Dynamic section: readelf/objdump not found", ok=False)
 
-    def _collect_checksec(self, target: Path, limit: int) -> str:
+    def _collect_checksec(self, target: Path, limit: int) -> _Section:
         if shutil.which("checksec"):
             return self._run_tool("checksec", ["checksec", "--file", str(target)], limit=limit)
         if shutil.which("hardening-check"):
             return self._run_tool("hardening-check", ["hardening-check", str(target)], limit=limit)
-        return "Security flags: checksec/hardening-check not found"
+        return _Section("Security flags: checksec/hardening-check not found", ok=False)
 
-    def _collect_libraries(self, target: Path, limit: int) -> str:
+    def _collect_libraries(self, target: Path, limit: int) -> _Section:
         if shutil.which("ldd"):
             return self._run_tool("ldd", ["ldd", str(target)], limit=limit)
         if shutil.which("otool"):
             return self._run_tool("otool -L", ["otool", "-L", str(target)], limit=limit)
-        return "Linked libraries: ldd/otool not found"
+        return _Section("Linked libraries: ldd/otool not found", ok=False)
 
-    def _collect_strings(self, target: Path, min_length: int, limit: int) -> str:
+    def _collect_strings(self, target: Path, min_length: int, limit: int) -> _Section:
         if shutil.which("strings"):
-            output = self._run_tool(
+            return self._run_tool(
                 f"strings -n {min_length}",
                 ["strings", "-a", "-n", str(min_length), str(target)],
                 limit=limit,
             )
-            return output
-        # Fallback to a simple Python-based extractor
+        # Fallback to a simple Python-based extractor. Runs are decoded only
+        # until the line limit is reached.
         try:
-            data = target.read_bytes()
+            handle = target.open("rb")
         except OSError as exc:
-            return f"Strings: unable to read file ({exc})"
-
-        printable = set(range(32, 127)) | {9, 10, 13}
-        current: List[str] = []
+            return _Section(f"Strings: unable to read file ({exc})", ok=False)
         results: List[str] = []
-        for byte in data:
-            if byte in printable:
-                current.append(chr(byte))
-            else:
-                if len(current) >= min_length:
-                    results.append("".join(current))
-                current = []
-        if len(current) >= min_length:
-            results.append("".join(current))
+        line_count = 0
+        with handle:
+            try:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                data = None
+            except OSError as exc:
+                return _Section(f"Strings: unable to read file ({exc})", ok=False)
+            if data is not None:
+                with data:
+                    for match in _printable_pattern(min_length).finditer(data):
+                        text = match.group().decode("ascii")
+                        results.append(text)
+                        line_count += len(text.splitlines()) or 1
+                        if line_count > limit:
+                            break
 
         formatted = "\n".join(results) or "(no strings found)"
         trimmed = self._limit_lines(formatted, limit)
-        return f"== strings (built-in) ==\n{trimmed}"
+        return _Section(f"== strings (built-in) ==\n{trimmed}")
 
     def _run_tool(
         self,
@@ -150,19 +446,45 @@ class BinaryInspector:
         argv: List[str],
         limit: int,
         fallback: str | None = None,
-    ) -> str:
+    ) -> _Section:
         if not shutil.which(Path(argv[0]).name):
-            return fallback or f"{label}: tool not found"
-        result = subprocess.run(
-            argv,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        output = result.stdout or result.stderr or ""
-        trimmed = self._limit_lines(output.strip(), limit)
-        return f"== {label} ==\n{trimmed}"
+            return _Section(fallback or f"{label}: tool not found", ok=False)
+        # Read only as many lines as will be shown; once the limit is passed
+        # the tool is stopped instead of draining (and decoding) the rest of
+        # a symbol table or section dump that would be truncated anyway.
+        lines: List[bytes] = []
+        truncated = False
+        with tempfile.TemporaryFile() as errors:
+            proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=errors, stdin=subprocess.DEVNULL)
+            assert proc.stdout is not None
+            try:
+                for raw in proc.stdout:
+                    if not lines and not raw.strip():
+                        continue
+                    if 0 < limit <= len(lines):
+                        # As in _limit_lines, blank lines past the limit are
+                        # only lost content if something follows them.
+                        if raw.strip():
+                            truncated = True
+                            break
+                        continue
+                    lines.append(raw)
+            finally:
+                if truncated:
+                    proc.kill()
+                proc.stdout.close()
+                proc.wait()
+            # A tool that printed nothing and exited non-zero failed; its
+            # stderr is shown but the section is marked as not cacheable.
+            ok = bool(lines) or proc.returncode == 0
+            if lines:
+                output = b"".join(lines).decode(errors="replace").strip()
+            else:
+                errors.seek(0)
+                output = errors.read().decode(errors="replace").strip()
+        if truncated:
+            output = f"{output}\n... (truncated, showing first {limit} lines)"
+        return _Section(f"== {label} ==\n{output}", ok)
 
     def _truthy(self, value: str | bool | None) -> bool:
         if isinstance(value, bool):
@@ -171,7 +493,7 @@ class BinaryInspector:
             return False
         return str(value).strip().lower() in {"1", "true", "yes", "on"}
 
-    def _safe_int(self, value: str, default: int, minimum: int, maximum: int) -> int:
+    def _safe_int(self, value: str | int, default: int, minimum: int, maximum: int) -> int:
         try:
             number = int(str(value).strip())
         except (TypeError, ValueError):
@@ -189,4 +511,4 @@ class BinaryInspector:
         return "\n".join(truncated)
 
 
-__all__ = ["BinaryInspector"]
+__all__ = ["BinaryAnalysisCache", "BinaryInspector"]
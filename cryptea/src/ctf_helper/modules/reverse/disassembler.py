@@ -7,7 +7,7 @@ import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from ..base import ToolResult
 
@@ -54,6 +54,20 @@ TOOLS: Sequence[CandidateTool] = (
 )
 
 
+@dataclass(slots=True)
+class LaunchPlan:
+    """The chosen tool and command line for one launch."""
+
+    tool: CandidateTool
+    binary_path: str
+    argv: List[str]
+    raw_command: List[str]
+    context_note: Optional[str]
+    execution_mode: str  # spawn or capture
+    cwd: Path
+    available: List[Tuple[CandidateTool, str]]
+
+
 class DisassemblerLauncher:
     name = "Disassembler Launcher"
     description = "Kick off Ghidra, IDA, Cutter, or rizin with the selected binary."
@@ -68,13 +82,63 @@ class DisassemblerLauncher:
         mode: str = "auto",
         script: str = "",
         project_dir: str = "",
-        list_available: str = "false",
+        list_available: str | bool = False,
     ) -> ToolResult:
         available = self._available_tools()
         if self._truthy(list_available):
             body = self._format_available(available)
             return ToolResult(title="Detected disassemblers", body=body)
 
+        plan = self.plan_launch(file_path, preferred, extra, workdir, mode, script, project_dir, available)
+        tool = plan.tool
+        if plan.execution_mode == "spawn":
+            return self.spawn(plan)
+
+        # Capture output mode (CLI tools)
+        result = subprocess.run(
+            plan.argv,
+            cwd=str(plan.cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        output = (result.stdout or "").strip()
+        errors = (result.stderr or "").strip()
+        combined = output
+        if errors:
+            combined = f"{combined}\n\n[stderr]\n{errors}" if combined else errors
+        combined = combined or "(no output)"
+        header = f"Executed {tool.label} ({Path(plan.binary_path).name})"
+        body_parts = [header]
+        if plan.context_note:
+            body_parts.append(plan.context_note)
+        body_parts.append("Command:")
+        body_parts.append(self._format_command(plan.raw_command))
+        body_parts.append(f"Exit status: {result.returncode}")
+        body_parts.append("")
+        body_parts.append(combined)
+        body_parts.extend(["", self._format_available(plan.available)])
+        return ToolResult(title=header, body="\n".join(body_parts))
+
+    def plan_launch(
+        self,
+        file_path: str,
+        preferred: str = "auto",
+        extra: str = "",
+        workdir: str = "",
+        mode: str = "auto",
+        script: str = "",
+        project_dir: str = "",
+        available: Optional[List[Tuple[CandidateTool, str]]] = None,
+    ) -> LaunchPlan:
+        """Pick the tool and build its command line without running it.
+
+        Callers that stream ``capture`` output themselves frame it with
+        :meth:`capture_header` and :meth:`capture_footer`.
+        """
+        if available is None:
+            available = self._available_tools()
         if not file_path.strip():
             raise ValueError("Provide a binary to launch")
 
@@ -105,52 +169,49 @@ class DisassemblerLauncher:
         cwd = Path(workdir).expanduser() if workdir.strip() else target.parent
         if not cwd.exists():
             cwd = target.parent
+        return LaunchPlan(
+            tool=tool,
+            binary_path=binary_path,
+            argv=argv,
+            raw_command=raw_command,
+            context_note=context_note,
+            execution_mode=execution_mode,
+            cwd=cwd,
+            available=available,
+        )
 
-        if execution_mode == "spawn":
-            try:
-                subprocess.Popen(argv, cwd=str(cwd))
-            except FileNotFoundError as exc:
-                raise RuntimeError(f"Unable to launch {tool.label}: {exc}") from exc
-
-            header = f"Launched {tool.label} ({Path(binary_path).name})"
-            body_parts = [header]
-            if context_note:
-                body_parts.append(context_note)
-            body_parts.append("Tool command:")
-            body_parts.append(self._format_command(raw_command))
-            if argv != raw_command:
-                body_parts.append("Invocation:")
-                body_parts.append(self._format_command(argv))
-            body_parts.extend(["", self._format_available(available)])
-            return ToolResult(title=header, body="\n".join(body_parts))
+    def spawn(self, plan: LaunchPlan) -> ToolResult:
+        """Start a ``spawn`` mode plan detached and describe what was launched."""
+        tool = plan.tool
+        try:
+            subprocess.Popen(plan.argv, cwd=str(plan.cwd))
+        except FileNotFoundError as exc:
+            raise RuntimeError(f"Unable to launch {tool.label}: {exc}") from exc
 
-        # Capture output mode (CLI tools)
-        result = subprocess.run(
-            argv,
-            cwd=str(cwd),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        output = (result.stdout or "").strip()
-        errors = (result.stderr or "").strip()
-        combined = output
-        if errors:
-            combined = f"{combined}\n\n[stderr]\n{errors}" if combined else errors
-        combined = combined or "(no output)"
-        header = f"Executed {tool.label} ({Path(binary_path).name})"
+        header = f"Launched {tool.label} ({Path(plan.binary_path).name})"
         body_parts = [header]
-        if context_note:
-            body_parts.append(context_note)
-        body_parts.append("Command:")
-        body_parts.append(self._format_command(raw_command))
-        body_parts.append(f"Exit status: {result.returncode}")
-        body_parts.append("")
-        body_parts.append(combined)
-        body_parts.extend(["", self._format_available(available)])
+        if plan.context_note:
+            body_parts.append(plan.context_note)
+        body_parts.append("Tool command:")
+        body_parts.append(self._format_command(plan.raw_command))
+        if plan.argv != plan.raw_command:
+            body_parts.append("Invocation:")
+            body_parts.append(self._format_command(plan.argv))
+        body_parts.extend(["", self._format_available(plan.available)])
         return ToolResult(title=header, body="\n".join(body_parts))
 
+    def capture_header(self, plan: LaunchPlan) -> str:
+        lines = [f"Executed {plan.tool.label} ({Path(plan.binary_path).name})"]
+        if plan.context_note:
+            lines.append(plan.context_note)
+        lines.append("Command:")
+        lines.append(self._format_command(plan.raw_command))
+        lines.append("")
+        return "\n".join(lines) + "\n"
+
+    def capture_footer(self, plan: LaunchPlan, returncode: int) -> str:
+        return "\n".join(["", f"Exit status: {returncode}", "", self._format_available(plan.available)])
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -291,4 +352,4 @@ class DisassemblerLauncher:
         return " ".join(shlex.quote(part) for part in argv)
 
 
-__all__ = ["DisassemblerLauncher"]
+__all__ = ["DisassemblerLauncher", "LaunchPlan"]
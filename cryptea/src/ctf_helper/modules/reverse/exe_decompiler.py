@@ -2,13 +2,40 @@
 
 from __future__ import annotations
 
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional, Tuple
 
 from ..base import ToolResult
 
+# Recent decompilations keyed by the binary's stat() identity plus the
+# engine, function and verbosity, so asking for the same function again
+# (Ghidra can take minutes) skips the engine without opening the file.
+_RESULT_CACHE: "OrderedDict[Tuple[object, ...], ToolResult]" = OrderedDict()
+_RESULT_CACHE_SIZE = 32
+_RESULT_CACHE_LOCK = threading.Lock()
+# Only finished runs are cached; timeouts and missing tools are worth retrying.
+_CACHEABLE_TITLES = ("Ghidra Decompilation", "Rizin Decompilation", "objdump Disassembly")
+
+# A function is a hex or decimal address, or a symbol name as the engines
+# print them (``main``, ``entry0``, ``sym.imp.puts``, ``main@plt``,
+# ``std::sort``). Anything else would be spliced into the Ghidra script or
+# the rizin command line, so it is rejected up front.
+FUNCTION_RE = re.compile(r"\A(?:0[xX][0-9a-fA-F]+|[0-9]+|[A-Za-z_.$?@][\w.$?@:]*)\Z")
+
+# Engines in order of preference and the programs that provide them.
+_ENGINE_PROGRAMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("ghidra", ("analyzeHeadless",)),
+    ("rizin", ("rizin", "r2")),
+    ("objdump", ("objdump",)),
+)
+_detected_engines: Optional[Tuple[str, ...]] = None
+
 
 class ExeDecompiler:
     """Decompile Windows PE and Linux ELF executables."""
@@ -45,17 +72,12 @@ class ExeDecompiler:
         
         engine = engine.lower().strip()
         function = function.strip() or "main"
+        if not FUNCTION_RE.match(function):
+            raise ValueError(f"Invalid function name or address: {function}")
         is_verbose = verbose.lower() in ("true", "1", "yes")
         
-        # Detect available engines
-        available = []
-        if shutil.which("analyzeHeadless"):
-            available.append("ghidra")
-        if shutil.which("rizin") or shutil.which("r2"):
-            available.append("rizin")
-        if shutil.which("objdump"):
-            available.append("objdump")
-        
+        available = self.detect_engines()
+
         if not available:
             return ToolResult(
                 title="No Decompilers Available",
@@ -69,14 +91,31 @@ class ExeDecompiler:
         if engine == "auto":
             engine = available[0] if available else "objdump"
         
+        st = binary_path.stat()
+        key = (
+            str(binary_path.resolve()),
+            st.st_dev,
+            st.st_ino,
+            st.st_size,
+            st.st_mtime_ns,
+            engine,
+            function,
+            is_verbose,
+        )
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(key)
+                return cached
+
         # Perform decompilation
         try:
             if engine == "ghidra":
-                return self._decompile_with_ghidra(binary_path, function, is_verbose)
+                result = self._decompile_with_ghidra(binary_path, function, is_verbose)
             elif engine == "rizin":
-                return self._decompile_with_rizin(binary_path, function, is_verbose)
+                result = self._decompile_with_rizin(binary_path, function, is_verbose)
             elif engine == "objdump":
-                return self._decompile_with_objdump(binary_path, function)
+                result = self._decompile_with_objdump(binary_path, function)
             else:
                 return ToolResult(
                     title="Unknown Engine",
@@ -92,6 +131,29 @@ class ExeDecompiler:
                      f"Function: {function}"
             )
 
+        if result.title.startswith(_CACHEABLE_TITLES):
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[key] = result
+                _RESULT_CACHE.move_to_end(key)
+                while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                    _RESULT_CACHE.popitem(last=False)
+        return result
+
+    def detect_engines(self, refresh: bool = False) -> Tuple[str, ...]:
+        """Return the installed engines, best first.
+
+        The PATH is searched once per session; pass ``refresh`` to look
+        again, e.g. after installing Ghidra.
+        """
+        global _detected_engines
+        if _detected_engines is None or refresh:
+            _detected_engines = tuple(
+                engine
+                for engine, programs in _ENGINE_PROGRAMS
+                if any(shutil.which(program) for program in programs)
+            )
+        return _detected_engines
+
     def _decompile_with_ghidra(
         self,
         binary_path: Path,
@@ -386,4 +448,4 @@ if (targetFunc == null) {{
             )
 
 
-__all__ = ["ExeDecompiler"]
+__all__ = ["ExeDecompiler", "FUNCTION_RE"]
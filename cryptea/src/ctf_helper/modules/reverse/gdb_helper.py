@@ -7,9 +7,9 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from ..base import ToolResult
+from ..base import CancelToken, ToolResult, stream_command
 
 _DEFAULT_COMMANDS = ["info registers", "backtrace", "info shared"]
 
@@ -25,10 +25,56 @@ class GDBHelper:
         breakpoints: str = "",
         run_args: str = "",
         commands: str = "",
-        stop_on_entry: str = "false",
+        stop_on_entry: str | bool = False,
         attach_pid: str = "",
         additional_files: str = "",
     ) -> ToolResult:
+        target, argv = self._command(
+            file_path, breakpoints, run_args, commands, stop_on_entry, attach_pid, additional_files
+        )
+        result = subprocess.run(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        output = (result.stdout or "") + ("\n" + result.stderr if result.stderr else "")
+        title = f"gdb session for {target.name}"
+        return ToolResult(title=title, body=output.strip() or "(no output)")
+
+    def run_stream(
+        self,
+        file_path: str,
+        breakpoints: str = "",
+        run_args: str = "",
+        commands: str = "",
+        stop_on_entry: str | bool = False,
+        attach_pid: str = "",
+        additional_files: str = "",
+        cancel: Optional[CancelToken] = None,
+    ) -> Iterator[str]:
+        """Yield the session output as gdb writes it, stderr included."""
+        _target, argv = self._command(
+            file_path, breakpoints, run_args, commands, stop_on_entry, attach_pid, additional_files
+        )
+        empty = True
+        for chunk in stream_command(argv, cancel=cancel):
+            empty = False
+            yield chunk
+        if empty:
+            yield "(no output)"
+
+    def _command(
+        self,
+        file_path: str,
+        breakpoints: str,
+        run_args: str,
+        commands: str,
+        stop_on_entry: str | bool,
+        attach_pid: str,
+        additional_files: str,
+    ) -> Tuple[Path, List[str]]:
         binary = shutil.which("gdb")
         if not binary:
             raise RuntimeError("gdb is not available in PATH")
@@ -54,24 +100,14 @@ class GDBHelper:
         if attach_pid.strip():
             argv += ["-p", attach_pid.strip()]
         argv += ["-x", script_path]
-
-        result = subprocess.run(
-            argv,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        output = (result.stdout or "") + ("\n" + result.stderr if result.stderr else "")
-        title = f"gdb session for {target.name}"
-        return ToolResult(title=title, body=output.strip() or "(no output)")
+        return target, argv
 
     def _build_script(
         self,
         breakpoints: str,
         commands: str,
         run_args: str,
-        stop_on_entry: str,
+        stop_on_entry: str | bool,
         attach_pid: str,
         additional_files: str,
     ) -> List[str]:
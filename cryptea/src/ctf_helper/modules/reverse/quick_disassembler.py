@@ -28,7 +28,7 @@ class QuickDisassembler:
         self,
         file_path: str,
         preferred: str = "auto",
-        max_instructions: str = "400",
+        max_instructions: str | int = 400,
         syntax: str = "auto",
     ) -> ToolResult:
         target = Path(file_path).expanduser()
@@ -134,7 +134,7 @@ class QuickDisassembler:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _safe_int(self, value: str, default: int, minimum: int, maximum: int) -> int:
+    def _safe_int(self, value: str | int, default: int, minimum: int, maximum: int) -> int:
         try:
             number = int(str(value).strip())
         except (TypeError, ValueError):
@@ -6,9 +6,9 @@ import shlex
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Sequence
+from typing import Iterator, List, Optional, Sequence, Tuple
 
-from ..base import ToolResult
+from ..base import CancelToken, ToolResult, stream_command
 
 _DEFAULT_COMMANDS = ["aaa", "s main", "pdf @ main"]
 
@@ -23,8 +23,38 @@ class RizinConsole:
         file_path: str,
         commands: str = "",
         tool: str = "auto",
-        quiet: str = "true",
+        quiet: str | bool = True,
     ) -> ToolResult:
+        binary, cmd_list, argv = self._command(file_path, commands, tool, quiet)
+        result = subprocess.run(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        output = result.stdout or result.stderr
+        title = f"{Path(binary).name} output ({len(cmd_list)} commands)"
+        return ToolResult(title=title, body=output or "(no output)")
+
+    def run_stream(
+        self,
+        file_path: str,
+        commands: str = "",
+        tool: str = "auto",
+        quiet: str | bool = True,
+        cancel: Optional[CancelToken] = None,
+    ) -> Iterator[str]:
+        """Yield the session output as rizin writes it, stderr included."""
+        _binary, _cmd_list, argv = self._command(file_path, commands, tool, quiet)
+        empty = True
+        for chunk in stream_command(argv, cancel=cancel):
+            empty = False
+            yield chunk
+        if empty:
+            yield "(no output)"
+
+    def _command(self, file_path: str, commands: str, tool: str, quiet: str | bool) -> Tuple[str, Sequence[str], List[str]]:
         target = Path(file_path).expanduser()
         if not target.exists():
             raise FileNotFoundError(target)
@@ -36,17 +66,7 @@ class RizinConsole:
         cmd_list = self._normalize_commands(commands)
         flag = "-q" if self._truthy(quiet) else "-Q"
         joined = ";".join(cmd_list)
-        argv = [binary, flag, "-c", joined, str(target)]
-        result = subprocess.run(
-            argv,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        output = result.stdout or result.stderr
-        title = f"{Path(binary).name} output ({len(cmd_list)} commands)"
-        return ToolResult(title=title, body=output or "(no output)")
+        return binary, cmd_list, [binary, flag, "-c", joined, str(target)]
 
     def _normalize_commands(self, commands: str) -> Sequence[str]:
         items = [line.strip() for line in commands.splitlines() if line.strip()]
@@ -5,9 +5,9 @@ from __future__ import annotations
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..base import ToolResult
+from ..base import CancelToken, ToolResult, stream_command_lines
 
 
 class ROPGadgetTool:
@@ -19,10 +19,10 @@ class ROPGadgetTool:
         self,
         file_path: str,
         search: str = "",
-        max_depth: str = "6",
+        max_depth: str | int = 6,
         tool: str = "auto",
         architecture: str = "auto",
-        limit: str = "0",
+        limit: str | int = 0,
     ) -> ToolResult:
         target = Path(file_path).expanduser()
         if not target.exists():
@@ -37,9 +37,10 @@ class ROPGadgetTool:
         arch_key, arch_meta = self._normalise_architecture(architecture)
 
         sections: List[str] = []
-        for slug, executor in tools:
+        for slug, build in tools:
             try:
-                output = executor(target, search, depth_value, arch_key, arch_meta, limit_value)
+                argv = build(target, search, depth_value, arch_key, arch_meta, limit_value)
+                output = self._capture(argv)
             except FileNotFoundError:
                 continue
             label = self._tool_label(slug)
@@ -50,12 +51,65 @@ class ROPGadgetTool:
         title = f"ROP results for {target.name}"
         return ToolResult(title=title, body=body)
 
-    def _resolve_tools(self, tool_request: str) -> List[Tuple[str, Callable[..., str]]]:
+    def run_stream(
+        self,
+        file_path: str,
+        search: str = "",
+        max_depth: str | int = 6,
+        tool: str = "auto",
+        architecture: str = "auto",
+        limit: str | int = 0,
+        cancel: Optional[CancelToken] = None,
+    ) -> Iterator[str]:
+        """Yield the sections :meth:`run` builds, line by line as each tool writes them."""
+        target = Path(file_path).expanduser()
+        if not target.exists():
+            raise FileNotFoundError(target)
+
+        tools = self._resolve_tools(tool)
+        if not tools:
+            raise RuntimeError("Neither ROPgadget, ropper, nor rizin were found in PATH")
+
+        depth_value = self._safe_int(max_depth, default=6, minimum=1, maximum=40)
+        limit_value = self._safe_int(limit, default=0, minimum=0, maximum=1000)
+        arch_key, arch_meta = self._normalise_architecture(architecture)
+
+        produced = False
+        for slug, build in tools:
+            if cancel is not None and cancel.cancelled:
+                break
+            try:
+                argv = build(target, search, depth_value, arch_key, arch_meta, limit_value)
+                lines = stream_command_lines(argv, cancel=cancel)
+                first = next(lines, None)
+            except FileNotFoundError:
+                continue
+            if produced:
+                yield "\n"
+            produced = True
+            yield f"== {self._tool_label(slug)} ==\n"
+            if first is None:
+                yield "(no output)\n"
+                continue
+            yield first
+            count = 1
+            for line in lines:
+                if limit_value and count >= limit_value:
+                    lines.close()
+                    yield f"... (truncated, showing first {limit_value} lines)\n"
+                    break
+                count += 1
+                yield line
+
+        if not produced:
+            yield "No output produced by the selected tools."
+
+    def _resolve_tools(self, tool_request: str) -> List[Tuple[str, Callable[..., List[str]]]]:
         request = tool_request.strip().lower()
         available = {
-            "ropgadget": self._ropgadget,
-            "ropper": self._ropper,
-            "rizin": self._rizin,
+            "ropgadget": self._ropgadget_argv,
+            "ropper": self._ropper_argv,
+            "rizin": self._rizin_argv,
         }
 
         discovered = {
@@ -108,7 +162,7 @@ class ROPGadgetTool:
             "rizin": "rizin",
         }.get(slug, slug)
 
-    def _ropgadget(
+    def _ropgadget_argv(
         self,
         target: Path,
         search: str,
@@ -116,7 +170,7 @@ class ROPGadgetTool:
         arch_key: str,
         arch_meta: Dict[str, str],
         limit: int,
-    ) -> str:
+    ) -> List[str]:
         binary = shutil.which("ROPgadget")
         if not binary:
             raise FileNotFoundError("ROPgadget")
@@ -127,16 +181,9 @@ class ROPGadgetTool:
             argv += ["--arch", arch_key]
         if limit:
             argv += ["--limit", str(limit)]
-        result = subprocess.run(
-            argv,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        return result.stdout or result.stderr or "(no output)"
+        return argv
 
-    def _ropper(
+    def _ropper_argv(
         self,
         target: Path,
         search: str,
@@ -144,7 +191,7 @@ class ROPGadgetTool:
         arch_key: str,
         arch_meta: Dict[str, str],
         limit: int,
-    ) -> str:
+    ) -> List[str]:
         binary = shutil.which("ropper")
         if not binary:
             raise FileNotFoundError("ropper")
@@ -157,16 +204,9 @@ class ROPGadgetTool:
                 argv += ["--bits", str(arch_meta["bits"])]
         if limit:
             argv += ["--limit", str(limit)]
-        result = subprocess.run(
-            argv,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        return result.stdout or result.stderr or "(no output)"
+        return argv
 
-    def _rizin(
+    def _rizin_argv(
         self,
         target: Path,
         search: str,
@@ -174,7 +214,7 @@ class ROPGadgetTool:
         arch_key: str,
         arch_meta: Dict[str, str],
         limit: int,
-    ) -> str:
+    ) -> List[str]:
         binary = shutil.which("rizin") or shutil.which("radare2")
         if not binary:
             raise FileNotFoundError("rizin")
@@ -191,6 +231,9 @@ class ROPGadgetTool:
         commands.append("q")
         joined = ";".join(commands)
         argv = [binary, "-q", "-c", joined, str(target)]
+        return argv
+
+    def _capture(self, argv: List[str]) -> str:
         result = subprocess.run(
             argv,
             stdout=subprocess.PIPE,
@@ -225,7 +268,7 @@ class ROPGadgetTool:
             return "auto", {}
         return value if value != "x86_64" else "x86_64", meta
 
-    def _safe_int(self, value: str, default: int, minimum: int, maximum: int) -> int:
+    def _safe_int(self, value: str | int, default: int, minimum: int, maximum: int) -> int:
         try:
             number = int(str(value).strip())
         except (TypeError, ValueError):
@@ -145,3 +145,6 @@ VARIANTS: Dict[str, Callable[[str, str], Tuple[str, str, bytes]]] = {
     "htaccess": _variant_htaccess_shell,
     "multipart_confusion": _variant_content_type_confusion,
 }
+
+# (key, display label) for each variant, in VARIANTS order.
+VARIANTS_ITEMS: Tuple[Tuple[str, str], ...] = tuple((key, key.replace("_", " ").title()) for key in VARIANTS)
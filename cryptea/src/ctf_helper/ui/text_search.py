@@ -0,0 +1,32 @@
+"""Plain-text match finding for search-as-you-type views."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+
+def match_offsets(
+    haystack: str,
+    needle: str,
+    previous_needle: str = "",
+    previous_offsets: Sequence[int] = (),
+) -> List[int]:
+    """Return every offset in ``haystack`` where ``needle`` starts, overlapping matches included.
+
+    When ``needle`` extends ``previous_needle``, whose matches are
+    ``previous_offsets``, only those offsets are checked: every match of the
+    longer needle starts at a match of the shorter one.
+    """
+    if not needle:
+        return []
+    if previous_needle and needle.startswith(previous_needle):
+        return [index for index in previous_offsets if haystack.startswith(needle, index)]
+    offsets: List[int] = []
+    index = haystack.find(needle)
+    while index >= 0:
+        offsets.append(index)
+        index = haystack.find(needle, index + 1)
+    return offsets
+
+
+__all__ = ["match_offsets"]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the decoded WAV cache of the audio analyzer
+"""
+import os
+import struct
+import sys
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.media.audio_analyzer import AudioAnalyzerTool, _decode_wav_cached
+
+
+def _write_wav(path, frames, channels=1, width=2):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(8000)
+        fmt = "<" + ("h" if width == 2 else "b") * len(frames)
+        wav.writeframes(struct.pack(fmt, *frames))
+    return path
+
+
+def test_samples_are_stored_compactly(tmp_path):
+    for width, channels in ((2, 1), (2, 2), (1, 2)):
+        path = _write_wav(tmp_path / f"w{width}c{channels}.wav", [1, -2, 3, -4] * 100, channels, width)
+        for mode in ("left", "right", "mixed"):
+            _summary, samples = _decode_wav_cached(str(path), path.stat().st_mtime_ns, mode)
+            assert samples.itemsize <= 2, (width, channels, mode)
+
+
+def test_full_scale_peak_does_not_overflow(tmp_path):
+    path = _write_wav(tmp_path / "clip.wav", [0, -32768, 32767, 100])
+    summary, samples = AudioAnalyzerTool()._load_samples(path, "mixed")
+    assert summary.peak == 32768
+    assert summary.clipping
+    expected = (32768**2 + 32767**2 + 100**2) / 4
+    assert abs(summary.rms - expected**0.5) < 1e-6
+    assert list(samples) == [0, -32768, 32767, 100]
+
+
+def test_edited_file_is_decoded_again(tmp_path):
+    path = _write_wav(tmp_path / "edit.wav", [10, 20])
+    tool = AudioAnalyzerTool()
+    assert list(tool._load_samples(path, "mixed")[1]) == [10, 20]
+    _write_wav(path, [30, 40])
+    os.utime(path, ns=(1, 1))
+    assert list(tool._load_samples(path, "mixed")[1]) == [30, 40]
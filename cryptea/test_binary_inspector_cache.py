@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the PE/ELF inspector result cache
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.base import ToolResult
+from ctf_helper.modules.reverse import binary_inspector
+from ctf_helper.modules.reverse.binary_inspector import BinaryAnalysisCache, BinaryInspector
+
+ONLY_CHECKSEC = dict(
+    include_sections=False,
+    include_symbols=False,
+    include_checksec=True,
+    include_file=False,
+    include_headers=False,
+)
+
+
+def test_key_tracks_file_and_options(tmp_path, make_binary):
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    target = make_binary()
+    key = cache.key(target, "a")
+    assert cache.key(target, "a") == key
+    assert cache.key(target, "b") != key
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    assert cache.key(target, "a") != key
+
+
+def test_zero_mtime_keys_on_content(tmp_path, make_binary):
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    target = make_binary(b"A" * 64)
+    os.utime(target, ns=(0, 0))
+    before = cache.key(target, "a")
+    target.write_bytes(b"B" * 64)
+    os.utime(target, ns=(0, 0))
+    assert cache.key(target, "a") != before
+
+
+def test_results_survive_a_new_instance(tmp_path):
+    directory = tmp_path / "cache"
+    BinaryAnalysisCache(directory).put("k", ToolResult(title="t", body="b"))
+    cached = BinaryAnalysisCache(directory).get("k")
+    assert cached is not None and cached.body == "b"
+    assert BinaryAnalysisCache(directory).clear() == 1
+    assert BinaryAnalysisCache(directory).get("k") is None
+
+
+def test_disk_entries_are_evicted_oldest_first(tmp_path):
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    cache.DISK_ENTRIES = 2
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, ToolResult(title=key, body=key))
+        os.utime(cache.directory / f"{key}.json", (index, index))
+    cache.put("d", ToolResult(title="d", body="d"))
+    assert sorted(p.stem for p in cache.directory.glob("*.json")) == ["c", "d"]
+
+
+def test_disk_bytes_bound(tmp_path):
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    cache.DISK_BYTES = 1024
+    cache.put("big", ToolResult(title="t", body="x" * 2048))
+    assert list(cache.directory.glob("*.json")) == []
+
+
+def test_missing_tool_is_not_cached(tmp_path, monkeypatch, make_binary):
+    monkeypatch.setattr(binary_inspector.shutil, "which", lambda name: None)
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    target = make_binary()
+    result = BinaryInspector(cache).run(str(target), **ONLY_CHECKSEC)
+    assert "not found" in result.body
+    assert list(cache.directory.glob("*.json")) == []
+
+    streamed = "".join(BinaryInspector(cache).run_stream(str(target), **ONLY_CHECKSEC))
+    assert streamed == result.body
+    assert list(cache.directory.glob("*.json")) == []
+
+
+def test_failed_tool_is_not_cached(tmp_path, monkeypatch, make_binary):
+    monkeypatch.setattr(binary_inspector.shutil, "which", lambda name: "/bin/false")
+    monkeypatch.setattr(
+        BinaryInspector,
+        "_collect_checksec",
+        lambda self, target, limit: self._run_tool("false", ["false"], limit=limit),
+    )
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    BinaryInspector(cache).run(str(make_binary()), **ONLY_CHECKSEC)
+    assert list(cache.directory.glob("*.json")) == []
+
+
+def test_successful_run_is_cached(tmp_path, monkeypatch, make_binary):
+    monkeypatch.setattr(binary_inspector.shutil, "which", lambda name: "/bin/echo")
+    monkeypatch.setattr(
+        BinaryInspector,
+        "_collect_checksec",
+        lambda self, target, limit: self._run_tool("echo", ["echo", "hardened"], limit=limit),
+    )
+    cache = BinaryAnalysisCache(tmp_path / "cache")
+    target = make_binary()
+    first = BinaryInspector(cache).run(str(target), **ONLY_CHECKSEC)
+    assert "hardened" in first.body
+    assert len(list(cache.directory.glob("*.json"))) == 1
+
+    monkeypatch.setattr(BinaryInspector, "_collect_checksec", lambda self, target, limit: 1 / 0)
+    assert BinaryInspector(BinaryAnalysisCache(cache.directory)).run(str(target), **ONLY_CHECKSEC).body == first.body
+
+
+def test_run_tool_ignores_trailing_blank_lines_past_the_limit():
+    section = BinaryInspector()._run_tool("printf", ["printf", "a\\nb\\n\\n\\n"], limit=2)
+    assert section.text == "== printf ==\na\nb"
+
+
+def test_run_tool_marks_dropped_content():
+    section = BinaryInspector()._run_tool("printf", ["printf", "a\\nb\\n\\nc\\n"], limit=2)
+    assert section.text.endswith("... (truncated, showing first 2 lines)")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the EXE decompiler result cache and input checks
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.base import ToolResult
+from ctf_helper.modules.reverse import exe_decompiler
+from ctf_helper.modules.reverse.exe_decompiler import FUNCTION_RE, ExeDecompiler
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Pretend only objdump is installed and record every engine run."""
+    seen = []
+
+    def fake_objdump(self, binary_path, function):
+        seen.append(function)
+        return ToolResult(title=f"objdump Disassembly: {function}", body=f"run {len(seen)}")
+
+    monkeypatch.setattr(exe_decompiler, "_detected_engines", ("objdump",))
+    monkeypatch.setattr(ExeDecompiler, "_decompile_with_objdump", fake_objdump)
+    exe_decompiler._RESULT_CACHE.clear()
+    yield seen
+    exe_decompiler._RESULT_CACHE.clear()
+
+
+def test_repeat_request_is_served_from_cache(calls, make_binary):
+    target = str(make_binary())
+    first = ExeDecompiler().run(target)
+    assert ExeDecompiler().run(target) is first
+    assert calls == ["main"]
+
+
+def test_key_includes_function_and_verbosity(calls, make_binary):
+    target = str(make_binary())
+    ExeDecompiler().run(target, function="main")
+    ExeDecompiler().run(target, function="sym.imp.puts")
+    ExeDecompiler().run(target, function="main", verbose="true")
+    assert calls == ["main", "sym.imp.puts", "main"]
+
+
+def test_changed_binary_is_decompiled_again(calls, make_binary):
+    target = make_binary()
+    ExeDecompiler().run(str(target))
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    ExeDecompiler().run(str(target))
+    assert len(calls) == 2
+
+
+def test_failures_are_not_cached(calls, monkeypatch, make_binary):
+    monkeypatch.setattr(
+        ExeDecompiler,
+        "_decompile_with_objdump",
+        lambda self, binary_path, function: calls.append(function)
+        or ToolResult(title="Disassembly Timeout", body="timed out"),
+    )
+    target = str(make_binary())
+    ExeDecompiler().run(target)
+    ExeDecompiler().run(target)
+    assert calls == ["main", "main"]
+    assert not exe_decompiler._RESULT_CACHE
+
+
+def test_cache_is_bounded(calls, monkeypatch, make_binary):
+    monkeypatch.setattr(exe_decompiler, "_RESULT_CACHE_SIZE", 2)
+    target = str(make_binary())
+    for function in ("a", "b", "c"):
+        ExeDecompiler().run(target, function=function)
+    ExeDecompiler().run(target, function="a")
+    assert calls == ["a", "b", "c", "a"]
+    assert len(exe_decompiler._RESULT_CACHE) == 2
+
+
+def test_detect_engines_caches_until_refresh(monkeypatch):
+    monkeypatch.setattr(exe_decompiler, "_detected_engines", None)
+    monkeypatch.setattr(exe_decompiler.shutil, "which", lambda name: None)
+    assert ExeDecompiler().detect_engines() == ()
+    monkeypatch.setattr(exe_decompiler.shutil, "which", lambda name: f"/usr/bin/{name}")
+    assert ExeDecompiler().detect_engines() == ()
+    assert ExeDecompiler().detect_engines(refresh=True) == ("ghidra", "rizin", "objdump")
+
+
+@pytest.mark.parametrize("name", ["main", "0x401000", "4198400", "sym.imp.puts", "main@plt", "std::sort"])
+def test_function_re_accepts_engine_names(name):
+    assert FUNCTION_RE.match(name)
+
+
+@pytest.mark.parametrize("name", ["", "main; rm -rf /", 'a")', "main\n", "-h"])
+def test_function_re_rejects_injection(name, make_binary):
+    assert not FUNCTION_RE.match(name)
+    if name.strip() and not FUNCTION_RE.match(name.strip()):
+        with pytest.raises(ValueError):
+            ExeDecompiler().run(str(make_binary()), function=name)
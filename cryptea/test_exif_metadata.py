@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the exiftool stay-open session and its argument-file fallback
+"""
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.media import exif_metadata
+from ctf_helper.modules.media.exif_metadata import ExifMetadataTool, _argfile_safe
+
+# Speaks just enough of exiftool's -stay_open protocol for these tests.
+FAKE_EXIFTOOL = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys
+    if "-stay_open" not in sys.argv:
+        path = sys.argv[-1]
+        if os.path.exists(path):
+            print(json.dumps([{{"SourceFile": path, "Mode": "oneshot"}}]))
+            sys.exit(0)
+        print("Error: File not found - " + path, file=sys.stderr)
+        sys.exit(1)
+    args = []
+    for line in sys.stdin:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line == "-execute":
+            echo = args[args.index("-echo4") + 1] if "-echo4" in args else ""
+            for path in [a for a in args if not a.startswith("-") and a != echo]:
+                if os.path.exists(path):
+                    print(json.dumps([{{"SourceFile": path, "Mode": "session"}}]))
+                else:
+                    print("Error: File not found - " + path, file=sys.stderr)
+            print(echo, file=sys.stderr, flush=True)
+            print("{{ready}}", flush=True)
+            args = []
+        elif args[-1:] == ["-stay_open"]:
+            break
+        else:
+            args.append(line)
+    """
+)
+
+
+def _install_fake(tmp_path, monkeypatch):
+    script = tmp_path / "exiftool"
+    script.write_text(FAKE_EXIFTOOL.format(python=sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setenv("CTF_HELPER_EXIFTOOL", str(script))
+
+
+def _source(tool, path):
+    body = json.loads(tool.run(str(path)).body)
+    return body["sources"][0]
+
+
+def test_argfile_safe():
+    assert _argfile_safe("/tmp/image.jpg")
+    assert _argfile_safe("/tmp/with space/image.jpg")
+    assert not _argfile_safe("/tmp/line\nbreak.jpg")
+    assert not _argfile_safe("/tmp/carriage\r.jpg")
+    assert not _argfile_safe("/tmp/trailing.jpg ")
+    assert not _argfile_safe(" /tmp/leading.jpg")
+    assert not _argfile_safe("#comment.jpg")
+    assert not _argfile_safe("-option.jpg")
+    assert not _argfile_safe("/tmp/\udcff.jpg")
+    assert not _argfile_safe("")
+
+
+def test_plain_path_uses_session(tmp_path, monkeypatch):
+    _install_fake(tmp_path, monkeypatch)
+    image = tmp_path / "image.jpg"
+    image.write_bytes(b"\xff\xd8")
+    try:
+        source = _source(ExifMetadataTool(), image)
+    finally:
+        exif_metadata.shutdown_exiftool_sessions()
+    assert source["source"] == "exiftool"
+    assert source["data"]["Mode"] == "session"
+
+
+def test_unsafe_paths_use_one_shot(tmp_path, monkeypatch):
+    _install_fake(tmp_path, monkeypatch)
+    try:
+        for name in ("trailing.jpg ", "line\nbreak.jpg"):
+            image = tmp_path / name
+            image.write_bytes(b"\xff\xd8")
+            source = _source(ExifMetadataTool(), image)
+            assert source["data"]["Mode"] == "oneshot", name
+            assert source["data"]["SourceFile"] == str(image)
+    finally:
+        exif_metadata.shutdown_exiftool_sessions()
+
+
+def test_relative_paths_are_made_absolute(tmp_path, monkeypatch):
+    _install_fake(tmp_path, monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    try:
+        for name in ("#hash.jpg", "-dash.jpg"):
+            (tmp_path / name).write_bytes(b"\xff\xd8")
+            source = _source(ExifMetadataTool(), name)
+            assert source["data"]["SourceFile"] == str(tmp_path / name), name
+    finally:
+        exif_metadata.shutdown_exiftool_sessions()
+
+
+def test_session_reports_stderr(tmp_path, monkeypatch):
+    _install_fake(tmp_path, monkeypatch)
+    missing = tmp_path / "gone.jpg"
+    try:
+        result = ExifMetadataTool()._extract_with_exiftool(missing)
+        # The session stays usable after an error.
+        image = tmp_path / "image.jpg"
+        image.write_bytes(b"\xff\xd8")
+        again = ExifMetadataTool()._extract_with_exiftool(image)
+    finally:
+        exif_metadata.shutdown_exiftool_sessions()
+    assert result == {"available": False, "message": f"Error: File not found - {missing}"}
+    assert again["available"]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the Extract Strings result cache
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.reverse import bin_analysis
+from ctf_helper.modules.reverse.bin_analysis import StringsExtractTool
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(bin_analysis, "_EXTRACT_CACHE", bin_analysis.OrderedDict())
+
+
+def _sample(tmp_path, name="sample.bin", words=("hello", "flag{x}", "abcdefgh")):
+    path = tmp_path / name
+    path.write_bytes(b"\0".join(word.encode() for word in words))
+    return path
+
+
+def _no_rescan(monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("file was scanned again")
+
+    monkeypatch.setattr(StringsExtractTool, "_extract_with_system", fail)
+    monkeypatch.setattr(StringsExtractTool, "_extract_from_file", fail)
+
+
+def test_repeat_and_longer_minimum_hit_the_cache(tmp_path, monkeypatch):
+    tool = StringsExtractTool()
+    path = _sample(tmp_path)
+    assert sorted(tool._extract_cached(path, 4, False)) == ["abcdefgh", "flag{x}", "hello"]
+    _no_rescan(monkeypatch)
+    assert sorted(tool._extract_cached(path, 4, False)) == ["abcdefgh", "flag{x}", "hello"]
+    assert sorted(tool._extract_cached(path, 6, False)) == ["abcdefgh", "flag{x}"]
+
+
+def test_changed_file_is_rescanned(tmp_path):
+    tool = StringsExtractTool()
+    path = _sample(tmp_path)
+    list(tool._extract_cached(path, 4, False))
+    path.write_bytes(b"different\0content")
+    os.utime(path, ns=(1, 1))
+    assert sorted(tool._extract_cached(path, 4, False)) == ["content", "different"]
+
+
+def test_cache_is_bounded_by_size(tmp_path, monkeypatch):
+    tool = StringsExtractTool()
+    first = _sample(tmp_path, "first.bin")
+    second = _sample(tmp_path, "second.bin")
+    list(tool._extract_cached(first, 4, False))
+    (one_entry,) = [entry[2] for entry in bin_analysis._EXTRACT_CACHE.values()]
+    monkeypatch.setattr(bin_analysis, "_EXTRACT_CACHE_MAX_BYTES", one_entry)
+    list(tool._extract_cached(second, 4, False))
+    assert [key[0] for key in bin_analysis._EXTRACT_CACHE] == [str(second.resolve())]
+
+
+def test_oversized_result_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(bin_analysis, "_EXTRACT_CACHE_MAX_BYTES", 10)
+    list(StringsExtractTool()._extract_cached(_sample(tmp_path), 4, False))
+    assert not bin_analysis._EXTRACT_CACHE
+
+
+def test_extraction_is_streamed_from_the_source(tmp_path, monkeypatch):
+    produced = []
+
+    def source(self, path, min_len, include_unicode):
+        for word in ("alpha", "bravo"):
+            produced.append(word)
+            yield word
+
+    monkeypatch.setattr(StringsExtractTool, "_extract_with_system", source)
+    found = StringsExtractTool()._extract_cached(_sample(tmp_path), 4, False)
+    assert next(iter(found)) == "alpha"
+    assert produced == ["alpha"]
+    assert not bin_analysis._EXTRACT_CACHE
+
+
+def test_oversized_result_is_still_returned_in_full(tmp_path, monkeypatch):
+    monkeypatch.setattr(bin_analysis, "_EXTRACT_CACHE_MAX_BYTES", 10)
+    found = StringsExtractTool()._extract_cached(_sample(tmp_path), 4, False)
+    assert sorted(found) == ["abcdefgh", "flag{x}", "hello"]
+
+
+def test_run_stream_yields_before_extraction_ends(tmp_path, monkeypatch):
+    produced = []
+
+    def source(self, path, min_len, include_unicode):
+        for word in ("zulu", "alpha", "zulu"):
+            produced.append(word)
+            yield word
+
+    monkeypatch.setattr(StringsExtractTool, "_extract_with_system", source)
+    stream = StringsExtractTool().run_stream(str(_sample(tmp_path)), chunk_size=1)
+    assert next(stream) == "zulu"
+    assert produced == ["zulu"]
+    assert list(stream) == ["\nalpha"]
+    assert len(bin_analysis._EXTRACT_CACHE) == 1
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for search-as-you-type match finding
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.ui.text_search import match_offsets
+
+
+def test_full_scan_finds_overlapping_matches():
+    assert match_offsets("aaab", "aa") == [0, 1]
+    assert match_offsets("abcabc", "abc") == [0, 3]
+    assert match_offsets("abc", "x") == []
+    assert match_offsets("abc", "") == []
+
+
+def test_refine_keeps_matches_inside_an_overlap():
+    first = match_offsets("aaab", "aa")
+    assert match_offsets("aaab", "aab", "aa", first) == [1]
+
+
+def test_refine_matches_a_fresh_scan():
+    haystack = "mov eax, ebx\nmov eax, [ebp-8]\nmovzx eax, al\n" * 3
+    previous = ""
+    offsets = []
+    for end in range(1, len("mov eax, [ebp")):
+        needle = "mov eax, [ebp"[:end]
+        offsets = match_offsets(haystack, needle, previous, offsets)
+        assert offsets == match_offsets(haystack, needle)
+        previous = needle
+
+
+def test_shorter_query_rescans():
+    offsets = match_offsets("abab", "ab")
+    assert match_offsets("abab", "b", "ab", offsets) == [1, 3]
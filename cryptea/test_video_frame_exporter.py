@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the video frame export summary
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from ctf_helper.modules.media.video_frame_exporter import VideoFrameExporterTool
+
+
+def _plan(tmp_path, monkeypatch):
+    monkeypatch.setenv("CTF_HELPER_FFMPEG", "ffmpeg")
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\0" * 16)
+    plan = VideoFrameExporterTool().plan_export(str(video), str(tmp_path / "frames"), analyze_frames="true")
+    (plan.destination / "frame_000001.png").write_bytes(b"png")
+    return plan
+
+
+def test_timed_out_export_keeps_partial_frames(tmp_path, monkeypatch):
+    plan = _plan(tmp_path, monkeypatch)
+    summary = json.loads(VideoFrameExporterTool().finish_export(plan, None, "", "", timed_out=True).body)
+    assert summary["ffmpeg"]["timed_out"] is True
+    assert summary["frames_found"] == 1
+    assert summary["frames"][0]["file"] == "frame_000001.png"
+
+
+def test_finished_export_reports_exit_code(tmp_path, monkeypatch):
+    plan = _plan(tmp_path, monkeypatch)
+    summary = json.loads(VideoFrameExporterTool().finish_export(plan, 0, "", " warn \n").body)
+    assert summary["ffmpeg"] == {"available": True, "exit_code": 0, "stdout": "", "stderr": "warn"}
+    assert summary["frames_found"] == 1